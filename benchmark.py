@@ -21,8 +21,14 @@
 #  DEALINGS IN THE SOFTWARE.                                                   =
 # ==============================================================================
 import base64
+import hashlib
 import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from timeit import timeit
+from typing import Annotated
+from urllib.parse import quote, unquote
 
 from cloudevents.conversion import to_json
 from cloudevents.http import (
@@ -37,11 +43,32 @@ from cloudevents.pydantic import (
 from cloudevents.pydantic import (
     from_json as from_json_pydantic,
 )
-from pydantic import Field
+from pydantic import (
+    Field,
+    PlainValidator,
+    TypeAdapter,
+    field_validator,
+    model_serializer,
+)
 
+from cloudevents_pydantic.bindings._header_codec import (
+    HTTP_SAFE_CHARS,
+    decode_header_value,
+    encode_header_value,
+)
 from cloudevents_pydantic.bindings.http import HTTPHandler
 from cloudevents_pydantic.events import CloudEvent
-from cloudevents_pydantic.events.fields.types import Binary
+from cloudevents_pydantic.events.fields.types import Binary, String
+from cloudevents_pydantic.events.fields.types._canonic_types import (
+    class_control,
+    class_nonchar_utf16_range,
+)
+from cloudevents_pydantic.formats._adapters import batch_adapter
+from cloudevents_pydantic.formats.json import (
+    deserialize_batch,
+    deserialize_batch_parallel,
+    serialize_batch_bytes,
+)
 
 valid_json = '{"data_base64":"dGVzdA==","source":"https://example.com/event-producer","id":"b96267e2-87be-4f7a-b87c-82f64360d954","type":"com.example.string","specversion":"1.0","time":"2022-07-16T12:03:20.519216+04:00","subject":null,"datacontenttype":null,"dataschema":null}'
 test_iterations = 1000000
@@ -51,6 +78,32 @@ class BinaryEvent(CloudEvent):
     data: Binary = Field(Binary, alias="data_base64")
 
 
+class TypedDataEvent(CloudEvent):
+    data: dict
+
+
+class ExpensiveValidationEvent(CloudEvent):
+    data: dict
+
+    @field_validator("data")
+    @classmethod
+    def verify_checksum(cls, value: dict) -> dict:
+        hashlib.pbkdf2_hmac("sha256", repr(value).encode(), b"salt", 50)
+        return value
+
+
+class LegacySerializerEvent(CloudEvent):
+    """The JSON serializer used up to 0.1.x, round-tripping through `model_dump`"""
+
+    @model_serializer(when_used="json")
+    def base64_json_serializer(self):
+        model_dict = self.model_dump()
+        if isinstance(model_dict["data"], (bytes, bytearray, memoryview)):
+            model_dict["data_base64"] = base64.b64encode(model_dict["data"])
+            del model_dict["data"]
+        return model_dict
+
+
 def json_deserialization():
     CloudEvent.model_validate_json(valid_json)
 
@@ -63,17 +116,22 @@ def json_deserialization_official_sdk_cloudevent():
     from_json_http(valid_json)
 
 
-print("==== 1M iterations benchmark ====")
-print("Timings for HTTP JSON deserialization:")
-print("This package: " + str(timeit(json_deserialization, number=test_iterations)))
-print(
-    "Official SDK using pydantic model: "
-    + str(timeit(json_deserialization_official_sdk_pydantic, number=test_iterations))
-)
-print(
-    "Official SDK using http model: "
-    + str(timeit(json_deserialization_official_sdk_cloudevent, number=test_iterations))
-)
+def benchmark_json_deserialization():
+    print("Timings for HTTP JSON deserialization:")
+    print("This package: " + str(timeit(json_deserialization, number=test_iterations)))
+    print(
+        "Official SDK using pydantic model: "
+        + str(
+            timeit(json_deserialization_official_sdk_pydantic, number=test_iterations)
+        )
+    )
+    print(
+        "Official SDK using http model: "
+        + str(
+            timeit(json_deserialization_official_sdk_cloudevent, number=test_iterations)
+        )
+    )
+
 
 attributes = json.loads(valid_json)
 data = base64.b64decode(attributes["data_base64"])
@@ -98,14 +156,179 @@ def json_serialization_official_sdk_cloudevent():
     to_json(official_http_event)
 
 
-print("")
-print("Timings for HTTP JSON serialization:")
-print("This package: " + str(timeit(json_serialization, number=test_iterations)))
-print(
-    "Official SDK using pydantic model: "
-    + str(timeit(json_serialization_official_sdk_pydantic, number=test_iterations))
-)
-print(
-    "Official SDK using http model: "
-    + str(timeit(json_serialization_official_sdk_cloudevent, number=test_iterations))
+def benchmark_json_serialization():
+    print("")
+    print("Timings for HTTP JSON serialization:")
+    print("This package: " + str(timeit(json_serialization, number=test_iterations)))
+    print(
+        "Official SDK using pydantic model: "
+        + str(timeit(json_serialization_official_sdk_pydantic, number=test_iterations))
+    )
+    print(
+        "Official SDK using http model: "
+        + str(
+            timeit(json_serialization_official_sdk_cloudevent, number=test_iterations)
+        )
+    )
+
+
+header_values = [
+    "com.example.string",
+    "https://example.com/event-producer",
+    "b96267e2-87be-4f7a-b87c-82f64360d954",
+    "2022-07-16T12:03:20.519216+04:00",
+    "Euro € 😀",
+]
+
+
+def header_codec_urllib():
+    for value in header_values:
+        unquote(quote(value, safe=HTTP_SAFE_CHARS), errors="strict")
+
+
+def header_codec():
+    for value in header_values:
+        decode_header_value(encode_header_value(value))
+
+
+def benchmark_header_codec():
+    print("")
+    print("Timings for HTTP binary mode header encoding and decoding:")
+    print("Precompiled codec: " + str(timeit(header_codec, number=test_iterations)))
+    print(
+        "urllib quote/unquote: "
+        + str(timeit(header_codec_urllib, number=test_iterations))
+    )
+
+
+payloads = {
+    "string": "some text data",
+    "JSON object": {"id": 123, "name": "some name", "tags": ["a", "b"]},
+    "binary": b"\x00\x01\x02\x03" * 16,
+}
+
+
+def benchmark_payload_serialization():
+    print("")
+    print("Timings for JSON serialization by payload type:")
+    for payload_name, payload in payloads.items():
+        payload_event = CloudEvent(**attributes, data=payload)
+        legacy_event = LegacySerializerEvent(**attributes, data=payload)
+        print(
+            f"{payload_name} - data_base64 serializer: "
+            + str(timeit(payload_event.model_dump_json, number=test_iterations))
+        )
+        print(
+            f"{payload_name} - model_dump round-trip: "
+            + str(timeit(legacy_event.model_dump_json, number=test_iterations))
+        )
+    typed_event = TypedDataEvent(**attributes, data=payloads["JSON object"])
+    print(
+        "JSON object - typed data, no Python callbacks: "
+        + str(timeit(typed_event.model_dump_json, number=test_iterations))
+    )
+
+
+ascii_controls = bytes(range(0x20)) + b"\x7f"
+forbidden_chars = re.compile("[" + class_control + class_nonchar_utf16_range + "]")
+
+
+def python_string_validator(value: str) -> str:
+    """A Python validator with an ASCII-only fast path"""
+    if not isinstance(value, str) or not value:
+        raise ValueError("Invalid string")
+    if value.isascii():
+        if len(value.encode().translate(None, ascii_controls)) != len(value):
+            raise ValueError("Invalid string")
+    elif forbidden_chars.search(value):
+        raise ValueError("Invalid string")
+    return value
+
+
+string_adapter = TypeAdapter(String)
+python_string_adapter = TypeAdapter(
+    Annotated[str, PlainValidator(python_string_validator)]
 )
+string_values = {
+    "short ASCII": "com.example.string",
+    "long ASCII": "com.example.string." * 50,
+    "mixed Unicode": "Euro € 😀 ordine " * 10,
+}
+
+
+def benchmark_string_validation():
+    print("")
+    print("Timings for String validation by value:")
+    for value_name, value in string_values.items():
+        print(
+            f"{value_name} - compiled pattern: "
+            + str(
+                timeit(
+                    lambda: string_adapter.validate_python(value),
+                    number=test_iterations,
+                )
+            )
+        )
+        print(
+            f"{value_name} - Python validator: "
+            + str(
+                timeit(
+                    lambda: python_string_adapter.validate_python(value),
+                    number=test_iterations,
+                )
+            )
+        )
+
+
+batch_iterations = 3
+
+
+def benchmark_batch_deserialization():
+    batch_body = serialize_batch_bytes(
+        [
+            CloudEvent.event_factory(
+                type="com.example.string",
+                source="https://example.com/event-producer",
+                data={"id": index, "name": "some name"},
+            )
+            for index in range(100000)
+        ]
+    )
+
+    print("")
+    print(f"Timings for 100k events batch deserialization ({os.cpu_count()} CPUs):")
+    with ProcessPoolExecutor() as process_pool:
+        for event_class in (CloudEvent, ExpensiveValidationEvent):
+            adapter = batch_adapter(event_class)
+            print(
+                f"{event_class.__name__} - serial: "
+                + str(
+                    timeit(
+                        lambda: deserialize_batch(batch_body, adapter),
+                        number=batch_iterations,
+                    )
+                )
+            )
+            print(
+                f"{event_class.__name__} - process pool: "
+                + str(
+                    timeit(
+                        lambda: deserialize_batch_parallel(
+                            batch_body, event_class, process_pool
+                        ),
+                        number=batch_iterations,
+                    )
+                )
+            )
+
+
+# The process pool workers import this module (i.e. when spawned, on macOS
+# and Windows): the benchmarks must only run in the main process
+if __name__ == "__main__":
+    print("==== 1M iterations benchmark ====")
+    benchmark_json_deserialization()
+    benchmark_json_serialization()
+    benchmark_header_codec()
+    benchmark_payload_serialization()
+    benchmark_string_validation()
+    benchmark_batch_deserialization()
@@ -0,0 +1,203 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import json
+from functools import lru_cache, partial
+from typing import Annotated, Any, Dict, Optional, Type, Union, get_args, get_origin
+
+from pydantic import TypeAdapter, ValidationError, create_model
+from pydantic_core import to_json
+
+from cloudevents_pydantic.events import CloudEvent
+from cloudevents_pydantic.events._lazy_data import (
+    DeferredValidation,
+    LazyData,
+    install_descriptor,
+    relocated_error,
+)
+from cloudevents_pydantic.events._plan import is_untyped
+
+# Maps the models validating the attributes to the actual event classes
+_validated_classes: Dict[Type[CloudEvent], Type[CloudEvent]] = {}
+
+
+def decode_body(body: Any, content_type: Optional[str]) -> Any:
+    """
+    Decodes an HTTP body according to its content-type: JSON media types are
+    parsed, text (or any media type with a charset) is decoded to `str`, other
+    bodies are returned as they are.
+
+    :param body: The body
+    :type body: Any
+    :param content_type: The content-type header value
+    :type content_type: Optional[str]
+    :return: The decoded body
+    :rtype: Any
+    """
+    if not isinstance(body, (bytes, bytearray, memoryview)) or not content_type:
+        return body
+    media_type, _, parameters = content_type.partition(";")
+    media_type = media_type.strip().lower()
+    if media_type == "application/json" or media_type.endswith("+json"):
+        return json.loads(body.tobytes() if isinstance(body, memoryview) else body)
+    charset = _charset(parameters)
+    if charset is None and media_type.startswith("text/"):
+        charset = "utf-8"
+    if charset is not None:
+        return str(body, charset)
+    return body
+
+
+def encode_body(body: Any, content_type: Optional[str]) -> Optional[bytes]:
+    """
+    Encodes the `data` of an event as an HTTP body according to its
+    content-type: `str` values are encoded with the charset of the
+    content-type (UTF-8 by default), values of JSON media types are
+    serialized to JSON, bytes are returned as they are.
+
+    :param body: The data
+    :type body: Any
+    :param content_type: The content-type header value
+    :type content_type: Optional[str]
+    :return: The encoded body
+    :rtype: Optional[bytes]
+    :raises ValueError: If the data can't be represented in the content-type
+    """
+    if body is None or isinstance(body, (bytes, bytearray, memoryview)):
+        return body  # type: ignore[return-value]
+    media_type, _, parameters = (content_type or "").partition(";")
+    if isinstance(body, str):
+        return body.encode(_charset(parameters) or "utf-8")
+    media_type = media_type.strip().lower()
+    if media_type == "application/json" or media_type.endswith("+json"):
+        return to_json(body)
+    raise ValueError(
+        f"Can't encode {type(body).__name__} data with content-type {content_type}"
+    )
+
+
+def _charset(parameters: str) -> Optional[str]:
+    for parameter in parameters.split(";"):
+        name, _, value = parameter.partition("=")
+        if name.strip().lower() == "charset":
+            return value.strip().strip('"')
+    return None
+
+
+@lru_cache(maxsize=None)
+def lazy_data_adapter(event_class: Any) -> TypeAdapter[CloudEvent]:
+    """
+    Builds an adapter validating all the attributes of the event class
+    (or of an annotated union of event classes) except `data`.
+
+    :param event_class: The event class
+    :type event_class: Any
+    :return: The adapter, to be used with `lazy_data_event`
+    :rtype: TypeAdapter[CloudEvent]
+    """
+    return TypeAdapter(_attributes_type(event_class))
+
+
+def lazy_data_event(attributes: CloudEvent, body: Any) -> CloudEvent:
+    """
+    Builds the event from the attributes validated by a `lazy_data_adapter`,
+    deferring the decoding and the validation of the body to the first access
+    to the `data` attribute.
+
+    :param attributes: The validated attributes
+    :type attributes: CloudEvent
+    :param body: The raw body, it is not copied
+    :type body: Any
+    :return: The event
+    :rtype: CloudEvent
+    """
+    event_class = _validated_classes[type(attributes)]
+    install_descriptor(event_class)
+    event = event_class.model_construct(
+        attributes.model_fields_set,
+        **attributes.__dict__,
+        **(attributes.__pydantic_extra__ or {}),
+    )
+    load = partial(
+        _load,
+        body,
+        attributes.datacontenttype,
+        _data_adapter(event_class),
+        event_class.__name__,
+    )
+    event.__dict__["data"] = LazyData(load)
+    return event
+
+
+def _load(
+    body: Any,
+    content_type: Optional[str],
+    adapter: Optional[TypeAdapter[Any]],
+    title: str,
+) -> Any:
+    data = decode_body(body, content_type)
+    if adapter is None:
+        return data
+    try:
+        return adapter.validate_python(data)
+    except ValidationError as e:
+        # Raised as the event validation would
+        raise ValidationError.from_exception_data(
+            title,
+            [relocated_error(error, ("data", *error["loc"])) for error in e.errors()],
+        ) from None
+
+
+@lru_cache(maxsize=None)
+def _data_adapter(event_class: Type[CloudEvent]) -> Optional[TypeAdapter[Any]]:
+    field = event_class.model_fields["data"]
+    annotation: Any = field.annotation
+    # The body is already loaded lazily, its validation can't be deferred again
+    metadata = [m for m in field.metadata if not isinstance(m, DeferredValidation)]
+    if not metadata:
+        return None if is_untyped(annotation) else TypeAdapter(annotation)
+    args = (annotation, *metadata)
+    return TypeAdapter(Annotated[args])  # type: ignore[valid-type,arg-type]
+
+
+def _attributes_type(event_class: Any) -> Any:
+    if isinstance(event_class, type) and issubclass(event_class, CloudEvent):
+        return _attributes_model(event_class)
+    origin = get_origin(event_class)
+    if origin is Annotated:
+        args = (_attributes_type(event_class.__origin__), *event_class.__metadata__)
+        return Annotated[args]  # type: ignore[valid-type]
+    if origin is Union:
+        return Union[tuple(_attributes_type(arg) for arg in get_args(event_class))]
+    return event_class
+
+
+@lru_cache(maxsize=None)
+def _attributes_model(event_class: Type[CloudEvent]) -> Type[CloudEvent]:
+    model = create_model(  # type: ignore[call-overload]
+        event_class.__name__,
+        __base__=event_class,
+        __module__=event_class.__module__,
+        data=(Any, None),
+    )
+    _validated_classes[model] = event_class
+    return model
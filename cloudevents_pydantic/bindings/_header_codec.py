@@ -0,0 +1,113 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import re
+from typing import Any, Tuple
+from urllib.parse import unquote
+
+HTTP_SAFE_CHARS = "".join(
+    [
+        x
+        for x in list(map(chr, range(ord("!"), ord("~") + 1)))
+        if x not in [" ", '"', "%"]
+    ]
+)
+"""
+Characters NOT to be percent encoded in http headers.
+https://github.com/cloudevents/spec/blob/v1.0.2/cloudevents/bindings/http-protocol-binding.md#3132-http-header-values
+"""
+
+_ENCODING_TABLE: Tuple[str, ...] = tuple(
+    chr(byte) if chr(byte) in HTTP_SAFE_CHARS else f"%{byte:02X}" for byte in range(256)
+)
+"""
+Precomputed header representation of every byte of the UTF-8 encoded value.
+"""
+
+_unsafe_runs = re.compile(r"[^!#$&-~]+")
+"""
+Sequences of characters not in `HTTP_SAFE_CHARS`.
+"""
+
+
+def _encode_run(match: "re.Match[str]") -> str:
+    return "".join(map(_ENCODING_TABLE.__getitem__, match[0].encode()))
+
+
+def encode_header_value(value: str) -> str:
+    """
+    Percent-encodes a value to be used in a HTTP header.
+
+    Only the sequences of unsafe characters are encoded, values made only of
+    safe characters are returned unchanged without allocating a new string
+    (`str` subclasses, i.e. enum members, are returned as plain `str`).
+
+    :param value: The value to encode
+    :type value: str
+    :return: The percent-encoded value
+    :rtype: str
+    """
+    # Printable ASCII is the 0x20-0x7E range, the safe characters
+    # are the same range except for space, double quote and percent.
+    if (
+        value.isascii()
+        and value.isprintable()
+        and " " not in value
+        and '"' not in value
+        and "%" not in value
+    ):
+        # Returns the same object for `str` values, enum members would be
+        # formatted by `str()` as their name
+        return str.__str__(value)
+    return _unsafe_runs.sub(_encode_run, value)
+
+
+def canonical_string(value: Any) -> str:
+    """
+    Formats an attribute value, as serialized by the event, with its canonical
+    string representation (i.e. `Integer` extensions are serialized as `int`).
+
+    :param value: The serialized attribute value
+    :type value: Any
+    :return: The canonical string representation
+    :rtype: str
+    """
+    if isinstance(value, str):
+        return str.__str__(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def decode_header_value(value: str) -> str:
+    """
+    Decodes a percent-encoded HTTP header value.
+
+    :param value: The value to decode
+    :type value: str
+    :return: The decoded value
+    :rtype: str
+    :raises UnicodeDecodeError: If the decoded bytes are not valid UTF-8
+    """
+    if "%" not in value:
+        return value
+    return unquote(value, errors="strict")
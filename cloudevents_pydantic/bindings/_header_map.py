@@ -0,0 +1,172 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+)
+
+from cloudevents_pydantic.events import CloudEvent
+
+from ._header_codec import decode_header_value
+
+HTTPHeaders = Union[
+    Mapping[str, str],
+    Iterable[Tuple[str, str]],
+    Iterable[Tuple[bytes, bytes]],
+]
+"""
+Any of the usual request headers representations:
+
+- Mappings, including case-insensitive multi-dicts (i.e. starlette, multidict,
+  werkzeug headers)
+- Raw lists of `(name, value)` pairs, as `str` or as `bytes` (i.e. ASGI scope)
+"""
+
+_IGNORED = ""
+
+
+class HeaderMap:
+    """
+    Maps HTTP binary mode headers to CloudEvent attributes.
+
+    Header names for the known attributes are computed once, so extracting the
+    attributes from the headers is a single dictionary lookup per header.
+    Unknown `ce-` headers (i.e. extensions on models allowing extra attributes)
+    are still mapped using the header name.
+    """
+
+    def __init__(self, attributes: Iterable[str]) -> None:
+        self._names: Dict[str, str] = {f"ce-{name}": name for name in attributes}
+        # These are carried by the content-type header and the body
+        self._names["ce-data"] = _IGNORED
+        self._names["ce-datacontenttype"] = _IGNORED
+        self._names["content-type"] = "datacontenttype"
+        self._raw_names: Dict[bytes, str] = {
+            k.encode("latin-1"): v for k, v in self._names.items()
+        }
+
+    def attributes(self, headers: HTTPHeaders) -> Dict[str, Any]:
+        """
+        Extracts the CloudEvent attributes from the request headers,
+        iterating them once and without copying them.
+
+        :param headers: The request headers
+        :type headers: HTTPHeaders
+        :return: The decoded attributes, including `datacontenttype`
+        :rtype: Dict[str, Any]
+        """
+        items: Iterator[Tuple[Any, Any]] = iter(
+            headers.items()  # type: ignore[union-attr]
+            if hasattr(headers, "items")
+            else headers
+        )
+        attributes: Dict[str, Any] = {}
+        for name, value in items:
+            if isinstance(name, bytes):
+                attribute = self._raw_attribute(name)
+                value = value.decode("latin-1")
+            else:
+                attribute = self._attribute(name)
+            if attribute:
+                attributes[attribute] = decode_header_value(value)
+        return attributes
+
+    def _attribute(self, name: str) -> Optional[str]:
+        attribute = self._names.get(name)
+        if attribute is None:
+            name = name.lower()
+            attribute = self._names.get(name)
+            if attribute is None and name.startswith("ce-"):
+                attribute = name[3:]
+        return attribute
+
+    def _raw_attribute(self, name: bytes) -> Optional[str]:
+        attribute = self._raw_names.get(name)
+        if attribute is None:
+            attribute = self._attribute(name.decode("latin-1"))
+        return attribute
+
+
+def get_content_type(headers: HTTPHeaders) -> Optional[str]:
+    """
+    Looks up the content-type header, matching its name case-insensitively.
+
+    :param headers: The request headers
+    :type headers: HTTPHeaders
+    :return: The content-type header value, if present
+    :rtype: Optional[str]
+    """
+    if hasattr(headers, "get"):
+        # Case-insensitive mappings and lowercase dictionaries
+        content_type = headers.get("content-type")
+        if content_type is not None:
+            return content_type
+    items: Iterator[Tuple[Any, Any]] = iter(
+        headers.items()  # type: ignore[union-attr]
+        if hasattr(headers, "items")
+        else headers
+    )
+    for name, value in items:
+        if isinstance(name, bytes):
+            if name.lower() == b"content-type":
+                return value.decode("latin-1")
+        elif name.lower() == "content-type":
+            return value
+    return None
+
+
+def _event_classes(event_class: Any) -> Iterator[Type[CloudEvent]]:
+    if isinstance(event_class, type):
+        if issubclass(event_class, CloudEvent):
+            yield event_class
+        return
+    # Annotated types and (discriminated) unions of event classes
+    for arg in get_args(event_class):
+        yield from _event_classes(arg)
+
+
+@lru_cache(maxsize=None)
+def compile_header_map(event_class: Any) -> HeaderMap:
+    """
+    Builds the header map for an event class, or for all the classes
+    of an (annotated) union of events.
+
+    :param event_class: The event class
+    :type event_class: Any
+    :return: The header map
+    :rtype: HeaderMap
+    """
+    attributes: Set[str] = set(CloudEvent.__event_plan__.attributes)
+    for cls in _event_classes(event_class):
+        attributes.update(cls.__event_plan__.attributes)
+    return HeaderMap(attributes)
@@ -20,53 +20,133 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
 #  DEALINGS IN THE SOFTWARE.                                                   =
 # ==============================================================================
+import asyncio
+from concurrent.futures import Executor
+from enum import Enum
+from functools import lru_cache, partial
 from typing import (
     Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
+    MutableMapping,
     NamedTuple,
     Optional,
     Type,
     TypeVar,
+    Union,
     cast,
 )
-from urllib.parse import quote, unquote
 
 from pydantic import TypeAdapter
 
-from cloudevents_pydantic.events import CloudEvent
+from cloudevents_pydantic.events import CloudEvent, FrozenCloudEvent
 from cloudevents_pydantic.formats import canonical, json
+from cloudevents_pydantic.formats._adapters import batch_adapter, event_adapter
+from cloudevents_pydantic.formats.policy import ValidationPolicy
+
+from ._body import lazy_data_adapter, lazy_data_event
+from ._header_codec import (
+    canonical_string,
+    decode_header_value,
+    encode_header_value,
+)
+from ._header_map import HTTPHeaders, compile_header_map, get_content_type
 
 _T = TypeVar("_T", bound=CloudEvent)
+_R = TypeVar("_R")
+
+ASGIReceive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+AsyncHTTPBody = Union[json.JSONData, AsyncIterable[bytes], ASGIReceive]
+"""
+The request body as a whole, as an async iterable of chunks
+or as an ASGI `receive` callable.
+"""
+
+DEFAULT_OFFLOAD_THRESHOLD = 256 * 1024
+"""
+Bodies bigger than this size (in bytes) are deserialized in an executor
+by the `AsyncHTTPHandler`.
+"""
 
 
 class HTTPComponents(NamedTuple):
     headers: Dict[str, str]
-    body: Optional[str]
+    body: Optional[Union[str, bytes]]
 
 
-_HTTP_safe_chars = "".join(
-    [
-        x
-        for x in list(map(chr, range(ord("\u0021"), ord("\u007e") + 1)))
-        if x not in [" ", '"', "%"]
-    ]
-)
-"""
-Characters NOT to be percent encoded in http headers.
-https://github.com/cloudevents/spec/blob/v1.0.2/cloudevents/bindings/http-protocol-binding.md#3132-http-header-values
-"""
+class HTTPStreamComponents(NamedTuple):
+    headers: Dict[str, str]
+    body: Iterator[bytes]
+
+
+class ContentMode(str, Enum):
+    """
+    The HTTP content modes.
+    https://github.com/cloudevents/spec/blob/v1.0.2/cloudevents/bindings/http-protocol-binding.md#13-content-modes
+    """
+
+    BINARY = "binary"
+    STRUCTURED = "structured"
+    BATCH = "batch"
+
+
+@lru_cache(maxsize=256)
+def content_mode(content_type: Optional[str]) -> ContentMode:
+    """
+    Detects the content mode from the content-type header value. Results are
+    cached, because services usually receive only a few distinct values.
+
+    :param content_type: The content-type header value
+    :type content_type: Optional[str]
+    :return: The content mode
+    :rtype: ContentMode
+    :raises ValueError: If the content-type is a structured mode event format
+                        other than JSON
+    """
+    if content_type is None:
+        return ContentMode.BINARY
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type == "application/cloudevents+json":
+        return ContentMode.STRUCTURED
+    if media_type == "application/cloudevents-batch+json":
+        return ContentMode.BATCH
+    if media_type.startswith(("application/cloudevents+", "application/cloudevents-")):
+        raise ValueError(f"Unsupported event format: {media_type}")
+    return ContentMode.BINARY
 
 
 class HTTPHandler(Generic[_T]):
+    event_class: Type[_T]
     event_adapter: TypeAdapter[_T]
     batch_adapter: TypeAdapter[List[_T]]
+    validation_policy: Optional[ValidationPolicy]
 
-    def __init__(self, event_class: Type[_T] = cast(Type[_T], CloudEvent)) -> None:
+    def __init__(
+        self,
+        event_class: Type[_T] = cast(Type[_T], CloudEvent),
+        validation_policy: Optional[ValidationPolicy] = None,
+    ) -> None:
+        """
+        :param event_class: The event class to build
+        :type event_class: Type[CloudEvent]
+        :param validation_policy: The policy deciding which events received
+                                  in JSON format are validated, by default
+                                  all the events are validated
+        :type validation_policy: Optional[ValidationPolicy]
+        """
         super().__init__()
-        self.event_adapter = TypeAdapter(event_class)
-        self.batch_adapter = TypeAdapter(List[event_class])  # type: ignore[valid-type]
+        self.event_class = event_class
+        self.validation_policy = validation_policy
+        self.event_adapter = event_adapter(event_class)
+        self.batch_adapter = batch_adapter(event_class)
+        self._header_map = compile_header_map(event_class)
 
     def to_json(self, event: _T) -> HTTPComponents:
         """
@@ -81,6 +161,19 @@ class HTTPHandler(Generic[_T]):
         body = json.serialize(event)
         return HTTPComponents(headers, body)
 
+    def to_json_bytes(self, event: _T) -> HTTPComponents:
+        """
+        Serializes an event in JSON format, with the body as `bytes`.
+
+        :param event: The event object to serialize
+        :type event: CloudEvent
+        :return: The headers and the UTF-8 encoded body of the event
+        :rtype: HTTPComponents
+        """
+        headers = {"content-type": "application/cloudevents+json; charset=UTF-8"}
+        body = json.serialize_bytes(event)
+        return HTTPComponents(headers, body)
+
     def to_json_batch(self, events: List[_T]) -> HTTPComponents:
         """
         Serializes a list of events in JSON batch format.
@@ -94,34 +187,139 @@ class HTTPHandler(Generic[_T]):
         body = json.serialize_batch(events, self.batch_adapter)
         return HTTPComponents(headers, body)
 
+    def to_json_batch_bytes(self, events: List[_T]) -> HTTPComponents:
+        """
+        Serializes a list of events in JSON batch format, with the body as `bytes`.
+
+        :param events: The event object to serialize
+        :type events: List[CloudEvent]
+        :return: The headers and the UTF-8 encoded body of the event batch
+        :rtype: HTTPComponents
+        """
+        headers = {"content-type": "application/cloudevents-batch+json; charset=UTF-8"}
+        body = json.serialize_batch_bytes(events, self.batch_adapter)
+        return HTTPComponents(headers, body)
+
+    def to_json_batch_stream(self, events: Iterable[_T]) -> HTTPStreamComponents:
+        """
+        Lazily serializes a list of events in JSON batch format. The body is
+        an iterator of chunks, suitable for HTTP chunked transfer encoding.
+
+        :param events: The event objects to serialize, can be any iterable
+        :type events: Iterable[CloudEvent]
+        :return: The headers and the body chunks of the event batch
+        :rtype: HTTPStreamComponents
+        """
+        headers = {"content-type": "application/cloudevents-batch+json; charset=UTF-8"}
+        body = json.serialize_batch_stream(events, self.event_adapter)
+        return HTTPStreamComponents(headers, body)
+
     def from_json(
         self,
-        body: str,
+        body: json.JSONData,
     ) -> CloudEvent:
         """
         Deserializes an event from JSON format.
 
-        :param body: The JSON representation of the event
-        :type body: str
+        :param body: The JSON representation of the event, as `str` or bytes-like
+        :type body: JSONData
         :return: The deserialized event
         :rtype: CloudEvent
         """
+        if self.validation_policy is not None:
+            return json.deserialize_with_policy(
+                body, self.validation_policy, self.event_class
+            )
         return json.deserialize(body, self.event_adapter)
 
+    def from_json_view(self, body: json.JSONData) -> json.EventView:
+        """
+        Builds a read-only view over an event in JSON format, reading its
+        attributes on demand and validating it only when materialized.
+
+        :param body: The JSON representation of the event, as `str` or bytes-like
+        :type body: JSONData
+        :return: The view of the event
+        :rtype: EventView
+        """
+        return json.view(body, self.event_class)
+
     def from_json_batch(
         self,
-        body: str,
+        body: json.JSONData,
     ) -> List[_T]:
         """
         Deserializes a list of events from JSON batch format.
 
-        :param body: The JSON representation of the event batch
-        :type body: str
+        :param body: The JSON representation of the event batch, as `str`
+                     or bytes-like
+        :type body: JSONData
         :return: The deserialized event batch
         :rtype: List[CloudEvent]
         """
+        if self.validation_policy is not None:
+            return json.deserialize_batch_with_policy(
+                body, self.validation_policy, self.event_class
+            )
         return json.deserialize_batch(body, self.batch_adapter)
 
+    def from_json_batch_parallel(
+        self,
+        body: json.JSONData,
+        executor: Optional[Executor] = None,
+        chunk_size: int = json.DEFAULT_PARALLEL_CHUNK_SIZE,
+    ) -> List[_T]:
+        """
+        Deserializes a list of events from JSON batch format, validating
+        ranges of about `chunk_size` bytes in parallel.
+
+        :param body: The JSON representation of the event batch, as `str`
+                     or bytes-like
+        :type body: JSONData
+        :param executor: The executor to use, see
+                         `json.deserialize_batch_parallel`
+        :type executor: Optional[Executor]
+        :param chunk_size: The approximate size, in bytes, of the ranges
+                           validated by each task
+        :type chunk_size: int
+        :return: The deserialized event batch
+        :rtype: List[CloudEvent]
+        """
+        return json.deserialize_batch_parallel(
+            body, self.event_class, executor, chunk_size
+        )
+
+    def from_json_batch_stream(
+        self,
+        body: json.JSONStream,
+    ) -> Iterator[_T]:
+        """
+        Lazily deserializes a list of events from JSON batch format, validating
+        one event at a time.
+
+        :param body: The JSON representation of the event batch, as a whole,
+                     as an iterable of chunks or as a binary file-like object
+        :type body: JSONStream
+        :return: An iterator over the deserialized events
+        :rtype: Iterator[CloudEvent]
+        """
+        return json.deserialize_batch_stream(body, self.event_adapter)
+
+    def from_json_batch_async_stream(
+        self,
+        body: AsyncIterable[json.JSONData],
+    ) -> AsyncIterator[_T]:
+        """
+        Lazily deserializes a list of events from an asynchronous JSON batch
+        stream, validating one event at a time.
+
+        :param body: The JSON representation of the event batch as async chunks
+        :type body: AsyncIterable[JSONData]
+        :return: An async iterator over the deserialized events
+        :rtype: AsyncIterator[CloudEvent]
+        """
+        return json.deserialize_batch_async_stream(body, self.event_adapter)
+
     def to_binary(self, event: _T) -> HTTPComponents:
         """
         Serializes an event in HTTP binary format.
@@ -133,43 +331,291 @@ class HTTPHandler(Generic[_T]):
         """
         if event.datacontenttype is None:
             raise ValueError("Can't serialize event without datacontenttype")
+        if isinstance(event, FrozenCloudEvent):
+            # The header encoding depends on the handler class
+            headers, body = event.memoized(
+                (HTTPHandler.to_binary, type(self)), partial(self._binary, event)
+            )
+            return HTTPComponents(dict(headers), body)
+        return self._binary(event)
 
+    def _binary(self, event: CloudEvent) -> HTTPComponents:
         serialized = canonical.serialize(event)
+        header_names = type(event).__event_plan__.header_names
 
-        body = serialized.get("data")
+        body = serialized.pop("data", None)
+        content_type = serialized.pop("datacontenttype")
+        # Extensions (i.e. `Integer` ones) can be serialized as other types
         headers = {
-            f"ce-{k}": self._header_encode(v)
+            header_names.get(k) or f"ce-{k}": self._header_encode(
+                v if isinstance(v, str) else canonical_string(v)
+            )
             for k, v in serialized.items()
-            if k not in ["data", "datacontenttype"] and v is not None
+            if v is not None
         }
-        headers["content-type"] = self._header_encode(serialized["datacontenttype"])
+        headers["content-type"] = self._header_encode(content_type)
 
         return HTTPComponents(headers, body)
 
-    def from_binary(self, headers: Dict[str, str], body: Any) -> CloudEvent:
+    def from_binary(
+        self, headers: HTTPHeaders, body: Any, lazy_data: bool = False
+    ) -> CloudEvent:
         """
         Deserializes an event from HTTP binary format.
 
+        Header names are matched case-insensitively. The headers can be passed
+        as a mapping (including case-insensitive multi-dicts) or as a raw list
+        of `(name, value)` pairs (i.e. from the ASGI scope), without copying
+        them into a new dictionary.
+
+        With `lazy_data` only the attributes are validated: the body is kept
+        as it is (i.e. a `memoryview`, without copying it) and it is decoded,
+        according to the content-type, and validated on the first access to
+        the `data` attribute (or when the event is serialized).
+
+        The two modes don't produce the same `data`: without `lazy_data` the
+        body is validated as it is (i.e. `bytes` for untyped `data`, JSON
+        bodies are not parsed), with `lazy_data` JSON bodies are parsed and
+        text bodies are decoded to `str` before the validation.
+
         :param headers: The request headers
-        :type headers: Dict[str, str]
+        :type headers: HTTPHeaders
         :param body: The request body
         :type body: Any
+        :param lazy_data: Defer decoding and validating the body
+        :type lazy_data: bool
         :return:
         """
-        if not headers.get("content-type"):
+        canonical_data = self._header_map.attributes(headers)
+        if not canonical_data.get("datacontenttype"):
             raise ValueError("content-type not found in headers")
 
-        canonical_data = {
-            k[3:]: self._header_decode(v)
-            for k, v in headers.items()
-            if k.startswith("ce-")
-        }
-        canonical_data["datacontenttype"] = self._header_decode(headers["content-type"])
+        if lazy_data:
+            attributes = lazy_data_adapter(self.event_class).validate_python(
+                canonical_data
+            )
+            return lazy_data_event(attributes, body)
+
         canonical_data["data"] = body
         return canonical.deserialize(canonical_data, self.event_adapter)
 
+    def to_http(
+        self,
+        event: Union[_T, List[_T]],
+        mode: ContentMode = ContentMode.STRUCTURED,
+    ) -> HTTPComponents:
+        """
+        Serializes an event (or a list of events, in batch mode)
+        using the given content mode.
+
+        :param event: The event object, or the list of events, to serialize
+        :type event: Union[CloudEvent, List[CloudEvent]]
+        :param mode: The HTTP content mode
+        :type mode: ContentMode
+        :return: The headers and the body representation of the event
+        :rtype: HTTPComponents
+        """
+        if mode == ContentMode.BATCH:
+            return self.to_json_batch(event if isinstance(event, list) else [event])
+        if isinstance(event, list):
+            raise ValueError(f"Can't serialize a list of events in {mode.value} mode")
+        if mode == ContentMode.BINARY:
+            return self.to_binary(event)
+        return self.to_json(event)
+
+    def from_http(
+        self, headers: HTTPHeaders, body: Any, lazy_data: bool = False
+    ) -> Union[CloudEvent, List[_T]]:
+        """
+        Deserializes an event, or a batch of events, detecting the content mode
+        from the content-type header.
+
+        :param headers: The request headers
+        :type headers: HTTPHeaders
+        :param body: The request body
+        :type body: Any
+        :param lazy_data: Defer decoding and validating the body, in binary mode
+                          (see `from_binary`)
+        :type lazy_data: bool
+        :return: The deserialized event, or the list of events in batch mode
+        :rtype: Union[CloudEvent, List[CloudEvent]]
+        """
+        mode = content_mode(get_content_type(headers))
+        if mode == ContentMode.STRUCTURED:
+            return self.from_json(body)
+        if mode == ContentMode.BATCH:
+            return self.from_json_batch(body)
+        return self.from_binary(headers, body, lazy_data)
+
     def _header_encode(self, value: str) -> str:
-        return quote(value, safe=_HTTP_safe_chars)
+        return encode_header_value(value)
 
     def _header_decode(self, value: str) -> str:
-        return unquote(value, errors="strict")
+        return decode_header_value(value)
+
+
+class AsyncHTTPHandler(Generic[_T]):
+    """
+    Asynchronous counterpart of the `HTTPHandler` for deserialization.
+
+    The body is read from an ASGI `receive` callable or from an async iterable.
+    Small bodies are deserialized inline, bigger ones are deserialized in an
+    executor so the validation doesn't block the event loop.
+    """
+
+    handler: HTTPHandler[_T]
+
+    def __init__(
+        self,
+        event_class: Type[_T] = cast(Type[_T], CloudEvent),
+        offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+        executor: Optional[Executor] = None,
+        validation_policy: Optional[ValidationPolicy] = None,
+    ) -> None:
+        """
+        :param event_class: The event class to build
+        :type event_class: Type[CloudEvent]
+        :param offload_threshold: The body size (in bytes) from which the
+                                  deserialization runs in the executor
+        :type offload_threshold: int
+        :param executor: The executor to use, defaults to the event loop one
+        :type executor: Optional[Executor]
+        :param validation_policy: The policy deciding which events received
+                                  in JSON format are validated
+        :type validation_policy: Optional[ValidationPolicy]
+        """
+        super().__init__()
+        self.handler = HTTPHandler(event_class, validation_policy)
+        self.offload_threshold = offload_threshold
+        self.executor = executor
+
+    async def from_json(self, body: AsyncHTTPBody) -> CloudEvent:
+        """
+        Deserializes an event from JSON format.
+
+        :param body: The request body
+        :type body: AsyncHTTPBody
+        :return: The deserialized event
+        :rtype: CloudEvent
+        """
+        data = await read_body(body)
+        return await self._run(len(data), self.handler.from_json, data)
+
+    async def from_json_batch(self, body: AsyncHTTPBody) -> List[_T]:
+        """
+        Deserializes a list of events from JSON batch format.
+
+        :param body: The request body
+        :type body: AsyncHTTPBody
+        :return: The deserialized event batch
+        :rtype: List[CloudEvent]
+        """
+        data = await read_body(body)
+        return await self._run(len(data), self.handler.from_json_batch, data)
+
+    def from_json_batch_stream(self, body: AsyncHTTPBody) -> AsyncIterator[_T]:
+        """
+        Lazily deserializes a list of events from JSON batch format while the
+        body is being received, validating one event at a time inline.
+
+        :param body: The request body
+        :type body: AsyncHTTPBody
+        :return: An async iterator over the deserialized events
+        :rtype: AsyncIterator[CloudEvent]
+        """
+        return self.handler.from_json_batch_async_stream(iter_body(body))
+
+    async def from_binary(
+        self, headers: HTTPHeaders, body: AsyncHTTPBody, lazy_data: bool = False
+    ) -> CloudEvent:
+        """
+        Deserializes an event from HTTP binary format.
+
+        :param headers: The request headers
+        :type headers: HTTPHeaders
+        :param body: The request body
+        :type body: AsyncHTTPBody
+        :param lazy_data: Defer decoding and validating the body, the event is
+                          then never deserialized in the executor
+        :type lazy_data: bool
+        :return: The deserialized event
+        :rtype: CloudEvent
+        """
+        data = await read_body(body)
+        if lazy_data:
+            return self.handler.from_binary(headers, data, lazy_data)
+        return await self._run(len(data), self.handler.from_binary, headers, data)
+
+    async def from_http(
+        self, headers: HTTPHeaders, body: AsyncHTTPBody, lazy_data: bool = False
+    ) -> Union[CloudEvent, List[_T]]:
+        """
+        Deserializes an event, or a batch of events, detecting the content mode
+        from the content-type header.
+
+        :param headers: The request headers
+        :type headers: HTTPHeaders
+        :param body: The request body
+        :type body: AsyncHTTPBody
+        :param lazy_data: Defer decoding and validating the body, in binary mode
+                          (see `from_binary`)
+        :type lazy_data: bool
+        :return: The deserialized event, or the list of events in batch mode
+        :rtype: Union[CloudEvent, List[CloudEvent]]
+        """
+        data = await read_body(body)
+        if lazy_data and content_mode(get_content_type(headers)) == ContentMode.BINARY:
+            return self.handler.from_binary(headers, data, lazy_data)
+        return await self._run(len(data), self.handler.from_http, headers, data)
+
+    async def _run(self, size: int, func: Callable[..., _R], *args: Any) -> _R:
+        if size < self.offload_threshold:
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+
+async def iter_body(body: AsyncHTTPBody) -> AsyncIterator[json.JSONData]:
+    """
+    Iterates over the chunks of a request body.
+
+    :param body: The request body
+    :type body: AsyncHTTPBody
+    :return: The body chunks
+    :rtype: AsyncIterator[JSONData]
+    :raises ConnectionError: If the ASGI client disconnects before sending
+                             the whole body
+    """
+    if isinstance(body, (str, bytes, bytearray, memoryview)):
+        yield body
+    elif hasattr(body, "__aiter__"):
+        async for chunk in body:
+            yield chunk
+    else:
+        while True:
+            message = await body()  # type: ignore[operator]
+            if message["type"] == "http.disconnect":
+                raise ConnectionError("Client disconnected before sending the body")
+            if chunk := message.get("body", b""):
+                yield chunk
+            if not message.get("more_body", False):
+                return
+
+
+async def read_body(body: AsyncHTTPBody) -> json.JSONData:
+    """
+    Reads the whole request body.
+
+    :param body: The request body
+    :type body: AsyncHTTPBody
+    :return: The request body
+    :rtype: JSONData
+    :raises ConnectionError: If the ASGI client disconnects before sending
+                             the whole body
+    """
+    if isinstance(body, (str, bytes, bytearray, memoryview)):
+        return body
+    chunks = [chunk async for chunk in iter_body(body)]
+    if len(chunks) == 1:
+        return chunks[0]
+    return b"".join(chunks)  # type: ignore[arg-type]
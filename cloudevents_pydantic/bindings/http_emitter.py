@@ -0,0 +1,406 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import logging
+import threading
+from http.client import (
+    BadStatusLine,
+    HTTPConnection,
+    HTTPResponse,
+    HTTPSConnection,
+)
+from queue import Empty, Full, LifoQueue
+from ssl import SSLContext
+from time import monotonic
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+from urllib.parse import urlsplit, urlunsplit
+
+from cloudevents_pydantic.events import CloudEvent
+from cloudevents_pydantic.formats import json
+
+from ._body import encode_body
+from .http import ContentMode, HTTPHandler
+
+_T = TypeVar("_T", bound=CloudEvent)
+
+DEFAULT_MAX_BATCH_SIZE = 100
+"""
+Maximum number of events sent in a single batch request.
+"""
+
+DEFAULT_MAX_BATCH_BYTES = 1024 * 1024
+"""
+Maximum size (in bytes) of the body of a batch request.
+"""
+
+DEFAULT_LINGER = 0.05
+"""
+Maximum time (in seconds) an event waits for other events to be batched with.
+"""
+
+_BATCH_CONTENT_TYPE = "application/cloudevents-batch+json; charset=UTF-8"
+
+# Errors raised when reusing a connection the server already closed
+_STALE_CONNECTION_ERRORS = (BadStatusLine, BrokenPipeError, ConnectionResetError)
+
+logger = logging.getLogger(__name__)
+
+
+def log_error(error: Exception) -> None:
+    """
+    The default `on_error` callback of the `HTTPEmitter`, logs the error.
+
+    :param error: The error raised while sending a batch
+    :type error: Exception
+    """
+    logger.error("Failed to emit a batch of events", exc_info=error)
+
+
+class HTTPEmitter(Generic[_T]):
+    """
+    Sends events to HTTP targets, reusing keep-alive connections.
+
+    In batch mode the events are coalesced, for each target URL, into a batch
+    request sent when it reaches `max_batch_size` events or `max_batch_bytes`
+    bytes (by the thread emitting the event) or when the oldest event waited
+    for `linger` seconds (by a background thread, errors are passed to
+    `on_error`). In binary and structured mode each event is sent straight
+    away by the thread emitting it.
+
+    Remaining events are sent when the emitter is flushed or closed, also
+    when used as a context manager.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        handler: Optional[HTTPHandler[_T]] = None,
+        mode: ContentMode = ContentMode.BATCH,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        linger: Optional[float] = DEFAULT_LINGER,
+        headers: Optional[Mapping[str, str]] = None,
+        pool_size: int = 4,
+        timeout: Optional[float] = 10.0,
+        ssl_context: Optional[SSLContext] = None,
+        on_error: Callable[[Exception], None] = log_error,
+    ) -> None:
+        """
+        :param url: The default target URL
+        :type url: str
+        :param handler: The handler used to serialize the events
+        :type handler: Optional[HTTPHandler]
+        :param mode: The HTTP content mode
+        :type mode: ContentMode
+        :param max_batch_size: Maximum number of events in a batch request
+        :type max_batch_size: int
+        :param max_batch_bytes: Maximum body size of a batch request, a single
+                                bigger event is sent in its own batch
+        :type max_batch_bytes: int
+        :param linger: Maximum time an event waits to be batched, `None`
+                       sends batches only when full or flushed
+        :type linger: Optional[float]
+        :param headers: Additional headers sent with every request
+        :type headers: Optional[Mapping[str, str]]
+        :param pool_size: Maximum number of idle connections kept per host
+        :type pool_size: int
+        :param timeout: Connection and read timeout, in seconds
+        :type timeout: Optional[float]
+        :param ssl_context: The SSL context for HTTPS targets
+        :type ssl_context: Optional[SSLContext]
+        :param on_error: Called with the errors raised sending batches from
+                         the background thread
+        :type on_error: Callable[[Exception], None]
+        """
+        self.url = url
+        self.handler = handler or cast(HTTPHandler[_T], HTTPHandler())
+        self.mode = mode
+        self.max_batch_size = max_batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.linger = linger
+        self.headers = dict(headers or {})
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self.on_error = on_error
+        self._pools: Dict[Tuple[str, str, Optional[int]], _ConnectionPool] = {}
+        self._targets: Dict[str, Tuple[_ConnectionPool, str]] = {}
+        self._batches: Dict[str, _Batch] = {}
+        self._condition = threading.Condition()
+        self._linger_thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._target(url)
+
+    def __enter__(self) -> "HTTPEmitter[_T]":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def emit(self, event: _T, url: Optional[str] = None) -> None:
+        """
+        Sends an event, or adds it to the batch for its target URL.
+
+        :param event: The event to send
+        :type event: CloudEvent
+        :param url: The target URL, defaults to the emitter one
+        :type url: Optional[str]
+        :raises ValueError: If the emitter is closed
+        :raises ConnectionError: If the server doesn't accept the request
+        """
+        url = url or self.url
+        if self.mode != ContentMode.BATCH:
+            self._check_open()
+            headers, body = self.handler.to_http(event, self.mode)
+            # Binary mode bodies are the canonical `data`
+            self._send(url, headers, encode_body(body, headers.get("content-type")))
+            return
+
+        data = json.serialize_bytes(event)
+        full: List[_Batch] = []
+        with self._condition:
+            self._check_open()
+            batch = self._batches.get(url)
+            if batch is not None and batch.size + len(data) + 1 > self.max_batch_bytes:
+                full.append(self._batches.pop(url))
+                batch = None
+            if batch is None:
+                batch = self._new_batch(url)
+            batch.append(data)
+            if (
+                len(batch.events) >= self.max_batch_size
+                or batch.size >= self.max_batch_bytes
+            ):
+                full.append(self._batches.pop(url))
+        for batch in full:
+            self._send_batch(url, batch)
+
+    def flush(self) -> None:
+        """
+        Sends all the batched events.
+
+        :raises ConnectionError: If the server doesn't accept a request
+        """
+        with self._condition:
+            batches, self._batches = self._batches, {}
+        for url, batch in batches.items():
+            self._send_batch(url, batch)
+
+    def close(self) -> None:
+        """
+        Sends all the batched events, stops the background thread and closes
+        the idle connections. Closing an emitter twice has no effect.
+
+        :raises ConnectionError: If the server doesn't accept a request
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        if self._linger_thread is not None:
+            self._linger_thread.join()
+        try:
+            self.flush()
+        finally:
+            for pool in self._pools.values():
+                pool.close()
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("Can't emit events on a closed emitter")
+
+    def _new_batch(self, url: str) -> "_Batch":
+        if self.linger is None:
+            batch = self._batches[url] = _Batch(float("inf"))
+            return batch
+        batch = self._batches[url] = _Batch(monotonic() + self.linger)
+        if self._linger_thread is None:
+            self._linger_thread = threading.Thread(
+                target=self._linger_loop, name="HTTPEmitter", daemon=True
+            )
+            self._linger_thread.start()
+        self._condition.notify()
+        return batch
+
+    def _linger_loop(self) -> None:
+        while True:
+            with self._condition:
+                due = self._pop_due_batches()
+                while not due and not self._closed:
+                    self._condition.wait(self._next_timeout())
+                    due = self._pop_due_batches()
+                if not due:
+                    return
+            for url, batch in due:
+                try:
+                    self._send_batch(url, batch)
+                except Exception as e:
+                    self.on_error(e)
+
+    def _pop_due_batches(self) -> List[Tuple[str, "_Batch"]]:
+        now = monotonic()
+        due = [url for url, batch in self._batches.items() if batch.deadline <= now]
+        return [(url, self._batches.pop(url)) for url in due]
+
+    def _next_timeout(self) -> Optional[float]:
+        if not self._batches:
+            return None
+        deadline = min(batch.deadline for batch in self._batches.values())
+        return max(deadline - monotonic(), 0)
+
+    def _send_batch(self, url: str, batch: "_Batch") -> None:
+        headers = {"content-type": _BATCH_CONTENT_TYPE}
+        self._send(url, headers, b"[" + b",".join(batch.events) + b"]")
+
+    def _send(
+        self, url: str, headers: Mapping[str, str], body: Optional[bytes]
+    ) -> None:
+        pool, path = self._target(url)
+        status, reason = pool.request(path, body, {**self.headers, **headers})
+        if not 200 <= status < 300:
+            raise ConnectionError(f"{url} responded with {status} {reason}")
+
+    def _target(self, url: str) -> Tuple["_ConnectionPool", str]:
+        target = self._targets.get(url)
+        if target is not None:
+            return target
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported target URL: {url}")
+        key = (parts.scheme, parts.hostname, parts.port)
+        with self._condition:
+            pool = self._pools.get(key)
+            if pool is None:
+                connection_class = (
+                    HTTPSConnection if parts.scheme == "https" else HTTPConnection
+                )
+                pool = self._pools[key] = _ConnectionPool(
+                    connection_class,
+                    parts.hostname,
+                    parts.port,
+                    self.pool_size,
+                    self.timeout,
+                    self.ssl_context,
+                )
+        path = urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        target = self._targets[url] = (pool, path)
+        return target
+
+
+class _Batch:
+    __slots__ = ("deadline", "events", "size")
+
+    def __init__(self, deadline: float) -> None:
+        self.deadline = deadline
+        self.events: List[bytes] = []
+        # The body size: brackets plus the events and their separators
+        self.size = 1
+
+    def append(self, data: bytes) -> None:
+        self.events.append(data)
+        self.size += len(data) + 1
+
+
+class _ConnectionPool:
+    def __init__(
+        self,
+        connection_class: Type[HTTPConnection],
+        host: str,
+        port: Optional[int],
+        size: int,
+        timeout: Optional[float],
+        ssl_context: Optional[SSLContext],
+    ) -> None:
+        self.connection_class = connection_class
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self._idle: "LifoQueue[HTTPConnection]" = LifoQueue(size)
+
+    def request(
+        self, path: str, body: Optional[bytes], headers: Dict[str, str]
+    ) -> Tuple[int, str]:
+        try:
+            connection, reused = self._idle.get_nowait(), True
+        except Empty:
+            connection, reused = self._connect(), False
+        try:
+            try:
+                response = self._round_trip(connection, path, body, headers)
+            except _STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                connection.close()
+                connection = self._connect()
+                response = self._round_trip(connection, path, body, headers)
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            try:
+                self._idle.put_nowait(connection)
+            except Full:
+                connection.close()
+        return response.status, response.reason
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except Empty:
+                return
+
+    def _connect(self) -> HTTPConnection:
+        if self.connection_class is HTTPSConnection:
+            return HTTPSConnection(
+                self.host, self.port, timeout=self.timeout, context=self.ssl_context
+            )
+        return self.connection_class(self.host, self.port, timeout=self.timeout)
+
+    @staticmethod
+    def _round_trip(
+        connection: HTTPConnection,
+        path: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> HTTPResponse:
+        connection.request("POST", path, body, headers)
+        response = connection.getresponse()
+        # The body must be consumed before reusing the connection
+        response.read()
+        return response
@@ -0,0 +1,243 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import base64
+import datetime
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union, cast
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from cloudevents_pydantic.events import CloudEvent
+from cloudevents_pydantic.events._event import DEFAULT_SPECVERSION
+from cloudevents_pydantic.events._plan import is_untyped
+from cloudevents_pydantic.events._ulid import monotonic_ulids
+
+from ._body import lazy_data_adapter
+from ._header_codec import canonical_string
+from .http import HTTPComponents, HTTPHandler
+
+_T = TypeVar("_T", bound=CloudEvent)
+
+_EVENT_ATTRIBUTES = ("id", "time", "data")
+_JSON_CONTENT_TYPE = "application/cloudevents+json; charset=UTF-8"
+
+
+class EventTemplate(Generic[_T]):
+    """
+    Creates events sharing the same constant attributes (i.e. `type`, `source`
+    and `datacontenttype`), which are validated once, supplying only the `id`,
+    the `time` and the `data` of each event.
+
+    The constant part of the HTTP representations is rendered once too: events
+    are serialized splicing their attributes into the pre-rendered JSON
+    fragments, or next to the pre-encoded binary mode headers.
+    """
+
+    event_class: Type[_T]
+    handler: HTTPHandler[_T]
+
+    def __init__(
+        self,
+        event_class: Type[_T] = CloudEvent,  # type: ignore[assignment]
+        handler: Optional[HTTPHandler[_T]] = None,
+        **constants: Any,
+    ) -> None:
+        """
+        :param event_class: The event class to build
+        :type event_class: Type[CloudEvent]
+        :param handler: The handler encoding the binary mode headers,
+                        defaults to a new `HTTPHandler`
+        :type handler: Optional[HTTPHandler]
+        :param constants: The constant attributes
+        :raises ValidationError: If the constant attributes are not valid
+        """
+        variable = set(_EVENT_ATTRIBUTES).intersection(constants)
+        if variable:
+            raise ValueError(
+                f"Attributes set for each event can't be constant: "
+                f"{', '.join(sorted(variable))}"
+            )
+        self.event_class = event_class
+        self.handler = handler or HTTPHandler(event_class)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        # Validates all the attributes but `data`
+        attributes = lazy_data_adapter(event_class).validate_python(
+            {"id": "template", "specversion": DEFAULT_SPECVERSION, **constants}
+        )
+        values = {**attributes.__dict__, **(attributes.__pydantic_extra__ or {})}
+        values.update(time=now, data=None)
+        self._prototype = cast(
+            _T,
+            event_class.model_construct(
+                attributes.model_fields_set | set(_EVENT_ATTRIBUTES), **values
+            ),
+        )
+        self._validator = event_class.__pydantic_validator__
+        self._validate_data = _validates_data(event_class)
+        self._binary_data = event_class.__event_plan__.binary_data
+        self._data_adapter: TypeAdapter[Any] = TypeAdapter(
+            event_class.model_fields["data"].rebuild_annotation()
+        )
+        self._json_parts = self._render_json(attributes)
+        self._headers = self._render_headers(attributes)
+
+    def event(
+        self,
+        data: Any = None,
+        id: Optional[str] = None,
+        time: Optional[Union[datetime.datetime, str]] = None,
+    ) -> _T:
+        """
+        Creates an event with the constant attributes.
+
+        :param data: The event data, it is validated when the event class
+                     defines its type
+        :type data: Any
+        :param id: The event id, defaults to a ULID
+        :type id: typing.Optional[str]
+        :param time: The time the event occurred, defaults to now
+        :type time: typing.Optional[Union[datetime.datetime, str]]
+        :return: The new event
+        :rtype: CloudEvent
+        """
+        event = self._prototype.model_copy()
+        if id is None:
+            event.__dict__["id"] = monotonic_ulids(1)[0]
+        else:
+            self._validator.validate_assignment(event, "id", id)
+        if time is None:
+            event.__dict__["time"] = datetime.datetime.now(datetime.timezone.utc)
+        else:
+            self._validator.validate_assignment(event, "time", time)
+        if self._validate_data:
+            self._validator.validate_assignment(event, "data", data)
+        else:
+            event.__dict__["data"] = data
+        return event
+
+    def to_json(self, event: _T) -> HTTPComponents:
+        """
+        Serializes an event created by this template in JSON format, with
+        the body as `bytes`. Only the `id`, `time` and `data` of the event
+        are read, the constant attributes are spliced from the pre-rendered
+        representation.
+
+        :param event: The event, created by this template
+        :type event: CloudEvent
+        :return: The headers and the UTF-8 encoded body of the event
+        :rtype: HTTPComponents
+        """
+        data = event.data
+        binary = self._binary_data
+        if binary is None:
+            binary = isinstance(data, (bytes, bytearray, memoryview))
+        parts: List[bytes] = []
+        for part in self._json_parts:
+            if part == "id":
+                parts.append(b'"id":' + to_json(event.id))
+            elif part == "time":
+                time = event.time
+                parts.append(
+                    b'"time":null'
+                    if time is None
+                    else b'"time":"' + time.isoformat().encode() + b'"'
+                )
+            elif part == "data":
+                if not binary:
+                    parts.append(b'"data":' + self._data_adapter.dump_json(data))
+            else:
+                parts.append(part)  # type: ignore[arg-type]
+        if binary:
+            parts.append(b'"data_base64":"' + base64.b64encode(data) + b'"')
+        headers = {"content-type": _JSON_CONTENT_TYPE}
+        return HTTPComponents(headers, b"{" + b",".join(parts) + b"}")
+
+    def to_binary(self, event: _T) -> HTTPComponents:
+        """
+        Serializes an event created by this template in HTTP binary format.
+        Only the `id`, `time` and `data` of the event are read, the headers
+        of the constant attributes are pre-encoded.
+
+        :param event: The event, created by this template
+        :type event: CloudEvent
+        :return: The headers and the body representation of the event
+        :rtype: HTTPComponents
+        """
+        if self._headers is None:
+            raise ValueError("Can't serialize event without datacontenttype")
+        headers = dict(self._headers)
+        headers["ce-id"] = self.handler._header_encode(event.id)
+        if event.time is not None:
+            headers["ce-time"] = self.handler._header_encode(event.time.isoformat())
+        body = self._data_adapter.dump_python(event.data)
+        return HTTPComponents(headers, body)
+
+    def _render_json(self, attributes: CloudEvent) -> List[Union[str, bytes]]:
+        # The serialized attributes, in the same order of the event
+        # serializer, with the names of the attributes set for each event
+        # in place of their pre-rendered JSON
+        serialized = type(attributes).__pydantic_serializer__.to_python(
+            attributes, mode="json"
+        )
+        parts: List[Union[str, bytes]] = []
+        constant: List[bytes] = []
+        for name, value in serialized.items():
+            if name in _EVENT_ATTRIBUTES:
+                if constant:
+                    parts.append(b",".join(constant))
+                    constant = []
+                parts.append(name)
+            else:
+                constant.append(to_json(name) + b":" + to_json(value))
+        # `dataschema` (and the extensions) always follow the event attributes
+        parts.append(b",".join(constant))
+        return parts
+
+    def _render_headers(self, attributes: CloudEvent) -> Optional[Dict[str, str]]:
+        if attributes.datacontenttype is None:
+            return None
+        serialized = attributes.model_dump()
+        del serialized["data"], serialized["id"], serialized["time"]
+        content_type = serialized.pop("datacontenttype")
+        header_names = self.event_class.__event_plan__.header_names
+        headers = {
+            header_names.get(k) or f"ce-{k}": self.handler._header_encode(
+                v if isinstance(v, str) else canonical_string(v)
+            )
+            for k, v in serialized.items()
+            if v is not None
+        }
+        headers["content-type"] = self.handler._header_encode(content_type)
+        return headers
+
+
+def _validates_data(event_class: Type[CloudEvent]) -> bool:
+    # Untyped data, without validators, is stored as it is
+    field = event_class.model_fields["data"]
+    decorators = event_class.__pydantic_decorators__
+    return bool(
+        not is_untyped(field.annotation)
+        or field.metadata
+        or decorators.field_validators
+        or decorators.model_validators
+    )
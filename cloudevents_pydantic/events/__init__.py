@@ -23,5 +23,12 @@
 
 
 from ._event import CloudEvent
+from ._extensions import register_extension, registered_extension
+from ._frozen import FrozenCloudEvent
 
-__all__ = ["CloudEvent"]
+__all__ = [
+    "CloudEvent",
+    "FrozenCloudEvent",
+    "register_extension",
+    "registered_extension",
+]
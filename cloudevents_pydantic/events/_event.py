@@ -22,19 +22,46 @@
 # ==============================================================================
 import base64
 import datetime
-from typing import Annotated, Any, Optional, Union
+from functools import partial
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
-    model_serializer,
-    model_validator,
+    GetCoreSchemaHandler,
+    PlainSerializer,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
 )
-from pydantic.fields import FieldInfo
+from pydantic_core import CoreSchema, core_schema
 from pydantic_core.core_schema import ValidationInfo
 from ulid import ULID
 
+from ._extensions import extended_class
+from ._lazy_data import (
+    DeferredValidation,
+    LazyData,
+    install_descriptor,
+    serialize_loaded,
+)
+from ._plan import EventPlan, compile_plan, is_untyped
+from ._trusted import trusted_constructor
+from ._ulid import monotonic_ulids
 from .fields.metadata import (
     FieldData,
     FieldDataContentType,
@@ -48,31 +75,125 @@ from .fields.metadata import (
 )
 from .fields.types import (
     URI,
-    Binary,
     MimeType,
     SpecVersion,
     String,
     Timestamp,
     URIReference,
 )
+from .fields.types._canonic_types import binary_serializer
 
 DEFAULT_SPECVERSION = SpecVersion.v1_0
 
+_BINARY_TYPES = (bytes, bytearray, memoryview)
+
+_E = TypeVar("_E", bound="CloudEvent")
+DataT = TypeVar("DataT")
+
+# Pydantic only keeps weak references to the parametrized classes
+# (i.e. `CloudEvent[MyData]`), they would be rebuilt once unreferenced.
+_parametrized_classes: List[Type["CloudEvent"]] = []
 
-_binary_field_metadata = FieldInfo.from_annotation(Binary).metadata
 
+def _json_data_base64_validator(
+    data_key: str, values: Any, info: ValidationInfo
+) -> Any:
+    if info.mode == "json" and isinstance(values, dict) and values.get("data_base64"):
+        values[data_key] = base64.b64decode(values.pop("data_base64"))
+    return values
+
+
+def _json_data_base64_serializer(
+    cls: Type["CloudEvent"],
+    data_keys: Tuple[str, ...],
+    encoded: bool,
+    event: "CloudEvent",
+    handler: SerializerFunctionWrapHandler,
+    info: SerializationInfo,
+) -> Any:
+    if type(event) is not cls:
+        # Serialized as a parent class (i.e. in a `List[CloudEvent]`):
+        # keep the subclass attributes, as `model_dump_json()` does.
+        return type(event).__pydantic_serializer__.to_python(
+            event,
+            mode="json",
+            include=info.include,  # type: ignore[arg-type]
+            exclude=info.exclude,  # type: ignore[arg-type]
+            by_alias=info.by_alias,
+            exclude_unset=info.exclude_unset,
+            exclude_defaults=info.exclude_defaults,
+            exclude_none=info.exclude_none,
+            round_trip=info.round_trip,
+            context=info.context,
+        )
+    values = handler(event)
+    if encoded or isinstance(event.data, _BINARY_TYPES):
+        # The value has been encoded by the `data` serializer
+        for key in data_keys:
+            if key in values:
+                values["data_base64"] = values.pop(key)
+    return values
 
-class CloudEvent(BaseModel):
+
+def _json_data_serializer(value: Any, handler: SerializerFunctionWrapHandler) -> Any:
+    # pydantic-core would encode bytes as UTF-8, or with the URL-safe alphabet
+    if type(value) is LazyData:
+        value = value.value
+    if isinstance(value, _BINARY_TYPES):
+        return base64.b64encode(value).decode()
+    return handler(value)
+
+
+class CloudEvent(BaseModel, Generic[DataT]):
     """
     A Python-friendly CloudEvent representation backed by Pydantic-modeled fields.
     """
 
+    __event_plan__: ClassVar[EventPlan]
+    """What (de)serialization needs to know about the class, see `compile_plan`"""
+
+    def __init_subclass__(cls, defer_data_validation: bool = False, **kwargs: Any):
+        """
+        Allows subclasses to defer the validation of `data`: the other
+        attributes are validated as usual, `data` is kept as it is and
+        validated against its declared type on the first access.
+
+        :param defer_data_validation: Validate `data` on its first access,
+                                      instead of when the event is validated.
+                                      The class must declare the `data` type.
+        :type defer_data_validation: bool
+        """
+        super().__init_subclass__(**kwargs)
+        if not defer_data_validation:
+            return
+        # Runs before pydantic collects the fields
+        annotations = vars(cls).get("__annotations__", {})
+        if "data" not in annotations:
+            raise TypeError(
+                f"{cls.__name__} must declare the `data` type to defer its validation"
+            )
+        declared = annotations["data"]
+        annotations["data"] = Annotated[declared, DeferredValidation(cls.__name__)]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__event_plan__ = compile_plan(cls)
+        if any(
+            isinstance(m, DeferredValidation) for m in cls.model_fields["data"].metadata
+        ):
+            # Resolves the deferred data on first access
+            install_descriptor(cls)
+        if cls.__pydantic_generic_metadata__["origin"] is not None:
+            _parametrized_classes.append(cls)
+
     @classmethod
     def event_factory(
         cls,
         id: Optional[str] = None,
         specversion: Optional[SpecVersion] = None,
         time: Optional[Union[datetime.datetime, str]] = None,
+        validate: bool = True,
         **kwargs,
     ) -> "CloudEvent":
         """
@@ -84,18 +205,132 @@ class CloudEvent(BaseModel):
         :type specversion: typing.Optional[SpecVersion]
         :param time: The time the event occurred, defaults to now
         :type time: typing.Optional[Union[datetime.datetime, str]]
+        :param validate: Validate the values, `False` builds the event with
+                         `from_trusted`
+        :type validate: bool
         :param kwargs: Other kwargs forwarded directly to the CloudEvent model.
         :return: A new CloudEvent model
         :rtype: CloudEvent
         """
-        return cls(
+        return (cls if validate else cls.from_trusted)(
             id=id or str(ULID()),
             specversion=specversion or DEFAULT_SPECVERSION,
             time=time or datetime.datetime.now(datetime.timezone.utc),
             **kwargs,
         )
 
-    data: Annotated[Any, Field(default=None), FieldData]
+    @classmethod
+    def event_factory_batch(
+        cls,
+        items: Iterable[Mapping[str, Any]],
+        shared_time: bool = True,
+        **common: Any,
+    ) -> List["CloudEvent"]:
+        """
+        Builds a list of new CloudEvents, one for each item, using the same
+        defaults of `event_factory`.
+
+        The `common` attributes are shared by all the events and validated
+        once, while the attributes of each item are validated for each event.
+        The ids are monotonic ULIDs, sorted in the order of the items, and
+        all the events get the same `time` unless `shared_time` is False.
+        An `id` can be set for each item, but not in the `common` attributes.
+
+        :param items: The attributes specific to each event
+        :type items: Iterable[Mapping[str, Any]]
+        :param shared_time: Read the clock once for all the events
+        :type shared_time: bool
+        :param common: The attributes shared by all the events, they are
+                       not copied (avoid mutable values)
+        :return: The new CloudEvent models
+        :rtype: List[CloudEvent]
+        :raises ValueError: If `id` is one of the `common` attributes
+        """
+        if "id" in common:
+            raise ValueError("The events can't share an id, set it for each item")
+        items = list(items)
+        if not items:
+            return []
+        now = datetime.datetime.now(datetime.timezone.utc)
+        ids = monotonic_ulids(len(items), int(now.timestamp() * 1000))
+        first = cls.event_factory(**{"id": ids[0], "time": now, **common, **items[0]})
+        events = [first]
+        validator = cls.__pydantic_validator__
+        for id, item in zip(ids[1:], items[1:]):
+            time = now
+            if not shared_time and "time" not in common and "time" not in item:
+                time = datetime.datetime.now(datetime.timezone.utc)
+            if not items[0].keys() <= item.keys():
+                # The attributes of the first item can't be left in the copy
+                events.append(
+                    cls.event_factory(**{"id": id, "time": time, **common, **item})
+                )
+                continue
+            # Copy the first event, only the item attributes need validation
+            event = first.model_copy()
+            event.__dict__["id"] = id
+            if time is not now:
+                event.__dict__["time"] = time
+            for name, value in item.items():
+                validator.validate_assignment(event, name, value)
+            events.append(event)
+        return events
+
+    @classmethod
+    def from_trusted(cls, **values: Any) -> "CloudEvent":
+        """
+        Builds a CloudEvent skipping validation, for values produced by
+        trusted code. The `str` representations of URIs, timestamps,
+        the specversion and binary data are still converted to the types
+        a validated event holds. The fields that validation would convert
+        (i.e. `Boolean` attributes, or `data` typed with a model) are
+        validated on their own, any other value is stored as it is.
+
+        :param values: The event attributes
+        :return: A new CloudEvent model
+        :rtype: CloudEvent
+        :raises ValueError: If mandatory attributes are missing, or unknown
+                            attributes are passed to a class not allowing them
+        """
+        return trusted_constructor(cls)(values)
+
+    def evolve(self: _E, **changes: Any) -> _E:
+        """
+        Builds a copy of the event with some changed attributes. Only the
+        changed attributes are validated, the other values are reused
+        from this event (they are not copied, as in `model_copy`).
+
+        :param changes: The attributes to change
+        :return: A new CloudEvent model
+        :rtype: CloudEvent
+        :raises pydantic.ValidationError: If a changed attribute is not valid
+        """
+        event = self.model_copy()
+        validator = type(self).__pydantic_validator__
+        for name, value in changes.items():
+            validator.validate_assignment(event, name, value)
+        return event
+
+    @classmethod
+    def with_extensions(cls: Type[_E], *names: str) -> Type[_E]:
+        """
+        Returns a subclass having the registered extension attributes
+        as optional fields, see `register_extension`. The extensions are
+        validated by the compiled pydantic validators and handled by the
+        (de)serialization like any other attribute.
+
+        The subclass is built once, the same class is returned for the
+        same extensions, in any order.
+
+        :param names: The extension attribute names
+        :type names: str
+        :return: The subclass
+        :rtype: Type[CloudEvent]
+        :raises ValueError: If an extension is not registered
+        """
+        return extended_class(cls, tuple(sorted(set(names))))
+
+    data: Annotated[DataT, Field(default=None), FieldData]
 
     # Mandatory fields
     source: Annotated[URIReference, FieldSource]
@@ -135,38 +370,70 @@ class CloudEvent(BaseModel):
     Using `orjson` could solve this, perhaps it could be a future improvement.
     """
 
-    # Typing for return value here breaks `.model_json_schema(mode='serialization')`
-    @model_serializer(when_used="json")
-    def base64_json_serializer(self):
-        """Takes care of handling binary data serialization into `data_base64`
-        attribute.
-
-        :param self: CloudEvent.
-
-        :return: Event serialized as a standard CloudEvent dict with binary
-                 data handled.
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
         """
-        model_dict = self.model_dump()
-        if _binary_field_metadata == self.model_fields["data"].metadata:
-            model_dict["data_base64"] = model_dict["data"]
-            del model_dict["data"]
-        elif isinstance(model_dict["data"], (bytes, bytearray, memoryview)):
-            model_dict["data_base64"] = base64.b64encode(model_dict["data"])
-            del model_dict["data"]
+        Adds the `data_base64` handling of the JSON format to the schema of the
+        classes whose `data` can hold binary values, the other classes skip it.
+        Typed `data` is serialized after loading `LazyData` values.
 
-        return model_dict
+        :param source: The class
+        :param handler: The pydantic schema generation handler
+        :return: The class schema
+        """
+        schema = cast(core_schema.ModelSchema, handler(source))
+        if schema is cls.__dict__.get("__pydantic_core_schema__"):
+            # The already built schema, being referenced by another schema
+            return schema
+        field = cls.model_fields["data"]
+        data_field = schema["schema"]["fields"]["data"]  # type: ignore[typeddict-item]
+        if not is_untyped(field.annotation) and not any(
+            isinstance(m, DeferredValidation) for m in field.metadata
+        ):
+            # Lazily loaded data (see `LazyDataDescriptor`) is resolved
+            # before the typed serializer
+            data_field["schema"] = {
+                **data_field["schema"],
+                "serialization": core_schema.plain_serializer_function_ser_schema(
+                    serialize_loaded, return_schema=data_field["schema"]
+                ),
+            }
+        if compile_plan(cls).binary_data is False:
+            return schema
+        # Binary data is encoded in JSON as `data_base64`, depending on
+        # the value when `data` is not always binary
+        encoded = any(
+            isinstance(m, PlainSerializer) and m.func is binary_serializer
+            for m in field.metadata
+        )
+        if not encoded:
+            data_field["schema"] = {
+                **data_field["schema"],
+                "serialization": core_schema.wrap_serializer_function_ser_schema(
+                    _json_data_serializer,
+                    schema=data_field["schema"],
+                    when_used="json",
+                ),
+            }
+        data_key = field.alias or "data"
+        if data_key != "data_base64":
+            schema["schema"] = core_schema.with_info_before_validator_function(
+                partial(_json_data_base64_validator, data_key), schema["schema"]
+            )
+        if "serialization" not in schema:  # Unless the class defines its own
+            schema["serialization"] = core_schema.wrap_serializer_function_ser_schema(
+                partial(
+                    _json_data_base64_serializer,
+                    cls,
+                    tuple(dict.fromkeys(("data", field.serialization_alias or "data"))),
+                    encoded,
+                ),
+                info_arg=True,
+                when_used="json",
+            )
+        return schema
 
-    @model_validator(mode="before")
-    @classmethod
-    def base64_json_validator(cls, data: dict, info: ValidationInfo) -> Any:
-        """Takes care of handling binary data deserialization from `data_base64`
-        attribute.
 
-        :param data: Input data for validation
-        :param info: Pydantic validation context
-        :return: input data, after handling data_base64
-        """
-        if info.mode == "json" and isinstance(data, dict) and data.get("data_base64"):
-            data["data"] = base64.b64decode(data["data_base64"])
-            del data["data_base64"]
-        return data
+CloudEvent.__event_plan__ = compile_plan(CloudEvent)
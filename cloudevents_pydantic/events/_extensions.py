@@ -0,0 +1,175 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import re
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import create_model
+
+from ._plan import SPEC_ATTRIBUTES
+from .fields.types import String, Timestamp, URIReference
+
+_T = TypeVar("_T")
+
+# Lower-case ASCII letters or digits, as required by the specification
+_EXTENSION_NAME = re.compile(r"[a-z0-9]+")
+
+_registry: Dict[str, Any] = {
+    # Distributed tracing
+    "traceparent": String,
+    "tracestate": String,
+    # Partitioning
+    "partitionkey": String,
+    # Sequence
+    "sequence": String,
+    # Claim check (dataref)
+    "dataref": URIReference,
+    # Recorded time, expiry time
+    "recordedtime": Timestamp,
+    "expirytime": Timestamp,
+    # Auth context
+    "authtype": String,
+    "authid": String,
+}
+
+
+def register_extension(name: str, annotation: Any) -> None:
+    """
+    Registers the type of an extension attribute, to be used by
+    `CloudEvent.with_extensions`. Use the canonical types in
+    `cloudevents_pydantic.events.fields.types` to be compliant with the
+    CloudEvents type system.
+
+    The documented extensions (i.e. `traceparent`, `partitionkey`, `sequence`,
+    `dataref`) are already registered.
+
+    :param name: The extension attribute name
+    :type name: str
+    :param annotation: The type of the attribute
+    :type annotation: Any
+    :raises ValueError: If the name is not valid, or it is already registered
+                        with a different type
+    """
+    if not _EXTENSION_NAME.fullmatch(name) or name in SPEC_ATTRIBUTES:
+        raise ValueError(f"Invalid extension attribute name: {name!r}")
+    registered = _registry.setdefault(name, annotation)
+    if registered is not annotation and registered != annotation:
+        raise ValueError(f"Extension {name!r} is already registered")
+
+
+def registered_extension(name: str) -> Optional[Any]:
+    """
+    Returns the type registered for an extension attribute.
+
+    :param name: The extension attribute name
+    :type name: str
+    :return: The type, `None` if the extension is not registered
+    :rtype: Optional[Any]
+    """
+    return _registry.get(name)
+
+
+@lru_cache(maxsize=None)
+def extended_class(event_class: Type[_T], names: Tuple[str, ...]) -> Type[_T]:
+    """
+    Builds (once) a subclass of the event class having the registered
+    extensions as optional fields. The subclass is named after the class
+    and the extensions (i.e. `CloudEventWithSequenceTraceparent`), its
+    pickled events are rebuilt calling this function again.
+
+    :param event_class: The event class
+    :type event_class: Type[CloudEvent]
+    :param names: The extension names, sorted
+    :type names: Tuple[str, ...]
+    :return: The subclass, or the event class if it has all the extensions
+    :rtype: Type[CloudEvent]
+    :raises ValueError: If an extension is not registered
+    """
+    unknown = [name for name in names if name not in _registry]
+    if unknown:
+        raise ValueError(f"Unregistered extensions: {', '.join(unknown)}")
+    fields = {
+        name: (Optional[_registry[name]], None)
+        for name in names
+        if name not in event_class.model_fields  # type: ignore[attr-defined]
+    }
+    if not fields:
+        return event_class
+    extended = create_model(  # type: ignore[call-overload]
+        event_class.__name__ + "With" + "".join(map(str.capitalize, names)),
+        __base__=(event_class, _ExtendedEvent),
+        __module__=event_class.__module__,
+        **fields,
+    )
+    extended.__extended__ = (event_class, names)  # type: ignore[attr-defined]
+    return extended  # type: ignore[return-value]
+
+
+def class_reference(event_class: Any) -> Any:
+    """
+    Returns a reference to an event class that can be pickled (i.e. to be
+    sent to worker processes): the classes built by `extended_class` are
+    referenced by their base class and their extensions.
+
+    :param event_class: The event class
+    :type event_class: Any
+    :return: The reference, see `resolve_class`
+    :rtype: Any
+    """
+    if isinstance(event_class, type):
+        return event_class.__dict__.get("__extended__", event_class)
+    return event_class
+
+
+def resolve_class(reference: Any) -> Any:
+    """
+    Returns the event class of a reference built by `class_reference`.
+
+    :param reference: The reference
+    :type reference: Any
+    :return: The event class
+    :rtype: Any
+    """
+    if isinstance(reference, tuple):
+        return extended_class(*reference)
+    return reference
+
+
+class _ExtendedEvent:
+    # The classes built by `extended_class` can't be imported by pickle,
+    # their events are rebuilt by the `extended_class` cached result
+    __slots__ = ()
+
+    def __reduce_ex__(self, protocol: Any) -> Union[str, Tuple[Any, ...]]:
+        extended = type(self).__dict__.get("__extended__")
+        if extended is None:
+            # Subclasses, declared in modules, are pickled as usual
+            return super().__reduce_ex__(protocol)
+        return _rebuild, (*extended, self.__getstate__())  # type: ignore[attr-defined]
+
+
+def _rebuild(event_class: Any, names: Tuple[str, ...], state: Dict[str, Any]) -> Any:
+    event_type: Any = extended_class(event_class, names)
+    event = event_type.__new__(event_type)
+    event.__setstate__(state)
+    return event
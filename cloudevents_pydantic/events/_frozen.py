@@ -0,0 +1,82 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from pydantic import ConfigDict
+
+from ._event import CloudEvent
+
+_V = TypeVar("_V")
+
+JSON = "json"
+"""The `memoized` key of the JSON representation, as `bytes`"""
+
+
+class FrozenCloudEvent(CloudEvent):
+    """
+    An immutable CloudEvent, memoizing its serialized forms.
+
+    The serialization functions (JSON, canonical and HTTP binary mode) build
+    the serialized forms once, on first use, and return them afterwards.
+    The hash, computed once from `source` and `id` (unique for each distinct
+    event), allows using the events as dictionary keys or in sets.
+
+    Use `evolve` to derive modified events, the new events don't share the
+    memoized forms.
+    """
+
+    # Not pydantic private attributes: they are not compared, copied nor pickled
+    __slots__ = ("_hash", "_memo")
+
+    model_config = ConfigDict(frozen=True)
+
+    def memoized(self, key: Hashable, build: Callable[[], _V]) -> _V:
+        """
+        Returns the value memoized for the key, calling `build` to build
+        it the first time.
+
+        :param key: The key of the serialized form
+        :type key: Hashable
+        :param build: Builds the serialized form
+        :type build: Callable[[], _V]
+        :return: The serialized form, it must not be modified
+        :rtype: _V
+        """
+        memo: Optional[Dict[Hashable, Any]] = getattr(self, "_memo", None)
+        if memo is None:
+            memo = {}
+            object.__setattr__(self, "_memo", memo)
+        try:
+            return memo[key]
+        except KeyError:
+            value = memo[key] = build()
+            return value  # type: ignore[no-any-return]
+
+    def __hash__(self) -> int:
+        value: Optional[int] = getattr(self, "_hash", None)
+        if value is None:
+            # Equal events have the same attributes, while their serialized forms
+            # may differ (i.e. the order of `data` keys or the `time` timezone)
+            value = hash((self.source, self.id))
+            object.__setattr__(self, "_hash", value)
+        return value
@@ -0,0 +1,224 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+from functools import partial
+from typing import Any, Callable, Optional, Tuple, Type, Union, get_args
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import (
+    ErrorDetails,
+    InitErrorDetails,
+    PydanticCustomError,
+    SchemaSerializer,
+    ValidationError,
+    core_schema,
+)
+from pydantic_core.core_schema import ErrorType
+
+_NOT_LOADED: Any = object()
+
+_ERROR_TYPES = frozenset(get_args(ErrorType))
+
+
+class LazyData:
+    """
+    Holds the `data` of an event until it is first needed.
+
+    The value is loaded, once, when the `data` attribute is accessed
+    or when the event is serialized.
+    """
+
+    __slots__ = ("_load", "_value")
+
+    # Pydantic serializes `Any` values using this serializer
+    __pydantic_serializer__ = SchemaSerializer(
+        core_schema.any_schema(
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda lazy: lazy.value
+            )
+        )
+    )
+
+    def __init__(self, load: Callable[[], Any]) -> None:
+        self._load: Optional[Callable[[], Any]] = load
+        self._value = _NOT_LOADED
+
+    @property
+    def loaded(self) -> bool:
+        return self._value is not _NOT_LOADED
+
+    @property
+    def value(self) -> Any:
+        if self._value is _NOT_LOADED:
+            self._value = self._load()  # type: ignore[misc]
+            # Releases the references held by the loader, i.e. the raw body
+            self._load = None
+        return self._value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyData):
+            other = other.value
+        return bool(self.value == other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> Tuple[Callable[[Any], Any], Tuple[Any]]:
+        # The loader can't be pickled (nor deep copied), the value is
+        return _loaded, (self.value,)
+
+    def __repr__(self) -> str:
+        value = repr(self._value) if self.loaded else "<not loaded>"
+        return f"LazyData({value})"
+
+
+class LazyDataDescriptor:
+    """
+    Replaces a `LazyData` stored in the instance with its value,
+    when the attribute is accessed.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[Type[Any]] = None) -> Any:
+        if instance is None:
+            # Not a class attribute, pydantic must not consider it a default value
+            raise AttributeError(self.name)
+        try:
+            value = instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        if type(value) is LazyData:
+            value = instance.__dict__[self.name] = value.value
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self.name] = value
+
+
+def install_descriptor(event_class: Type[Any], name: str = "data") -> None:
+    """
+    Installs the `LazyDataDescriptor` of a field on a class whose events
+    hold `LazyData` values, once. The fields of the other classes are
+    accessed as plain instance attributes, without the descriptor overhead.
+
+    :param event_class: The class
+    :type event_class: Type[Any]
+    :param name: The field name
+    :type name: str
+    """
+    if not isinstance(event_class.__dict__.get(name), LazyDataDescriptor):
+        setattr(event_class, name, LazyDataDescriptor(name))
+
+
+class DeferredValidation:
+    """
+    Annotation deferring the validation of a field to its first access:
+    the field holds a `LazyData` validating the value when it is loaded.
+
+    Validation errors are raised when the value is loaded, with the
+    title and the location they would have when validating the model.
+    """
+
+    __slots__ = ("name", "title")
+
+    def __init__(self, title: str, name: str = "data") -> None:
+        self.title = title
+        self.name = name
+
+    def __get_pydantic_core_schema__(
+        self, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        schema = handler(source)
+        return core_schema.no_info_wrap_validator_function(
+            self._defer,
+            schema,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                serialize_loaded, return_schema=schema
+            ),
+        )
+
+    def _defer(
+        self, value: Any, handler: core_schema.ValidatorFunctionWrapHandler
+    ) -> LazyData:
+        return LazyData(partial(self._validate, handler, value))
+
+    def _validate(
+        self, handler: core_schema.ValidatorFunctionWrapHandler, value: Any
+    ) -> Any:
+        try:
+            return handler(value)
+        except ValidationError as e:
+            raise ValidationError.from_exception_data(
+                self.title,
+                [
+                    relocated_error(error, (self.name, *error["loc"]))
+                    for error in e.errors()
+                ],
+            ) from None
+
+
+def relocated_error(
+    error: ErrorDetails, loc: Tuple[Union[int, str], ...]
+) -> InitErrorDetails:
+    """
+    Converts the details of a validation error, to raise it again
+    at a different location.
+
+    :param error: The error details
+    :type error: ErrorDetails
+    :param loc: The new location
+    :type loc: Tuple[Union[int, str], ...]
+    :return: The details, to be used with `ValidationError.from_exception_data`
+    :rtype: InitErrorDetails
+    """
+    details: InitErrorDetails = {
+        "type": error["type"],
+        "loc": loc,
+        "input": error["input"],
+    }
+    if error["type"] not in _ERROR_TYPES:
+        details["type"] = PydanticCustomError(
+            error["type"], error["msg"], error.get("ctx")
+        )
+    elif "ctx" in error:
+        details["ctx"] = error["ctx"]
+    return details
+
+
+def _loaded(value: Any) -> Any:
+    return value
+
+
+def serialize_loaded(value: Any) -> Any:
+    """
+    Plain serializer returning the value of a `LazyData`, to be serialized
+    with the schema of the field (the `return_schema` of the serializer).
+
+    :param value: The value, or a `LazyData` holding it
+    :type value: Any
+    :return: The value
+    :rtype: Any
+    """
+    if type(value) is LazyData:
+        return value.value
+    return value
@@ -0,0 +1,138 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Dict,
+    ForwardRef,
+    FrozenSet,
+    NamedTuple,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic.fields import FieldInfo
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._event import CloudEvent
+
+SPEC_ATTRIBUTES = frozenset(
+    (
+        "data",
+        "source",
+        "id",
+        "type",
+        "specversion",
+        "time",
+        "subject",
+        "datacontenttype",
+        "dataschema",
+    )
+)
+"""
+The attributes (and the data) defined by the CloudEvents specification,
+any other attribute is an extension.
+"""
+
+_BINARY_TYPES = (bytes, bytearray, memoryview)
+
+
+class EventPlan(NamedTuple):
+    """
+    Facts about an event class used when (de)serializing its events,
+    computed once when the class is created.
+    """
+
+    binary_data: Optional[bool]
+    """
+    `True` when `data` always holds binary data, `False` when it never does,
+    `None` when it depends on the value.
+    """
+    attributes: FrozenSet[str]
+    """The names of all the attributes, including `data`"""
+    header_names: Dict[str, str]
+    """The HTTP binary mode header for each attribute carried by a `ce-` header"""
+
+
+def compile_plan(event_class: Type["CloudEvent"]) -> EventPlan:
+    """
+    Computes the plan of an event class.
+
+    :param event_class: The event class
+    :type event_class: Type[CloudEvent]
+    :return: The event class plan
+    :rtype: EventPlan
+    """
+    fields = event_class.model_fields
+    return EventPlan(
+        binary_data=_binary_data(fields["data"]),
+        attributes=frozenset(fields),
+        header_names={
+            name: f"ce-{name}"
+            for name in fields
+            if name not in ("data", "datacontenttype")
+        },
+    )
+
+
+def is_untyped(annotation: Any) -> bool:
+    """
+    Checks if values of an annotation are stored as they are: `Any`, or an
+    unconstrained type variable (i.e. `data` of a non parametrized class).
+
+    :param annotation: The annotation
+    :type annotation: Any
+    :return: If the annotation doesn't validate the values
+    :rtype: bool
+    """
+    if isinstance(annotation, TypeVar):
+        return annotation.__bound__ is None and not annotation.__constraints__
+    return annotation is Any
+
+
+def _binary_data(field: FieldInfo) -> Optional[bool]:
+    annotation = field.annotation
+    if isinstance(annotation, type) and issubclass(annotation, _BINARY_TYPES):
+        return True if field.is_required() else None
+    return None if _may_be_binary(annotation) else False
+
+
+def _may_be_binary(annotation: Any) -> bool:
+    if annotation is Any or annotation is object:
+        return True
+    if isinstance(annotation, (TypeVar, ForwardRef, str)):
+        return True
+    if isinstance(annotation, type):
+        return issubclass(annotation, _BINARY_TYPES)
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _may_be_binary(get_args(annotation)[0])
+    if origin is Union:
+        return any(_may_be_binary(arg) for arg in get_args(annotation))
+    # Other generic types (i.e. `Dict[str, bytes]`) are never `bytes` themselves
+    return False
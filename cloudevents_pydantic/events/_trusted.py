@@ -0,0 +1,245 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import base64
+import copy
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache, partial
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Literal,
+    Optional,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+from urllib.parse import ParseResult
+
+from annotated_types import BaseMetadata
+from pydantic import (
+    PlainSerializer,
+    StringConstraints,
+    TypeAdapter,
+    WithJsonSchema,
+    WrapSerializer,
+)
+from pydantic.fields import FieldInfo
+
+from ._plan import is_untyped
+from .fields.types._canonic_types import parse_uri
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._event import CloudEvent
+
+_STORED_AS_IS = (str, int, type(None), object, list, dict)
+_IMMUTABLE_DEFAULTS = (type(None), str, bytes, int, float, bool, tuple, frozenset, Enum)
+_object_setattr = object.__setattr__
+
+
+class TrustedConstructor:
+    """
+    Builds events of a class without validating the values, only converting
+    the `str` representations of the URI, timestamp, enum and binary
+    attributes to the types validation would produce.
+
+    The values of the other fields are stored as they are, unless validation
+    would convert them (i.e. `Boolean` attributes, or `data` typed with a
+    model): these fields are validated, on their own.
+    """
+
+    def __init__(self, event_class: Type["CloudEvent"]) -> None:
+        self.event_class = event_class
+        self.extra_allowed = event_class.model_config.get("extra") == "allow"
+        # Private attributes and post init hooks are left to `model_construct`
+        self.simple = not (
+            event_class.__pydantic_post_init__ or event_class.__private_attributes__
+        )
+        # Field values in declaration order, updating the copy of this
+        # dictionary keeps the order of the validated events
+        self.template: Dict[str, Any] = {}
+        self.required = set()
+        self.factories: Dict[str, Callable[[], Any]] = {}
+        self.coercions: Dict[str, Callable[[Any], Any]] = {}
+        for name, field in event_class.model_fields.items():
+            self.template[name] = field.default
+            if field.default_factory is not None:
+                self.factories[name] = field.default_factory  # type: ignore[assignment]
+            elif field.is_required():
+                self.required.add(name)
+            elif not isinstance(field.default, _IMMUTABLE_DEFAULTS):
+                self.factories[name] = partial(copy.deepcopy, field.default)
+            coercion = _coercion(field.annotation)
+            if coercion is None and not (
+                _stored_as_is(field.annotation)
+                and all(map(_checks_only, field.metadata))
+            ):
+                coercion = TypeAdapter(
+                    Annotated[field.annotation, field]  # type: ignore[arg-type]
+                ).validate_python
+            if coercion is not None:
+                self.coercions[name] = coercion
+
+    def __call__(self, values: Dict[str, Any]) -> "CloudEvent":
+        """
+        Builds the event, the `values` dictionary is modified.
+
+        :param values: The attribute values, by field name
+        :type values: Dict[str, Any]
+        :return: The event
+        :rtype: CloudEvent
+        :raises ValueError: If mandatory attributes are missing, or if
+                            attributes are unknown and the class doesn't
+                            allow extra attributes
+        """
+        for name, coerce in self.coercions.items():
+            value = values.get(name)
+            if value is not None:
+                values[name] = coerce(value)
+        if not self.simple:
+            return self.event_class.model_construct(**values)
+        if not self.required <= values.keys():
+            missing = ", ".join(sorted(self.required - values.keys()))
+            raise ValueError(f"Missing mandatory attributes: {missing}")
+
+        attributes = {**self.template, **values}
+        if self.factories:
+            for name in self.factories.keys() - values.keys():
+                attributes[name] = self.factories[name]()
+        extra = None
+        if len(attributes) > len(self.template):
+            unknown = values.keys() - self.template.keys()
+            if not self.extra_allowed:
+                raise ValueError(f"Unknown attributes: {', '.join(sorted(unknown))}")
+            extra = {name: attributes.pop(name) for name in unknown}
+
+        event = self.event_class.__new__(self.event_class)
+        _object_setattr(event, "__dict__", attributes)
+        _object_setattr(event, "__pydantic_fields_set__", set(values))
+        _object_setattr(event, "__pydantic_extra__", extra)
+        _object_setattr(event, "__pydantic_private__", None)
+        return event
+
+
+@lru_cache(maxsize=None)
+def trusted_constructor(event_class: Type["CloudEvent"]) -> TrustedConstructor:
+    """
+    Returns the (cached) trusted constructor of an event class.
+
+    :param event_class: The event class
+    :type event_class: Type[CloudEvent]
+    :return: The constructor
+    :rtype: TrustedConstructor
+    """
+    return TrustedConstructor(event_class)
+
+
+def _coercion(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _coercion(get_args(annotation)[0])
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _coercion(args[0]) if len(args) == 1 else None
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, ParseResult):
+        return _url
+    if issubclass(annotation, datetime):
+        return _timestamp
+    if issubclass(annotation, bytes):
+        return _binary
+    if issubclass(annotation, Enum):
+        return _EnumMembers(annotation).__getitem__
+    return None
+
+
+def _stored_as_is(annotation: Any) -> bool:
+    # If validation stores the values decoded from JSON as they are
+    if is_untyped(annotation) or annotation in _STORED_AS_IS:
+        return True
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        annotation, *metadata = get_args(annotation)
+        return _stored_as_is(annotation) and all(map(_checks_only, metadata))
+    if origin is Literal:
+        return all(type(arg) in _STORED_AS_IS for arg in get_args(annotation))
+    if origin in (Union, list, dict):
+        return all(map(_stored_as_is, get_args(annotation)))
+    if isinstance(annotation, type) and issubclass(annotation, dict):
+        # TypedDict
+        try:
+            hints = get_type_hints(annotation, include_extras=True)
+        except NameError:
+            return False
+        return "__total__" in annotation.__dict__ and all(
+            map(_stored_as_is, hints.values())
+        )
+    return False
+
+
+def _checks_only(metadata: Any) -> bool:
+    # If an annotation metadata doesn't change the validated value
+    if isinstance(metadata, StringConstraints):
+        return not (metadata.strip_whitespace or metadata.to_upper or metadata.to_lower)
+    if isinstance(metadata, FieldInfo):
+        return all(map(_checks_only, metadata.metadata))
+    return isinstance(
+        metadata, (BaseMetadata, WithJsonSchema, PlainSerializer, WrapSerializer)
+    )
+
+
+def _url(value: Any) -> Any:
+    return value if isinstance(value, ParseResult) else parse_uri(value)
+
+
+def _timestamp(value: Any) -> Any:
+    if isinstance(value, str):
+        # `fromisoformat` doesn't parse every RFC 3339 timestamp
+        # before python 3.11, validation does
+        return _parse_datetime(value)
+    return value
+
+
+_parse_datetime = TypeAdapter(datetime).validate_python
+
+
+def _binary(value: Any) -> Any:
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+class _EnumMembers(Dict[Any, Enum]):
+    # Maps both the values and the members to the members, it's faster
+    # than calling the enum class
+    def __init__(self, enum: Type[Enum]) -> None:
+        super().__init__(enum._value2member_map_)
+        self.update({member: member for member in enum})
+        self.enum = enum
+
+    def __missing__(self, value: Any) -> Enum:
+        return self.enum(value)
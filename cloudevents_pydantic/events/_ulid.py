@@ -0,0 +1,73 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import os
+import time
+from typing import List, Optional
+
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+# Base32 encoding of every 10 bits value, ULIDs are encoded two characters
+# at a time
+_PAIRS = [first + second for first in _CROCKFORD for second in _CROCKFORD]
+_RANDOMNESS_BITS = 80
+
+
+def monotonic_ulids(count: int, timestamp_ms: Optional[int] = None) -> List[str]:
+    """
+    Generates ULIDs sharing the same timestamp, incrementing the randomness
+    for each one (as per the ULID monotonicity spec), so they are sorted in
+    generation order.
+
+    :param count: The number of ULIDs
+    :type count: int
+    :param timestamp_ms: The timestamp, in milliseconds since the epoch,
+                         defaults to now
+    :type timestamp_ms: Optional[int]
+    :return: The ULIDs, as strings
+    :rtype: List[str]
+    """
+    if timestamp_ms is None:
+        timestamp_ms = time.time_ns() // 1_000_000
+    # The randomness can't overflow, leave room for the increments
+    start = min(
+        int.from_bytes(os.urandom(_RANDOMNESS_BITS // 8), "big"),
+        (1 << _RANDOMNESS_BITS) - count,
+    )
+    p = _PAIRS
+    prefix = "".join(p[timestamp_ms >> shift & 1023] for shift in (40, 30, 20, 10, 0))
+    ulids = []
+    head = ""
+    last_high = -1
+    for value in range(start, start + count):
+        high = value >> 40
+        if high != last_high:
+            head = prefix + p[high >> 30] + p[high >> 20 & 1023]
+            head += p[high >> 10 & 1023] + p[high & 1023]
+            last_high = high
+        ulids.append(
+            head
+            + p[value >> 30 & 1023]
+            + p[value >> 20 & 1023]
+            + p[value >> 10 & 1023]
+            + p[value & 1023]
+        )
+    return ulids
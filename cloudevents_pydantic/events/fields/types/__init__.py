@@ -27,6 +27,7 @@ from ._canonic_types import (
     Boolean,
     Integer,
     MimeType,
+    ParsedURI,
     SpecVersion,
     String,
     Timestamp,
@@ -39,6 +40,7 @@ __all__ = [
     "Boolean",
     "Integer",
     "MimeType",
+    "ParsedURI",
     "SpecVersion",
     "String",
     "Timestamp",
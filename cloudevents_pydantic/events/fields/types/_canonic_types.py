@@ -23,7 +23,8 @@
 import base64
 from datetime import datetime
 from enum import Enum
-from typing import Annotated, Union
+from functools import lru_cache
+from typing import Annotated, Any, Iterable, Union
 from urllib.parse import ParseResult, urlparse, urlunparse
 
 from annotated_types import Ge, Le
@@ -74,7 +75,50 @@ def binary_validator(value: Union[str, bytes, bytearray, memoryview]) -> bytes:
     raise ValueError(f"Unsupported value type: {type(value)} - {value}")
 
 
+class ParsedURI(ParseResult):
+    """
+    A `ParseResult` remembering the string it was parsed from, returned
+    by `geturl` and used for serialization instead of `urlunparse`.
+    """
+
+    uri: str
+
+    def geturl(self) -> str:
+        return self.uri
+
+    # The tuples built from other components don't match `uri`
+
+    def _replace(self, /, **kwargs: Any) -> ParseResult:  # type: ignore[override]
+        return ParseResult(*self)._replace(**kwargs)
+
+    @classmethod
+    def _make(cls, iterable: Iterable[str]) -> ParseResult:  # type: ignore[override]
+        return ParseResult._make(iterable)
+
+
+@lru_cache(maxsize=1024)
+def parse_uri(value: str) -> ParseResult:
+    """
+    Parses a URI (reference). Events from the same producers share the same
+    URIs: the results are cached, and the same (immutable) tuple is returned
+    for the same string.
+
+    :param value: The URI
+    :type value: str
+    :return: The parsed URI
+    :rtype: ParseResult
+    """
+    url = urlparse(value)
+    if not isinstance(value, str):
+        return url
+    parsed = ParsedURI(*url)
+    parsed.uri = value
+    return parsed
+
+
 def url_serializer(value: ParseResult) -> str:
+    if isinstance(value, ParsedURI):
+        return value.uri
     return urlunparse(value)
 
 
@@ -90,7 +134,7 @@ def generic_uri_validator(value: str) -> ParseResult:
     if value is None:
         raise ValueError("Field is required")
 
-    return urlparse(value)
+    return parse_uri(value)
 
 
 """
@@ -138,6 +182,16 @@ str_constraint = (
 str_constraint_asyncapi_compat = (
     r"^" r"[^" + class_control + class_nonchar_utf16_range + r"]+" r"$"
 )
+"""
+The `str_constraint` regex without the U+10000-U+10FFFF noncharacters, their
+syntax is not supported by AsyncAPI: https://github.com/asyncapi/asyncapi-react/issues/1071
+
+The values are validated by pydantic-core (in Rust) using this pattern.
+A validator written in Python, even with an ASCII-only fast path, is slower
+on short and non-ASCII values due to the function call overhead, and only
+faster on ASCII values long about 1KB, which attributes rarely are
+(see `benchmark.py`).
+"""
 
 str_constraint_mime_type = (
     r"^"
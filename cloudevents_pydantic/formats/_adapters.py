@@ -0,0 +1,57 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+from functools import lru_cache
+from typing import Any, List
+
+from pydantic import SerializeAsAny, TypeAdapter
+
+# Building a `TypeAdapter` generates the core schema again: the adapters
+# are built once per event class, and shared by the formats and the bindings.
+
+
+@lru_cache(maxsize=None)
+def event_adapter(event_class: Any) -> TypeAdapter[Any]:
+    """
+    Returns the (cached) adapter of an event class.
+
+    :param event_class: The event class, or an (annotated) union of classes
+    :type event_class: Any
+    :return: The adapter validating and serializing single events
+    :rtype: TypeAdapter
+    """
+    return TypeAdapter(event_class)
+
+
+@lru_cache(maxsize=None)
+def batch_adapter(event_class: Any) -> TypeAdapter[List[Any]]:
+    """
+    Returns the (cached) adapter of a list of events of an event class.
+    The events are serialized with their own class, like `model_dump_json()`
+    does, keeping the attributes of subclasses.
+
+    :param event_class: The event class, or an (annotated) union of classes
+    :type event_class: Any
+    :return: The adapter validating and serializing event batches
+    :rtype: TypeAdapter
+    """
+    return TypeAdapter(List[SerializeAsAny[event_class]])  # type: ignore[valid-type]
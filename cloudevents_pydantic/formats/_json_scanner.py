@@ -0,0 +1,430 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import re
+from typing import Any, Collection, Dict, List, Optional, Tuple, Union
+
+from pydantic_core import ValidationError, from_json, to_json
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_NESTED_TOKEN = re.compile(rb'["\[\]{}]')
+_STRING_TOKEN = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[ \t\n\r,\]]")
+_MEMBER_END = re.compile(rb"[ \t\n\r,}]")
+# Members with a short key and a short string (or scalar) value, most of the
+# attributes, are matched at once. Long strings are left to `_string_end`,
+# the character classes of the regex are slow to scan them.
+_SHORT_MEMBER = re.compile(
+    rb'"([^"\\]{0,256})"[ \t\n\r]*:[ \t\n\r]*'
+    rb'("[^"\\]{0,256}"|true|false|null|-?[0-9][0-9.eE+-]*)[ \t\n\r]*([,}])'
+)
+
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_COLON = ord(":")
+_COMMA = ord(",")
+_OBJECT_START = ord("{")
+_OBJECT_END = ord("}")
+_ARRAY_START = ord("[")
+_ARRAY_END = ord("]")
+_WHITESPACE_BYTES = frozenset(b" \t\n\r")
+
+
+def _skip_whitespace(buffer: Union[bytes, bytearray], position: int) -> int:
+    match = _WHITESPACE.match(buffer, position)
+    return match.end() if match else position
+
+
+_EXPECT_ARRAY_START = 0
+_EXPECT_FIRST_ELEMENT = 1
+_EXPECT_ELEMENT = 2
+_IN_ELEMENT = 3
+_EXPECT_SEPARATOR = 4
+_DONE = 5
+
+
+def json_invalid(message: str, value: Union[bytes, bytearray]) -> ValidationError:
+    """
+    Builds the same error pydantic raises when validating malformed JSON,
+    so callers can handle streamed and non-streamed input in the same way.
+    """
+    return ValidationError.from_exception_data(
+        "CloudEvent batch",
+        [
+            {
+                "type": "json_invalid",
+                "loc": (),
+                "input": bytes(value[:100]),
+                "ctx": {"error": message},
+            }
+        ],
+        input_type="json",
+    )
+
+
+class BatchSplitter:
+    """
+    Incrementally splits a JSON array into the raw JSON of its elements.
+
+    Chunks are fed as they arrive, and every element is returned as soon as
+    its closing token has been received. Only the bytes belonging to the
+    element being scanned are retained between calls to `feed`, so memory
+    usage is bounded by the size of a single element (plus one chunk).
+
+    Elements are not parsed, only delimited: invalid element content is left
+    to be reported by the pydantic validation.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._position = 0
+        self._element_start = 0
+        self._depth = 0
+        self._in_string = False
+        self._state = _EXPECT_ARRAY_START
+
+    def feed(self, chunk: Union[bytes, bytearray, memoryview, str]) -> List[bytes]:
+        """
+        Adds a chunk of data and returns the elements completed by it.
+
+        :param chunk: The next chunk of the JSON array
+        :type chunk: Union[bytes, bytearray, memoryview, str]
+        :return: The raw JSON of the completed elements
+        :rtype: List[bytes]
+        """
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        self._buffer += chunk
+        elements = self._scan()
+        self._compact()
+        return elements
+
+    def close(self) -> None:
+        """
+        Signals the end of the input.
+
+        :raises ValidationError: If the JSON array is not complete
+        """
+        if self._state != _DONE:
+            raise json_invalid("EOF while parsing a list", self._buffer)
+
+    def _compact(self) -> None:
+        discard = self._element_start if self._state == _IN_ELEMENT else self._position
+        if discard:
+            del self._buffer[:discard]
+            self._position -= discard
+            self._element_start -= discard
+
+    def _scan(self) -> List[bytes]:
+        buffer = self._buffer
+        elements: List[bytes] = []
+        while True:
+            if self._state == _IN_ELEMENT:
+                end = self._scan_element()
+                if end < 0:
+                    return elements
+                elements.append(bytes(buffer[self._element_start : end]))
+                self._position = end
+                self._state = _EXPECT_SEPARATOR
+                continue
+
+            self._position = _skip_whitespace(buffer, self._position)
+            if self._position >= len(buffer):
+                return elements
+
+            token = buffer[self._position : self._position + 1]
+            if self._state == _EXPECT_ARRAY_START:
+                if token != b"[":
+                    raise json_invalid("expected a JSON array", buffer)
+                self._position += 1
+                self._state = _EXPECT_FIRST_ELEMENT
+            elif self._state == _EXPECT_SEPARATOR:
+                self._position += 1
+                if token == b",":
+                    self._state = _EXPECT_ELEMENT
+                elif token == b"]":
+                    self._state = _DONE
+                else:
+                    raise json_invalid("expected `,` or `]` after list element", buffer)
+            elif self._state == _DONE:
+                raise json_invalid("trailing characters", buffer)
+            elif token == b"]" and self._state == _EXPECT_FIRST_ELEMENT:
+                self._position += 1
+                self._state = _DONE
+            elif token in (b",", b"]"):
+                raise json_invalid("expected value", buffer)
+            else:
+                self._element_start = self._position
+                self._state = _IN_ELEMENT
+
+    def _scan_element(self) -> int:
+        """
+        Advances the scan of the current element.
+
+        :return: The end position of the element, or -1 if more data is needed
+        """
+        buffer = self._buffer
+        position = self._position
+        if position == self._element_start and not self._in_string:
+            if buffer[position : position + 1] not in (b"{", b"[", b'"'):
+                # Scalar value: it ends on the first separator or whitespace
+                match = _SCALAR_END.search(buffer, position)
+                return match.start() if match else -1
+
+        while True:
+            if self._in_string:
+                match = _STRING_TOKEN.search(buffer, position)
+                if match is None or (match.end() >= len(buffer) and match[0] == b"\\"):
+                    # Keep escape sequences split across chunks for the next feed
+                    self._position = match.start() if match else len(buffer)
+                    return -1
+                if match[0] == b"\\":
+                    position = match.end() + 1
+                    continue
+                position = match.end()
+                self._in_string = False
+                if self._depth == 0:
+                    return position
+                continue
+
+            match = _NESTED_TOKEN.search(buffer, position)
+            if match is None:
+                self._position = len(buffer)
+                return -1
+            position = match.end()
+            token = match[0]
+            if token == b'"':
+                self._in_string = True
+            elif token in (b"{", b"["):
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return position
+
+
+Buffer = Union[bytes, bytearray]
+Attributes = Dict[str, str]
+
+PEEK_PARSE_SIZE = 16384
+"""Under this size, the JSON is parsed faster than it is scanned"""
+
+
+class _UnscannableError(Exception):
+    """
+    Raised by the scanner on nested values (objects and arrays), and on small
+    events in a batch, which pydantic-core parses faster
+    """
+
+
+def peek_attributes(
+    buffer: Buffer, names: Collection[str]
+) -> Union[Attributes, List[Attributes]]:
+    """
+    Reads the top level members of a JSON object (or of the objects in
+    a JSON array) as canonical strings, without decoding the other values.
+
+    Strings, of any length, are skipped searching their closing quote.
+    Nested values, and small events, can't be scanned in Python faster
+    than pydantic-core parses them: when the JSON, or the first event of
+    a batch, is smaller than `PEEK_PARSE_SIZE`, or when a nested value
+    is found (i.e. a JSON object as `data`) the JSON is parsed instead.
+
+    :param buffer: The JSON object or array
+    :type buffer: Buffer
+    :param names: The names of the members to read
+    :type names: Collection[str]
+    :return: The members found, for the object or for each object of the array
+    :rtype: Union[Attributes, List[Attributes]]
+    :raises ValueError: If the JSON structure is malformed
+    """
+    if len(buffer) >= PEEK_PARSE_SIZE:
+        try:
+            return _scan_members(buffer, {name.encode(): name for name in names})
+        except _UnscannableError:
+            pass
+    return _parsed_members(from_json(buffer), names)
+
+
+def _scan_members(
+    buffer: Buffer, names: Dict[bytes, str]
+) -> Union[Attributes, List[Attributes]]:
+    position = _skip(buffer, 0)
+    if _byte(buffer, position) != _ARRAY_START:
+        members: Attributes = {}
+        _scan_object(buffer, position, names, members, complete=False)
+        return members
+
+    batch: List[Attributes] = []
+    position = _skip(buffer, position + 1)
+    if _byte(buffer, position) == _ARRAY_END:
+        return batch
+    while True:
+        members = {}
+        start = position
+        position = _scan_object(buffer, position, names, members, complete=True)
+        if not batch and position - start < PEEK_PARSE_SIZE:
+            raise _UnscannableError
+        batch.append(members)
+        position = _skip(buffer, position)
+        token = _byte(buffer, position)
+        if token == _ARRAY_END:
+            return batch
+        if token != _COMMA:
+            raise json_invalid("expected `,` or `]` after list element", buffer)
+        position = _skip(buffer, position + 1)
+
+
+def _scan_object(
+    buffer: Buffer,
+    position: int,
+    names: Dict[bytes, str],
+    members: Attributes,
+    complete: bool,
+) -> int:
+    """
+    Reads the members of the object starting at `position`.
+
+    :return: The end position of the object, unless it is not `complete`
+             and all the members have been found before its end
+    """
+    if _byte(buffer, position) != _OBJECT_START:
+        raise json_invalid("expected a JSON object", buffer)
+    position = _skip(buffer, position + 1)
+    if _byte(buffer, position) == _OBJECT_END:
+        return position + 1
+    while True:
+        match = _SHORT_MEMBER.match(buffer, position)
+        if match:
+            key, end = match[1], match[3]
+            value_start, value_end = match.span(2)
+            position = match.end()
+        else:
+            key, value_start, value_end, position = _member(buffer, position)
+            end = buffer[position : position + 1]
+            position += 1
+        if key in names:
+            canonical = _canonical_string(bytes(buffer[value_start:value_end]))
+            if canonical is not None:
+                members[names[key]] = canonical
+                if not complete and len(members) == len(names):
+                    return position
+        if end == b"}":
+            return position
+        if end != b",":
+            raise json_invalid("expected `,` or `}` after object value", buffer)
+        position = _skip(buffer, position)
+
+
+def _member(buffer: Buffer, position: int) -> Tuple[bytes, int, int, int]:
+    """
+    Reads a member the `_SHORT_MEMBER` regex doesn't match.
+
+    :return: The key, the span of the value and the position following them
+    """
+    if _byte(buffer, position) != _QUOTE:
+        raise json_invalid("key must be a string", buffer)
+    end = _string_end(buffer, position + 1)
+    key = bytes(buffer[position:end])
+    if _BACKSLASH in key:
+        key = from_json(key).encode()
+    else:
+        key = key[1:-1]
+    position = _skip(buffer, end)
+    if _byte(buffer, position) != _COLON:
+        raise json_invalid("expected `:`", buffer)
+    position = _skip(buffer, position + 1)
+    end = _value_end(buffer, position)
+    return key, position, end, _skip(buffer, end)
+
+
+def _byte(buffer: Buffer, position: int) -> int:
+    return buffer[position] if position < len(buffer) else -1
+
+
+def _skip(buffer: Buffer, position: int) -> int:
+    # Most JSON has no whitespace between tokens, the regex is not needed
+    if position < len(buffer) and buffer[position] in _WHITESPACE_BYTES:
+        return _skip_whitespace(buffer, position)
+    return position
+
+
+def _string_end(buffer: Buffer, position: int) -> int:
+    # `position` follows the opening quote
+    while True:
+        end = buffer.find(b'"', position)
+        if end < 0:
+            raise json_invalid("EOF while parsing a string", buffer)
+        backslash = end - 1
+        while buffer[backslash] == _BACKSLASH:
+            backslash -= 1
+        # The quote is escaped by an odd number of backslashes
+        if not (end - 1 - backslash) % 2:
+            return end + 1
+        position = end + 1
+
+
+def _value_end(buffer: Buffer, position: int) -> int:
+    token = _byte(buffer, position)
+    if token == _QUOTE:
+        return _string_end(buffer, position + 1)
+    if token in (_OBJECT_START, _ARRAY_START):
+        raise _UnscannableError
+    match = _MEMBER_END.search(buffer, position)
+    end = match.start() if match else len(buffer)
+    if end == position:
+        raise json_invalid("expected value", buffer)
+    return end
+
+
+def _canonical_string(raw: bytes) -> Optional[str]:
+    if raw[0] == _QUOTE and _BACKSLASH not in raw:
+        return str(raw[1:-1], "utf-8")
+    return _canonical(from_json(raw))
+
+
+def _canonical(value: Any) -> Optional[str]:
+    # JSON numbers and booleans are already in their canonical form
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return None
+    return to_json(value).decode()
+
+
+def _parsed_members(
+    value: Any, names: Collection[str]
+) -> Union[Attributes, List[Attributes]]:
+    if isinstance(value, list):
+        return [_object_members(item, names) for item in value]
+    return _object_members(value, names)
+
+
+def _object_members(value: Any, names: Collection[str]) -> Attributes:
+    if not isinstance(value, dict):
+        raise json_invalid("expected a JSON object", to_json(value))
+    members = {}
+    for name in names:
+        canonical = _canonical(value.get(name))
+        if canonical is not None:
+            members[name] = canonical
+    return members
@@ -24,7 +24,9 @@ from typing import Dict, List, TypeVar
 
 from pydantic import TypeAdapter
 
-from cloudevents_pydantic.events import CloudEvent
+from cloudevents_pydantic.events import CloudEvent, FrozenCloudEvent
+
+from ._adapters import batch_adapter, event_adapter
 
 _T = TypeVar("_T", bound=CloudEvent)
 
@@ -38,11 +40,14 @@ def serialize(event: CloudEvent) -> Dict[str, str]:
     :return: The headers and the body representation of the event
     :rtype: Dict[str, str]
     """
+    if isinstance(event, FrozenCloudEvent):
+        # A copy, callers usually pop the `data`
+        return dict(event.memoized(serialize, event.model_dump))
     return event.model_dump()
 
 
 def deserialize(
-    data: Dict[str, str], event_adapter: TypeAdapter[_T] = TypeAdapter(CloudEvent)
+    data: Dict[str, str], event_adapter: TypeAdapter[_T] = event_adapter(CloudEvent)
 ) -> _T:
     """
     Deserializes an event from a dictionary with canonical values representations.
@@ -59,7 +64,7 @@ def deserialize(
 
 def serialize_batch(
     events: List[_T],
-    batch_adapter: TypeAdapter[List[_T]] = TypeAdapter(List[CloudEvent]),
+    batch_adapter: TypeAdapter[List[_T]] = batch_adapter(CloudEvent),
 ) -> List[Dict[str, str]]:
     """
     Serializes a list of events to dictionaries with canonical values representations.
@@ -76,7 +81,7 @@ def serialize_batch(
 
 def deserialize_batch(
     data: List[Dict[str, str]],
-    batch_adapter: TypeAdapter[List[_T]] = TypeAdapter(List[CloudEvent]),
+    batch_adapter: TypeAdapter[List[_T]] = batch_adapter(CloudEvent),
 ) -> List[_T]:
     """
     Deserializes a list of events from a list of dictionaries with
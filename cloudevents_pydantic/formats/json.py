@@ -20,14 +20,74 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
 #  DEALINGS IN THE SOFTWARE.                                                   =
 # ==============================================================================
-from typing import List, TypeVar
+import base64
+import re
+import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from pydantic import TypeAdapter
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import (
+    ErrorDetails,
+    InitErrorDetails,
+    from_json,
+    to_json,
+)
 
-from ..events import CloudEvent
+from ..events import CloudEvent, FrozenCloudEvent
+from ..events._extensions import class_reference, resolve_class
+from ..events._frozen import JSON as FROZEN_JSON
+from ..events._lazy_data import relocated_error
+from ..events._plan import SPEC_ATTRIBUTES
+from ..events._trusted import TrustedConstructor, trusted_constructor
+from . import _json_scanner
+from ._adapters import batch_adapter, event_adapter
+from ._json_scanner import BatchSplitter
+from .policy import ValidationMode, ValidationPolicy
 
 _T = TypeVar("_T", bound=CloudEvent)
 
+STREAM_CHUNK_SIZE = 64 * 1024
+"""
+Size of the chunks read from file-like objects when deserializing streams.
+"""
+
+
+DEFAULT_PARALLEL_CHUNK_SIZE = 1024 * 1024
+"""
+Approximate size (in bytes) of the ranges of a batch validated by each task
+when deserializing batches in parallel.
+"""
+
+_EVENT_BOUNDARY = re.compile(rb"}\s*,\s*{")
+"""
+The separator between two events of a batch, or between two objects
+nested in a value.
+"""
+
+
+class SupportsRead(Protocol):
+    def read(self, size: int = -1, /) -> bytes: ...
+
+
+JSONData = Union[str, bytes, bytearray, memoryview]
+JSONStream = Union[JSONData, Iterable[JSONData], SupportsRead]
+
 
 def serialize(event: CloudEvent) -> str:
     """
@@ -38,30 +98,196 @@ def serialize(event: CloudEvent) -> str:
     :return: The headers and the body representation of the event
     :rtype: str
     """
+    if isinstance(event, FrozenCloudEvent):
+        return event.memoized(serialize, lambda: serialize_bytes(event).decode())
     # It seems that TypeAdapter is slightly faster than using the event,
     # maybe we should replace this...
     return event.model_dump_json()
 
 
+def serialize_bytes(event: CloudEvent) -> bytes:
+    """
+    Serializes an event in JSON format, returning the encoded bytes without
+    decoding them to `str`.
+
+    :param event: The event object to serialize
+    :type event: CloudEvent
+    :return: The UTF-8 encoded JSON representation of the event
+    :rtype: bytes
+    """
+    if isinstance(event, FrozenCloudEvent):
+        return event.memoized(
+            FROZEN_JSON, lambda: event.__pydantic_serializer__.to_json(event)
+        )
+    return event.__pydantic_serializer__.to_json(event)
+
+
 def deserialize(
-    data: str, event_adapter: TypeAdapter[_T] = TypeAdapter(CloudEvent)
+    data: JSONData, event_adapter: TypeAdapter[_T] = event_adapter(CloudEvent)
 ) -> _T:
     """
     Deserializes an event from JSON format.
 
-    :param data: the JSON representation of the event
-    :type data: str
+    :param data: the JSON representation of the event, as `str` or bytes-like
+    :type data: JSONData
     :param event_adapter: The event class to build
     :type event_adapter: Type[CloudEvent]
     :return: The deserialized event
     :rtype: CloudEvent
     """
-    return event_adapter.validate_json(data)
+    return event_adapter.validate_json(_validation_input(data))
+
+
+class EventView:
+    """
+    A read-only view over the JSON representation of an event, for routing
+    and filtering without validating (and building) the whole event.
+
+    The JSON object is decoded on the first read and the attributes are
+    returned without validation (i.e. `source` is a `str`). Missing
+    attributes are `None`. Attributes shadowed by the view members (i.e. an
+    extension called `raw`) can be read with `get`.
+    """
+
+    __slots__ = ("_event", "_members", "event_class", "raw")
+
+    raw: JSONData
+    """The original JSON representation"""
+    event_class: Any
+    """The event class built by `materialize`"""
+
+    def __init__(self, raw: JSONData, event_class: Any = CloudEvent) -> None:
+        """
+        :param raw: The JSON representation of the event
+        :type raw: JSONData
+        :param event_class: The event class built by `materialize`
+        :type event_class: Type[CloudEvent]
+        """
+        _set_slot(self, "raw", raw)
+        _set_slot(self, "event_class", event_class)
+        _set_slot(self, "_members", None)
+        _set_slot(self, "_event", None)
+
+    def __getattr__(self, name: str) -> Any:
+        if name[0] == "_":
+            raise AttributeError(name)
+        return self.get(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(raw={self.raw!r})"
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        Reads an attribute, without validating it.
+
+        :param name: The attribute name, as in the JSON representation
+        :type name: str
+        :param default: The value returned when the attribute is missing
+        :type default: Any
+        :return: The attribute value, decoded from JSON
+        :rtype: Any
+        :raises ValueError: If the JSON representation is not an object
+        """
+        value = (self._members or self._decode()).get(name)
+        return default if value is None else value
+
+    def materialize(self) -> Any:
+        """
+        Validates the JSON representation and builds the event, once.
+
+        :return: The deserialized event
+        :rtype: CloudEvent
+        :raises ValidationError: If the event is not valid
+        """
+        if self._event is None:
+            event = deserialize(self.raw, event_adapter(self.event_class))
+            _set_slot(self, "_event", event)
+        return self._event
+
+    def to_json(self) -> JSONData:
+        """
+        Returns the JSON representation, to forward the event as it was
+        received.
+
+        :return: The original JSON representation, unchanged
+        :rtype: JSONData
+        """
+        return self.raw
+
+    def _decode(self) -> Dict[str, Any]:
+        members = from_json(_validation_input(self.raw))
+        if not isinstance(members, dict):
+            raise ValueError("Events must be JSON objects")
+        _set_slot(self, "_members", members)
+        return members
+
+
+_set_slot = object.__setattr__
+
+
+def _member(name: str) -> property:
+    # Faster than going through `__getattr__`
+    return property(lambda self: self.get(name), doc=f"The `{name}` attribute")
+
+
+for _name in sorted(SPEC_ATTRIBUTES):
+    setattr(EventView, _name, _member(_name))
+del _name
+
+
+def view(data: JSONData, event_class: Any = CloudEvent) -> EventView:
+    """
+    Builds a read-only view over the JSON representation of an event,
+    see `EventView`.
+
+    :param data: the JSON representation of the event, as `str` or bytes-like
+    :type data: JSONData
+    :param event_class: The event class built by `EventView.materialize`
+    :type event_class: Type[CloudEvent]
+    :return: The view
+    :rtype: EventView
+    """
+    return EventView(data, event_class)
+
+
+def peek_attributes(
+    data: JSONData, names: Collection[str] = ("id", "source", "type")
+) -> Union[Dict[str, str], List[Dict[str, str]]]:
+    """
+    Reads some attributes of an event, or of each event of a batch, from
+    its JSON representation without deserializing it: string values
+    (i.e. `data_base64`) are skipped without being parsed. JSON objects and
+    arrays (i.e. JSON `data`), and small events, are parsed instead, as
+    pydantic-core parses them faster than Python can skip them.
+
+    The attributes are returned as canonical strings, attributes which are
+    missing or `null` are not returned. The JSON is not fully checked,
+    and the attributes are not validated.
+
+    :param data: the JSON representation of the event or of the batch,
+                 as `str` or bytes-like
+    :type data: JSONData
+    :param names: The names of the attributes to read
+    :type names: Collection[str]
+    :return: The attributes, a list of them for each event of a batch
+    :rtype: Union[Dict[str, str], List[Dict[str, str]]]
+    :raises ValueError: If the JSON structure is malformed
+    """
+    if isinstance(data, str):
+        buffer: Union[bytes, bytearray] = data.encode()
+    elif isinstance(data, memoryview):
+        buffer = data.tobytes()
+    else:
+        buffer = data
+    return _json_scanner.peek_attributes(buffer, frozenset(names))
 
 
 def serialize_batch(
     events: List[_T],
-    batch_adapter: TypeAdapter[List[_T]] = TypeAdapter(List[CloudEvent]),
+    batch_adapter: TypeAdapter[List[_T]] = batch_adapter(CloudEvent),
 ) -> str:
     """
     Serializes a list of events in JSON batch format.
@@ -76,18 +302,371 @@ def serialize_batch(
     return batch_adapter.dump_json(events).decode()
 
 
+def serialize_batch_bytes(
+    events: List[_T],
+    batch_adapter: TypeAdapter[List[_T]] = batch_adapter(CloudEvent),
+) -> bytes:
+    """
+    Serializes a list of events in JSON batch format, returning the encoded
+    bytes without decoding them to `str`.
+
+    :param events: The event object to serialize
+    :type events: List[CloudEvent]
+    :param batch_adapter: The pydantic TypeAdapter to use
+    :type: TypeAdapter[List[CloudEvent]]
+    :return: The UTF-8 encoded serialized event batch
+    :rtype: bytes
+    """
+    return batch_adapter.dump_json(events)
+
+
+def serialize_batch_stream(
+    events: Iterable[_T],
+    event_adapter: TypeAdapter[_T] = event_adapter(CloudEvent),
+) -> Iterator[bytes]:
+    """
+    Lazily serializes a list of events in JSON batch format.
+
+    The events are consumed and serialized one at a time, so the output can be
+    sent (i.e. using HTTP chunked transfer encoding) before the batch is complete.
+
+    :param events: The event objects to serialize, can be any iterable
+    :type events: Iterable[CloudEvent]
+    :param event_adapter: The pydantic TypeAdapter to use for each event
+    :type event_adapter: TypeAdapter[CloudEvent]
+    :return: An iterator over the chunks of the serialized event batch
+    :rtype: Iterator[bytes]
+    """
+    separator = b"["
+    for event in events:
+        yield separator + event_adapter.dump_json(event)
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
+
+
 def deserialize_batch(
-    data: str,
-    batch_adapter: TypeAdapter[List[_T]] = TypeAdapter(List[CloudEvent]),
+    data: JSONData,
+    batch_adapter: TypeAdapter[List[_T]] = batch_adapter(CloudEvent),
 ) -> List[_T]:
     """
     Deserializes a list of events from JSON batch format.
 
-    :param data: The JSON representation of the event batch
-    :type data: str
+    :param data: The JSON representation of the event batch, as `str` or bytes-like
+    :type data: JSONData
     :param batch_adapter: The pydantic TypeAdapter to use
     :type: TypeAdapter[List[CloudEvent]]
     :return: The deserialized event batch
     :rtype: List[CloudEvent]
     """
-    return batch_adapter.validate_json(data)
+    return batch_adapter.validate_json(_validation_input(data))
+
+
+def deserialize_batch_stream(
+    data: JSONStream,
+    event_adapter: TypeAdapter[_T] = event_adapter(CloudEvent),
+) -> Iterator[_T]:
+    """
+    Lazily deserializes a list of events from JSON batch format.
+
+    The batch is read incrementally and every event is validated and yielded
+    as soon as it has been completely received, so only one event at a time
+    is kept in memory.
+
+    :param data: The JSON representation of the event batch, either as a whole,
+                 as an iterable of chunks or as a binary file-like object
+    :type data: JSONStream
+    :param event_adapter: The pydantic TypeAdapter to use for each event
+    :type event_adapter: TypeAdapter[CloudEvent]
+    :return: An iterator over the deserialized events
+    :rtype: Iterator[CloudEvent]
+    """
+    splitter = BatchSplitter()
+    for chunk in _iter_chunks(data):
+        for element in splitter.feed(chunk):
+            yield event_adapter.validate_json(element)
+    splitter.close()
+
+
+async def deserialize_batch_async_stream(
+    data: AsyncIterable[JSONData],
+    event_adapter: TypeAdapter[_T] = event_adapter(CloudEvent),
+) -> AsyncIterator[_T]:
+    """
+    Lazily deserializes a list of events from an asynchronous JSON batch stream
+    (i.e. the body stream of an ASGI request).
+
+    :param data: The JSON representation of the event batch as async chunks
+    :type data: AsyncIterable[JSONData]
+    :param event_adapter: The pydantic TypeAdapter to use for each event
+    :type event_adapter: TypeAdapter[CloudEvent]
+    :return: An async iterator over the deserialized events
+    :rtype: AsyncIterator[CloudEvent]
+    """
+    splitter = BatchSplitter()
+    async for chunk in data:
+        for element in splitter.feed(chunk):
+            yield event_adapter.validate_json(element)
+    splitter.close()
+
+
+def deserialize_batch_parallel(
+    data: JSONData,
+    event_class: Any = CloudEvent,
+    executor: Optional[Executor] = None,
+    chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+) -> List[Any]:
+    """
+    Deserializes a list of events from JSON batch format, validating ranges of
+    about `chunk_size` bytes in parallel.
+
+    The batch is split, without parsing it, at the first `},{` after every
+    `chunk_size` bytes: a split inside a value makes its range invalid JSON,
+    and as for invalid events the whole batch is then validated by
+    `deserialize_batch`. The result, and the `ValidationError` raised for
+    invalid events, are the same produced by `deserialize_batch`. Only worth
+    it for very large batches, as the validated events need to be
+    transferred back from the workers.
+
+    :param data: The JSON representation of the event batch
+    :type data: JSONData
+    :param event_class: The event class to build, it needs to be importable
+                        by the workers when using a process pool (or built
+                        by `with_extensions` from an importable class)
+    :type event_class: Type[CloudEvent]
+    :param executor: The executor to use. Defaults to a thread pool, created
+                     once and shared by all the calls, on free-threaded
+                     python. Otherwise the batch is validated serially:
+                     unpickling the events validated by worker processes
+                     costs more than validating them, unless validation is
+                     particularly expensive (i.e. custom validators).
+    :type executor: Optional[Executor]
+    :param chunk_size: The approximate size, in bytes, of the ranges
+                       validated by each task
+    :type chunk_size: int
+    :return: The deserialized event batch
+    :rtype: List[CloudEvent]
+    """
+    data = _validation_input(data)
+    executor = executor or _default_executor()
+    if executor is None:
+        return deserialize_batch(data, batch_adapter(event_class))
+    buffer = data.encode() if isinstance(data, str) else data
+    ranges = _split_ranges(buffer, chunk_size)
+    if len(ranges) <= 1:
+        return deserialize_batch(data, batch_adapter(event_class))
+
+    reference = class_reference(event_class)
+    results = executor.map(_validate_range, [reference] * len(ranges), ranges)
+    events: List[Any] = []
+    for range_events in results:
+        if range_events is None:
+            # Reports the errors with their position in the whole batch
+            return deserialize_batch(data, batch_adapter(event_class))
+        events.extend(range_events)
+    return events
+
+
+def deserialize_with_policy(
+    data: JSONData, policy: ValidationPolicy, event_class: Any = CloudEvent
+) -> Any:
+    """
+    Deserializes an event from JSON format, validating it only when required
+    by the policy. Events that are not validated are built with
+    `CloudEvent.from_trusted`.
+
+    :param data: the JSON representation of the event, as `str` or bytes-like
+    :type data: JSONData
+    :param policy: The validation policy, it counts the processed events
+    :type policy: ValidationPolicy
+    :param event_class: The event class to build, events are always validated
+                        when it is not a `CloudEvent` subclass (i.e. a union)
+    :type event_class: Type[CloudEvent]
+    :return: The deserialized event
+    :rtype: CloudEvent
+    """
+    data = _validation_input(data)
+    if _skips_validation(policy, event_class):
+        try:
+            values = from_json(data)
+        except ValueError:
+            values = None
+        if values is not None and not policy.should_validate(values):
+            policy.record(trusted=1)
+            return _trusted_event(trusted_constructor(event_class), values)
+    try:
+        event = event_adapter(event_class).validate_json(data)
+    except ValidationError:
+        policy.record(validated=1, failed=1)
+        raise
+    policy.record(validated=1)
+    return event
+
+
+def deserialize_batch_with_policy(
+    data: JSONData, policy: ValidationPolicy, event_class: Any = CloudEvent
+) -> List[Any]:
+    """
+    Deserializes a list of events from JSON batch format, validating only the
+    events required by the policy. Events that are not validated are built
+    with `CloudEvent.from_trusted`.
+
+    Invalid events raise the same `ValidationError` produced by
+    `deserialize_batch`, error locations refer to the position in the batch.
+
+    :param data: The JSON representation of the event batch, as `str` or
+                 bytes-like
+    :type data: JSONData
+    :param policy: The validation policy, it counts the processed events
+    :type policy: ValidationPolicy
+    :param event_class: The event class to build, events are always validated
+                        when it is not a `CloudEvent` subclass (i.e. a union)
+    :type event_class: Type[CloudEvent]
+    :return: The deserialized event batch
+    :rtype: List[CloudEvent]
+    """
+    data = _validation_input(data)
+    if not _skips_validation(policy, event_class):
+        return _validate_batch(data, policy, event_class)
+
+    try:
+        values = from_json(data)
+    except ValueError:
+        values = None
+    if not isinstance(values, list):
+        # Let the validation report the issue
+        return _validate_batch(data, policy, event_class)
+    sampled = [
+        index for index, value in enumerate(values) if policy.should_validate(value)
+    ]
+    if sampled:
+        validated = _validate_batch(
+            to_json([values[index] for index in sampled]),
+            policy,
+            event_class,
+            sampled,
+        )
+        for index, event in zip(sampled, validated):
+            values[index] = event
+    sampled_events = set(sampled)
+    construct = trusted_constructor(event_class)
+    events = [
+        value if index in sampled_events else _trusted_event(construct, value)
+        for index, value in enumerate(values)
+    ]
+    policy.record(trusted=len(events) - len(sampled))
+    return events
+
+
+def _skips_validation(policy: ValidationPolicy, event_class: Any) -> bool:
+    # Only single event classes can be built without validation
+    return (
+        policy.mode is not ValidationMode.FULL
+        and isinstance(event_class, type)
+        and issubclass(event_class, CloudEvent)
+    )
+
+
+def _validate_batch(
+    data: Union[str, bytes, bytearray],
+    policy: ValidationPolicy,
+    event_class: Any,
+    positions: Optional[List[int]] = None,
+) -> List[Any]:
+    try:
+        events = batch_adapter(event_class).validate_json(data)
+    except ValidationError as e:
+        errors = e.errors(include_url=False)
+        failed = len({error["loc"][:1] for error in errors})
+        if positions is not None:
+            validated = len(positions)
+        else:
+            # All the events of a batch array go through validation
+            try:
+                values = from_json(data)
+            except ValueError:
+                values = None
+            validated = len(values) if isinstance(values, list) else failed
+        policy.record(validated=validated, failed=failed)
+        if positions is None:
+            raise
+        raise ValidationError.from_exception_data(
+            e.title,
+            [
+                _line_error(error, positions[cast(int, error["loc"][0])])
+                for error in errors
+            ],
+            input_type="json",
+        ) from None
+    policy.record(validated=len(events))
+    return events
+
+
+def _trusted_event(construct: TrustedConstructor, values: Any) -> Any:
+    if not isinstance(values, dict):
+        raise ValueError("Events must be JSON objects")
+    if values.get("data_base64"):
+        values["data"] = base64.b64decode(values.pop("data_base64"))
+    return construct(values)
+
+
+def _split_ranges(data: Union[bytes, bytearray], chunk_size: int) -> List[bytes]:
+    # The ranges of elements of the batch array, without the brackets
+    start = data.find(b"[") + 1
+    end = data.rfind(b"]")
+    if (
+        start == 0
+        or end < start
+        or data[: start - 1].strip()
+        or data[end + 1 :].strip()
+    ):
+        return []
+    ranges = []
+    while (
+        boundary := _EVENT_BOUNDARY.search(data, start + chunk_size, end)
+    ) is not None:
+        ranges.append(bytes(data[start : boundary.start() + 1]))
+        start = boundary.end() - 1
+    ranges.append(bytes(data[start:end]))
+    return ranges
+
+
+def _validate_range(reference: Any, payload: bytes) -> Optional[List[Any]]:
+    # Runs in the workers: the errors are raised again, by the serial
+    # validation of the whole batch, with their position in the batch.
+    adapter = batch_adapter(resolve_class(reference))
+    try:
+        return adapter.validate_json(b"[" + payload + b"]")
+    except ValidationError:
+        return None
+
+
+def _line_error(error: ErrorDetails, position: int) -> InitErrorDetails:
+    # Batch error locations always start with the position in the batch
+    _, *loc = error["loc"]
+    return relocated_error(error, (position, *loc))
+
+
+@lru_cache(maxsize=None)
+def _default_executor() -> Optional[Executor]:
+    # Only threads share the validated events with the caller, the events
+    # validated by processes are pickled: see `deserialize_batch_parallel`
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    return None if gil_enabled() else ThreadPoolExecutor()
+
+
+def _validation_input(data: JSONData) -> Union[str, bytes, bytearray]:
+    # pydantic doesn't accept memoryview objects, this is the only case
+    # where we need a copy of the input.
+    if isinstance(data, memoryview):
+        return data.tobytes()
+    return data
+
+
+def _iter_chunks(data: JSONStream) -> Iterator[JSONData]:
+    if isinstance(data, (bytes, bytearray, memoryview, str)):
+        yield data
+    elif hasattr(data, "read"):
+        while chunk := data.read(STREAM_CHUNK_SIZE):
+            yield chunk
+    else:
+        yield from data
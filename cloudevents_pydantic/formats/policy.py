@@ -0,0 +1,156 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import threading
+import zlib
+from enum import Enum
+from typing import Any, NamedTuple, Optional
+
+
+class ValidationMode(str, Enum):
+    FULL = "full"
+    TRUSTED = "trusted"
+    SAMPLED = "sampled"
+
+
+class ValidationCounters(NamedTuple):
+    validated: int
+    """Number of events that went through full validation"""
+    failed: int
+    """Number of validated events that failed validation"""
+    trusted: int
+    """Number of events built without validation"""
+
+
+class ValidationPolicy:
+    """
+    Decides which deserialized events are fully validated and which ones are
+    built from trusted producers without checks (see `CloudEvent.from_trusted`),
+    keeping count of both.
+
+    * `ValidationMode.FULL` validates every event
+    * `ValidationMode.TRUSTED` validates no event
+    * `ValidationMode.SAMPLED` validates 1 event every `sample_every`, or the
+      `sample_percent` % of the events, selected by the hash of their `id`
+      (the same events are always validated, also across processes)
+
+    Instances are thread-safe and can be shared by multiple handlers.
+    """
+
+    mode: ValidationMode
+    sample_every: Optional[int]
+    sample_percent: Optional[float]
+
+    def __init__(
+        self,
+        mode: ValidationMode = ValidationMode.FULL,
+        sample_every: Optional[int] = None,
+        sample_percent: Optional[float] = None,
+    ) -> None:
+        """
+        :param mode: The validation mode
+        :type mode: ValidationMode
+        :param sample_every: Validate 1 event every `sample_every` events,
+                             in sampled mode
+        :type sample_every: Optional[int]
+        :param sample_percent: Validate this percentage of the events,
+                               in sampled mode
+        :type sample_percent: Optional[float]
+        """
+        mode = ValidationMode(mode)
+        if mode is ValidationMode.SAMPLED:
+            if (sample_every is None) == (sample_percent is None):
+                raise ValueError(
+                    "Sampled validation requires one of sample_every and sample_percent"
+                )
+            if sample_every is not None and sample_every < 1:
+                raise ValueError("sample_every must be a positive number")
+            if sample_percent is not None and not 0 <= sample_percent <= 100:
+                raise ValueError("sample_percent must be between 0 and 100")
+        elif sample_every is not None or sample_percent is not None:
+            raise ValueError(f"Sampling is not supported in {mode.value} mode")
+        self.mode = mode
+        self.sample_every = sample_every
+        self.sample_percent = sample_percent
+        # Hash values below the threshold are validated
+        self._threshold = round((sample_percent or 0) * 100)
+        self._lock = threading.Lock()
+        self._seen = 0
+        self._validated = 0
+        self._failed = 0
+        self._trusted = 0
+
+    @property
+    def counters(self) -> ValidationCounters:
+        """
+        The events counted since the policy was created (or since the last
+        `reset_counters` call).
+        """
+        return ValidationCounters(self._validated, self._failed, self._trusted)
+
+    def reset_counters(self) -> ValidationCounters:
+        """
+        Resets the counters to zero.
+
+        :return: The counters before the reset
+        :rtype: ValidationCounters
+        """
+        with self._lock:
+            counters = self.counters
+            self._validated = self._failed = self._trusted = 0
+        return counters
+
+    def should_validate(self, values: Any) -> bool:
+        """
+        Decides if an event needs to be validated.
+
+        :param values: The event attributes, as decoded from JSON
+        :type values: Any
+        :return: True if the event has to be validated
+        :rtype: bool
+        """
+        if self.mode is not ValidationMode.SAMPLED:
+            return self.mode is ValidationMode.FULL
+        if self.sample_every is not None:
+            with self._lock:
+                self._seen += 1
+                return self._seen % self.sample_every == 1 % self.sample_every
+        if not isinstance(values, dict) or not isinstance(values.get("id"), str):
+            # Not a valid event, let the validation report the issue
+            return True
+        return zlib.crc32(values["id"].encode()) % 10_000 < self._threshold
+
+    def record(self, validated: int = 0, failed: int = 0, trusted: int = 0) -> None:
+        """
+        Adds events to the counters.
+
+        :param validated: Number of validated events
+        :type validated: int
+        :param failed: Number of validated events that failed validation
+        :type failed: int
+        :param trusted: Number of events built without validation
+        :type trusted: int
+        """
+        with self._lock:
+            self._validated += validated
+            self._failed += failed
+            self._trusted += trusted
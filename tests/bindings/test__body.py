@@ -0,0 +1,247 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import json
+import warnings
+from typing import Annotated, Any, Literal, Union
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from cloudevents_pydantic.bindings._body import (
+    decode_body,
+    encode_body,
+    lazy_data_adapter,
+    lazy_data_event,
+)
+from cloudevents_pydantic.events import CloudEvent
+from cloudevents_pydantic.events._lazy_data import LazyData, LazyDataDescriptor
+from cloudevents_pydantic.events.fields.types import Binary
+
+attributes = {
+    "type": "com.example.string",
+    "source": "https://example.com/event-producer",
+    "id": "id",
+    "specversion": "1.0",
+}
+
+
+@pytest.mark.parametrize(
+    ["body", "content_type", "expected"],
+    [
+        pytest.param(b'{"a": 1}', "application/json", {"a": 1}, id="json"),
+        pytest.param(
+            memoryview(b"[1]"), "application/vnd.api+json", [1], id="json-suffix"
+        ),
+        pytest.param(
+            bytearray(b"1"), "Application/JSON; charset=utf-8", 1, id="json-case"
+        ),
+        pytest.param("text".encode(), "text/plain", "text", id="text"),
+        pytest.param(
+            "tèxt".encode("latin-1"),
+            'text/plain; format=flowed; charset="ISO-8859-1"',
+            "tèxt",
+            id="text-charset",
+        ),
+        pytest.param(
+            memoryview("tèxt".encode()),
+            "application/xml; charset=utf-8",
+            "tèxt",
+            id="charset",
+        ),
+        pytest.param(b"\x00\x01", "application/octet-stream", b"\x00\x01", id="raw"),
+        pytest.param("already text", "application/json", "already text", id="str"),
+        pytest.param(None, "application/json", None, id="none"),
+        pytest.param(b"body", None, b"body", id="no-content-type"),
+    ],
+)
+def test_decode_body(body, content_type, expected):
+    assert decode_body(body, content_type) == expected
+
+
+def test_decode_body_keeps_raw_bodies():
+    body = memoryview(b"\x00\x01")
+
+    assert decode_body(body, "image/png") is body
+
+
+@pytest.mark.parametrize(
+    ["data", "content_type", "expected"],
+    [
+        pytest.param({"a": [1]}, "application/json", b'{"a":[1]}', id="json"),
+        pytest.param(1, "application/vnd.api+json", b"1", id="json-suffix"),
+        pytest.param([True], "Application/JSON; charset=utf-8", b"[true]", id="case"),
+        pytest.param("text", "text/plain", b"text", id="text"),
+        pytest.param(
+            "tèxt",
+            'text/plain; format=flowed; charset="ISO-8859-1"',
+            "tèxt".encode("latin-1"),
+            id="text-charset",
+        ),
+        pytest.param('{"a": 1}', "application/json", b'{"a": 1}', id="json-text"),
+        pytest.param(b"\x00\x01", "application/octet-stream", b"\x00\x01", id="raw"),
+        pytest.param(None, "application/json", None, id="none"),
+    ],
+)
+def test_encode_body(data, content_type, expected):
+    assert encode_body(data, content_type) == expected
+    if not isinstance(data, str):
+        assert decode_body(expected, content_type) == data
+
+
+def test_encode_body_keeps_raw_bodies():
+    body = memoryview(b"\x00\x01")
+
+    assert encode_body(body, "image/png") is body
+
+
+@pytest.mark.parametrize("content_type", ["text/plain", None])
+def test_encode_body_fails_without_representation(content_type):
+    with pytest.raises(ValueError, match="Can't encode dict data"):
+        encode_body({"a": 1}, content_type)
+
+
+class Payload(BaseModel):
+    a: int
+
+
+class PayloadEvent(CloudEvent):
+    type: Literal["payload"]
+    data: Payload
+
+
+class BinaryEvent(CloudEvent):
+    type: Literal["binary"]
+    data: Binary
+
+
+class ExtensionEvent(CloudEvent):
+    model_config = ConfigDict(extra="allow")
+
+
+def lazy(event_class: Any, body: Any, **values: Any) -> CloudEvent:
+    adapter = lazy_data_adapter(event_class)
+    return lazy_data_event(adapter.validate_python({**attributes, **values}), body)
+
+
+def test_lazy_data_event():
+    event = lazy(CloudEvent, b'{"a": 1}', datacontenttype="application/json")
+
+    assert type(event) is CloudEvent
+    assert isinstance(event.__dict__["data"], LazyData)
+    assert event.data == {"a": 1}
+    assert event.model_fields_set == {*attributes, "datacontenttype"}
+
+
+def test_lazy_data_event_installs_the_descriptor():
+    class LazyEvent(CloudEvent):
+        pass
+
+    assert "data" not in vars(LazyEvent)
+    event = lazy(LazyEvent, b"text", datacontenttype="text/plain")
+
+    assert isinstance(vars(LazyEvent)["data"], LazyDataDescriptor)
+    assert event.data == "text"
+
+
+def test_lazy_data_event_validates_data_on_access():
+    event = lazy(
+        PayloadEvent, b'{"a": 1}', type="payload", datacontenttype="application/json"
+    )
+    assert type(event) is PayloadEvent
+    assert event.data == Payload(a=1)
+
+    event = lazy(
+        PayloadEvent, b'{"a": "x"}', type="payload", datacontenttype="application/json"
+    )
+    with pytest.raises(ValidationError) as e:
+        event.data
+
+    # Raised as the validation of the event would
+    with pytest.raises(ValidationError) as expected:
+        PayloadEvent(**{**attributes, "type": "payload"}, data={"a": "x"})
+    assert e.value.title == expected.value.title == "PayloadEvent"
+    assert e.value.errors() == expected.value.errors()
+    assert e.value.errors()[0]["loc"] == ("data", "a")
+
+
+@pytest.mark.parametrize(
+    "serialize",
+    [
+        lambda event: event.model_dump(),
+        lambda event: json.loads(event.model_dump_json()),
+    ],
+)
+def test_lazy_data_event_serializes_typed_data(serialize):
+    event = lazy(
+        PayloadEvent, b'{"a": 1}', type="payload", datacontenttype="application/json"
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        serialized = serialize(event)
+
+    assert serialized["data"] == {"a": 1}
+    assert serialized == serialize(
+        PayloadEvent(
+            **{**attributes, "type": "payload"},
+            datacontenttype="application/json",
+            data=Payload(a=1),
+        )
+    )
+
+
+def test_lazy_data_event_validates_attributes():
+    with pytest.raises(ValidationError):
+        lazy(PayloadEvent, b"{}", type="other", datacontenttype="application/json")
+
+
+def test_lazy_data_event_with_discriminated_union():
+    event_class = Annotated[
+        Union[PayloadEvent, BinaryEvent], Field(discriminator="type")
+    ]
+
+    event = lazy(event_class, b"\x00", type="binary", datacontenttype="image/png")
+    assert type(event) is BinaryEvent
+    assert event.data == b"\x00"
+
+    event = lazy(
+        event_class, b'{"a": 1}', type="payload", datacontenttype="application/json"
+    )
+    assert type(event) is PayloadEvent
+    assert event.data == Payload(a=1)
+
+
+def test_lazy_data_event_with_union():
+    event = lazy(
+        Union[BinaryEvent, None], b"\x00", type="binary", datacontenttype="image/png"
+    )
+
+    assert type(event) is BinaryEvent
+
+
+def test_lazy_data_event_with_extensions():
+    event = lazy(ExtensionEvent, b"body", datacontenttype="text/plain", ext="value")
+
+    assert type(event) is ExtensionEvent
+    assert event.ext == "value"
+    assert event.data == "body"
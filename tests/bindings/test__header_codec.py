@@ -0,0 +1,90 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+from urllib.parse import quote, unquote
+
+import pytest
+
+from cloudevents_pydantic.bindings._header_codec import (
+    HTTP_SAFE_CHARS,
+    canonical_string,
+    decode_header_value,
+    encode_header_value,
+)
+from cloudevents_pydantic.events.fields.types import SpecVersion
+
+values = [
+    "",
+    "clean",
+    "https://example.com/event-producer?a=b&c=d#fragment",
+    "Euro € 😀",
+    ' "quoted" 100% ',
+    "".join(map(chr, range(0, 256))),
+    "mixed ascii, ünïcödé and 🤦 emoji",
+]
+
+
+@pytest.mark.parametrize("value", values)
+def test_encoding_matches_urllib_quote(value):
+    assert encode_header_value(value) == quote(value, safe=HTTP_SAFE_CHARS)
+
+
+@pytest.mark.parametrize("value", values)
+def test_decoding_roundtrip(value):
+    encoded = encode_header_value(value)
+    assert decode_header_value(encoded) == value
+    assert decode_header_value(encoded) == unquote(encoded, errors="strict")
+
+
+def test_safe_values_are_not_copied():
+    value = "".join(["com.example.", "type"])
+    assert encode_header_value(value) is value
+    assert decode_header_value(value) is value
+
+
+def test_str_subclasses_are_encoded_as_str():
+    encoded = encode_header_value(SpecVersion.v1_0)
+
+    assert type(encoded) is str
+    assert encoded == "1.0"
+
+
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [
+        ("text", "text"),
+        (SpecVersion.v1_0, "1.0"),
+        (3, "3"),
+        (True, "true"),
+        (False, "false"),
+    ],
+)
+def test_canonical_string(value, expected):
+    string = canonical_string(value)
+
+    assert type(string) is str
+    assert string == expected
+
+
+def test_encoding_fails_on_unpaired_surrogates():
+    with pytest.raises(UnicodeEncodeError):
+        encode_header_value("test_\ud800")
@@ -0,0 +1,177 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+from typing import Annotated, Literal, Union
+from wsgiref.headers import Headers
+
+import pytest
+from pydantic import ConfigDict, Field
+
+from cloudevents_pydantic.bindings._header_map import (
+    HeaderMap,
+    compile_header_map,
+    get_content_type,
+)
+from cloudevents_pydantic.events import CloudEvent
+
+
+class ExtensionEvent(CloudEvent):
+    type: Literal["extension"]
+    someextension: str
+
+
+class OtherEvent(CloudEvent):
+    type: Literal["other"]
+    otherextension: str
+
+
+expected_attributes = {
+    "id": "123",
+    "source": "https://example.com/event-producer",
+    "datacontenttype": "text/plain",
+    "subject": "Euro €",
+}
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        pytest.param(
+            {
+                "ce-id": "123",
+                "ce-source": "https://example.com/event-producer",
+                "content-type": "text/plain",
+                "ce-subject": "Euro%20%E2%82%AC",
+                "x-ignored": "value",
+            },
+            id="dict",
+        ),
+        pytest.param(
+            {
+                "Ce-Id": "123",
+                "CE-SOURCE": "https://example.com/event-producer",
+                "Content-Type": "text/plain",
+                "ce-Subject": "Euro%20%E2%82%AC",
+                "X-Ignored": "value",
+            },
+            id="dict-mixed-case",
+        ),
+        pytest.param(
+            Headers(
+                [
+                    ("Ce-Id", "123"),
+                    ("Ce-Source", "https://example.com/event-producer"),
+                    ("Content-Type", "text/plain"),
+                    ("Ce-Subject", "Euro%20%E2%82%AC"),
+                    ("X-Ignored", "value"),
+                ]
+            ),
+            id="multi-dict",
+        ),
+        pytest.param(
+            [
+                (b"ce-id", b"123"),
+                (b"ce-source", b"https://example.com/event-producer"),
+                (b"content-type", b"text/plain"),
+                (b"Ce-Subject", b"Euro%20%E2%82%AC"),
+                (b"x-ignored", b"value"),
+            ],
+            id="asgi",
+        ),
+        pytest.param(
+            [
+                ("ce-id", "123"),
+                ("ce-source", "https://example.com/event-producer"),
+                ("content-type", "text/plain"),
+                ("ce-subject", "Euro%20%E2%82%AC"),
+            ],
+            id="str-pairs",
+        ),
+    ],
+)
+def test_attributes_from_headers(headers):
+    assert compile_header_map(CloudEvent).attributes(headers) == expected_attributes
+
+
+def test_unknown_ce_headers_are_mapped_by_name():
+    header_map = HeaderMap(CloudEvent.model_fields)
+
+    assert header_map.attributes(
+        [("Ce-SomeExtension", "value"), (b"ce-otherextension", b"other")]
+    ) == {"someextension": "value", "otherextension": "other"}
+
+
+def test_data_headers_are_ignored():
+    header_map = HeaderMap(CloudEvent.model_fields)
+
+    assert (
+        header_map.attributes({"ce-data": "value", "ce-datacontenttype": "text/plain"})
+        == {}
+    )
+
+
+def test_compile_header_map_is_cached_per_event_class():
+    assert compile_header_map(ExtensionEvent) is compile_header_map(ExtensionEvent)
+    assert compile_header_map(ExtensionEvent) is not compile_header_map(CloudEvent)
+
+
+@pytest.mark.parametrize(
+    "event_class",
+    [
+        ExtensionEvent,
+        Annotated[
+            Union[ExtensionEvent, OtherEvent],
+            Field(discriminator="type"),
+        ],
+    ],
+)
+def test_compile_header_map_includes_model_fields(event_class):
+    header_map = compile_header_map(event_class)
+
+    assert header_map._names["ce-someextension"] == "someextension"
+    assert header_map._raw_names[b"ce-someextension"] == "someextension"
+    assert header_map._names["ce-id"] == "id"
+
+
+def test_compile_header_map_ignores_non_event_types():
+    class NotAnEvent:
+        model_config = ConfigDict()
+
+    assert compile_header_map(Union[CloudEvent, NotAnEvent])._names == (
+        compile_header_map(CloudEvent)._names
+    )
+
+
+@pytest.mark.parametrize(
+    ["headers", "expected"],
+    [
+        ({"content-type": "text/plain"}, "text/plain"),
+        ({"Content-Type": "text/plain"}, "text/plain"),
+        (Headers([("CONTENT-TYPE", "text/plain")]), "text/plain"),
+        ([(b"x-other", b"value"), (b"content-type", b"text/plain")], "text/plain"),
+        ([("Content-Type", "text/plain")], "text/plain"),
+        ({"x-other": "value"}, None),
+        ([(b"x-other", b"value")], None),
+    ],
+)
+def test_get_content_type(headers, expected):
+    assert get_content_type(headers) == expected
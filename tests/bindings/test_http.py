@@ -20,14 +20,32 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
 #  DEALINGS IN THE SOFTWARE.                                                   =
 # ==============================================================================
-from typing import List
-from unittest.mock import MagicMock, call, patch
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+from unittest.mock import MagicMock
 
 import pytest
-from pydantic import Field, TypeAdapter
-
-from cloudevents_pydantic.bindings.http import HTTPComponents, HTTPHandler
+from pydantic import Field, TypeAdapter, ValidationError
+from typing_extensions import TypedDict
+
+from cloudevents_pydantic.bindings.http import (
+    AsyncHTTPHandler,
+    ContentMode,
+    HTTPComponents,
+    HTTPHandler,
+    content_mode,
+    read_body,
+)
 from cloudevents_pydantic.events import CloudEvent
+from cloudevents_pydantic.events._lazy_data import LazyData
+from cloudevents_pydantic.formats._adapters import batch_adapter, event_adapter
+from cloudevents_pydantic.formats.policy import (
+    ValidationCounters,
+    ValidationMode,
+    ValidationPolicy,
+)
 
 minimal_attributes = {
     "type": "com.example.string",
@@ -46,6 +64,10 @@ valid_json = '{"data":null,"source":"https://example.com/event-producer","id":"b
 valid_json_batch = '[{"data":null,"source":"https://example.com/event-producer","id":"b96267e2-87be-4f7a-b87c-82f64360d954","type":"com.example.string","specversion":"1.0","time":"2022-07-16T12:03:20.519216+04:00","subject":null,"datacontenttype":null,"dataschema":null}]'
 
 
+class SomeData(TypedDict):
+    value: int
+
+
 class SomeEvent(CloudEvent):
     some_attr: str = Field(default="some_value")
 
@@ -56,31 +78,32 @@ some_event_json = '{"data":null,"source":"https://example.com/event-producer","i
 some_event_json_batch = '[{"data":null,"source":"https://example.com/event-producer","id":"b96267e2-87be-4f7a-b87c-82f64360d954","type":"com.example.string","specversion":"1.0","time":"2022-07-16T12:03:20.519216+04:00","subject":null,"datacontenttype":null,"dataschema":null,"some_attr":"some_value"}]'
 
 
-@pytest.fixture
-def type_adapter_init_mock():
-    with patch.object(TypeAdapter, "__init__", return_value=None) as mocked_function:
-        yield mocked_function
+def test_initialization_defaults_to_cloudevents():
+    handler = HTTPHandler()
 
+    assert handler.event_adapter is event_adapter(CloudEvent)
+    assert handler.batch_adapter is batch_adapter(CloudEvent)
 
-def test_initialization_defaults_to_cloudevents(type_adapter_init_mock: MagicMock):
-    HTTPHandler()
-    type_adapter_init_mock.assert_has_calls(
-        [
-            call(CloudEvent),
-            call(List[CloudEvent]),
-        ]
-    )
+
+def test_initialization_uses_provided_event_class():
+    handler = HTTPHandler(event_class=SomeEvent)
+
+    assert handler.event_adapter is event_adapter(SomeEvent)
+    assert handler.batch_adapter is batch_adapter(SomeEvent)
+    assert HTTPHandler(event_class=SomeEvent).event_adapter is handler.event_adapter
 
 
-def test_initialization_uses_provided_event_class(type_adapter_init_mock: MagicMock):
-    HTTPHandler(event_class=SomeEvent)
-    type_adapter_init_mock.assert_has_calls(
-        [
-            call(SomeEvent),
-            call(List[SomeEvent]),
-        ]
+def test_initialization_uses_parametrized_event_class():
+    handler = HTTPHandler(event_class=CloudEvent[SomeData])
+
+    event = handler.from_json(
+        '{"data":{"value":"1"},"source":"https://example.com/event-producer","id":"1","type":"com.example.string","specversion":"1.0"}'
     )
 
+    assert type(event) is CloudEvent[SomeData]
+    assert event.data == {"value": 1}
+    assert handler.event_adapter is HTTPHandler(CloudEvent[SomeData]).event_adapter
+
 
 @pytest.mark.parametrize(
     "event, expected_output",
@@ -112,6 +135,54 @@ def test_to_json_batch(event, expected_output, json_serialize_batch_spy):
     assert json_repr == expected_output
 
 
+def test_to_json_bytes():
+    handler = HTTPHandler()
+
+    headers, body = handler.to_json_bytes(SomeEvent(**test_attributes))
+    assert headers == {"content-type": "application/cloudevents+json; charset=UTF-8"}
+    assert body == some_event_json.encode()
+
+
+def test_to_json_batch_bytes():
+    handler = HTTPHandler()
+
+    headers, body = handler.to_json_batch_bytes([SomeEvent(**test_attributes)])
+    assert headers == {
+        "content-type": "application/cloudevents-batch+json; charset=UTF-8"
+    }
+    assert body == some_event_json_batch.encode()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        pytest.param(valid_json.encode(), id="bytes"),
+        pytest.param(bytearray(valid_json.encode()), id="bytearray"),
+        pytest.param(memoryview(valid_json.encode()), id="memoryview"),
+    ],
+)
+def test_from_json_bytes_like(body):
+    handler = HTTPHandler(event_class=SomeEvent)
+
+    assert handler.from_json(body) == SomeEvent(**test_attributes)
+    assert handler.from_json_batch(b"[" + bytes(body) + b"]") == [
+        SomeEvent(**test_attributes)
+    ]
+
+
+def test_to_json_batch_stream():
+    handler = HTTPHandler()
+    events = (SomeEvent(**test_attributes) for _ in range(2))
+
+    headers, body = handler.to_json_batch_stream(events)
+    assert headers == {
+        "content-type": "application/cloudevents-batch+json; charset=UTF-8"
+    }
+    assert b"".join(body).decode() == (
+        "[" + some_event_json + "," + some_event_json + "]"
+    )
+
+
 def test_from_json(json_deserialize_spy):
     handler = HTTPHandler(event_class=SomeEvent)
     event = handler.from_json(valid_json)
@@ -136,6 +207,76 @@ def test_from_json_batch(json_deserialize_batch_spy):
     assert isinstance(event, SomeEvent)
 
 
+def test_from_json_batch_stream():
+    handler = HTTPHandler(event_class=SomeEvent)
+    events = handler.from_json_batch_stream(
+        [valid_json_batch[:10].encode(), valid_json_batch[10:].encode()]
+    )
+
+    assert list(events) == [SomeEvent(**test_attributes)]
+
+
+def test_from_json_batch_parallel():
+    handler = HTTPHandler(event_class=SomeEvent)
+    body = "[" + ",".join([valid_json] * 5) + "]"
+
+    with ThreadPoolExecutor(2) as executor:
+        events = handler.from_json_batch_parallel(body, executor, chunk_size=2)
+
+    assert events == [SomeEvent(**test_attributes)] * 5
+
+
+def test_from_json_with_validation_policy():
+    policy = ValidationPolicy(ValidationMode.SAMPLED, sample_every=2)
+    handler = HTTPHandler(event_class=SomeEvent, validation_policy=policy)
+
+    event = handler.from_json(some_event_json)
+    events = handler.from_json_batch("[" + ",".join([some_event_json] * 3) + "]")
+
+    assert event == SomeEvent(**test_attributes)
+    assert events == [SomeEvent(**test_attributes)] * 3
+    assert policy.counters == ValidationCounters(validated=2, failed=0, trusted=2)
+
+
+def test_async_from_json_with_validation_policy():
+    policy = ValidationPolicy(ValidationMode.TRUSTED)
+    handler = AsyncHTTPHandler(SomeEvent, validation_policy=policy)
+
+    async def body():
+        yield valid_json_batch.encode()
+
+    events = asyncio.run(handler.from_json_batch(body()))
+
+    assert events == [SomeEvent(**test_attributes)]
+    assert policy.counters == ValidationCounters(validated=0, failed=0, trusted=1)
+
+
+def test_from_json_view():
+    handler = HTTPHandler(event_class=SomeEvent)
+
+    event_view = handler.from_json_view(some_event_json)
+
+    assert event_view.type == "com.example.string"
+    assert event_view.some_attr == "some_value"
+    assert event_view.to_json() is some_event_json
+    assert event_view.materialize() == SomeEvent(**test_attributes)
+
+
+def test_from_json_batch_async_stream():
+    handler = HTTPHandler(event_class=SomeEvent)
+
+    async def body():
+        yield valid_json_batch[:10].encode()
+        yield valid_json_batch[10:].encode()
+
+    async def collect():
+        return [event async for event in handler.from_json_batch_async_stream(body())]
+
+    events = asyncio.run(collect())
+    assert events == [SomeEvent(**test_attributes)]
+    assert isinstance(events[0], SomeEvent)
+
+
 @pytest.mark.parametrize(
     ["raw_value", "expected_value"],
     [
@@ -214,6 +355,7 @@ def test_to_binary(event, expected_output, canonical_serialize_spy):
 
     result = handler.to_binary(event)
     assert result == expected_output
+    assert all(type(header) is str for header in result.headers.values())
     canonical_serialize_spy.assert_called_once_with(event)
 
 
@@ -271,3 +413,358 @@ def test_from_binary_fails_without_content_type():
 
     with pytest.raises(ValueError):
         handler.from_binary(headers, body)
+
+
+def test_from_binary_with_asgi_headers():
+    handler = HTTPHandler()
+
+    headers = [
+        (b"ce-source", b"https://example.com/event-producer"),
+        (b"ce-id", b"b96267e2-87be-4f7a-b87c-82f64360d954"),
+        (b"ce-specversion", b"1.0"),
+        (b"ce-time", b"2022-07-16T12:03:20.519216+04:00"),
+        (b"ce-type", b"com.example.string"),
+        (b"content-type", b"text/plain"),
+        (b"x-ignored-header", b"value"),
+    ]
+
+    result = handler.from_binary(headers, b"body")
+    assert result == CloudEvent(
+        **test_attributes, datacontenttype="text/plain", data=b"body"
+    )
+
+
+def test_from_binary_with_case_insensitive_headers():
+    handler = HTTPHandler(SomeEvent)
+
+    headers = {
+        "Ce-Source": "https://example.com/event-producer",
+        "Ce-Id": "b96267e2-87be-4f7a-b87c-82f64360d954",
+        "Ce-Specversion": "1.0",
+        "Ce-Time": "2022-07-16T12:03:20.519216+04:00",
+        "Ce-Type": "com.example.string",
+        "Ce-Some_attr": "other_value",
+        "Content-Type": "text/plain",
+    }
+
+    result = handler.from_binary(headers, None)
+    assert result == SomeEvent(
+        **test_attributes, datacontenttype="text/plain", some_attr="other_value"
+    )
+
+
+binary_headers = {
+    "ce-source": "https://example.com/event-producer",
+    "ce-id": "b96267e2-87be-4f7a-b87c-82f64360d954",
+    "ce-specversion": "1.0",
+    "ce-time": "2022-07-16T12:03:20.519216+04:00",
+    "ce-type": "com.example.string",
+    "content-type": "text/plain",
+}
+
+
+def test_from_binary_with_lazy_data():
+    handler = HTTPHandler(SomeEvent)
+    headers = {**binary_headers, "content-type": "application/json"}
+
+    result = handler.from_binary(headers, memoryview(b'{"key": "value"}'), True)
+    assert isinstance(result, SomeEvent)
+    assert isinstance(result.__dict__["data"], LazyData)
+    assert not result.__dict__["data"].loaded
+    assert result.data == {"key": "value"}
+
+    with pytest.raises(ValidationError):
+        handler.from_binary({**headers, "ce-id": ""}, b"{}", lazy_data=True)
+
+
+def test_from_binary_with_lazy_data_and_deferred_validation():
+    class DeferredEvent(CloudEvent, defer_data_validation=True):
+        data: Dict[str, int]
+
+    handler = HTTPHandler(DeferredEvent)
+    headers = {**binary_headers, "content-type": "application/json"}
+
+    result = handler.from_binary(headers, b'{"key": "1"}', lazy_data=True)
+    assert isinstance(result.__dict__["data"], LazyData)
+    assert result.data == {"key": 1}
+
+
+def test_from_binary_with_lazy_data_keeps_raw_bodies():
+    handler = HTTPHandler()
+    body = memoryview(b"\x00\x01")
+    headers = {**binary_headers, "content-type": "application/octet-stream"}
+
+    assert handler.from_binary(headers, body, lazy_data=True).data is body
+    assert handler.from_http(headers, body, lazy_data=True).data is body
+
+
+class PayloadData(TypedDict):
+    a: int
+
+
+@pytest.mark.parametrize(
+    "event_class, body, content_type, eager, lazy",
+    [
+        (CloudEvent, b'{"a": 1}', "application/json", b'{"a": 1}', {"a": 1}),
+        (CloudEvent, b"hi", "text/plain", b"hi", "hi"),
+        (CloudEvent[str], b'"hi"', "application/json", '"hi"', "hi"),
+        (CloudEvent[PayloadData], b'{"a": 1}', "application/json", None, {"a": 1}),
+    ],
+)
+def test_lazy_data_is_decoded(event_class, body, content_type, eager, lazy):
+    handler = HTTPHandler(event_class)
+    headers = {**binary_headers, "content-type": content_type}
+
+    if eager is None:
+        with pytest.raises(ValidationError):
+            handler.from_binary(headers, body)
+    else:
+        assert handler.from_binary(headers, body).data == eager
+    assert handler.from_binary(headers, body, lazy_data=True).data == lazy
+
+
+def test_async_from_binary_with_lazy_data():
+    handler = AsyncHTTPHandler(offload_threshold=0)
+
+    result = asyncio.run(handler.from_binary(binary_headers, b"text", lazy_data=True))
+    assert isinstance(result.__dict__["data"], LazyData)
+    assert result.data == "text"
+
+
+def test_async_from_http_with_lazy_data():
+    executor = MagicMock()
+    handler = AsyncHTTPHandler(executor=executor, offload_threshold=0)
+
+    result = asyncio.run(handler.from_http(binary_headers, b"text", lazy_data=True))
+    assert isinstance(result.__dict__["data"], LazyData)
+    assert result.data == "text"
+    # Lazy events are built inline, never in the executor
+    executor.submit.assert_not_called()
+
+    headers, body = HTTPHandler().to_json(CloudEvent(**test_attributes, data="text"))
+    handler = AsyncHTTPHandler(offload_threshold=0)
+    result = asyncio.run(handler.from_http(headers, body, lazy_data=True))
+    assert result == CloudEvent(**test_attributes, data="text")
+
+
+def asgi_receive(*chunks: bytes, disconnect: bool = False):
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks
+    ]
+    if disconnect:
+        messages.append({"type": "http.disconnect"})
+    else:
+        messages.append({"type": "http.request", "body": b"", "more_body": False})
+    messages.reverse()
+
+    async def receive():
+        return messages.pop()
+
+    return receive
+
+
+async def async_chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.parametrize(
+    "body_factory",
+    [
+        pytest.param(lambda data: data, id="bytes"),
+        pytest.param(lambda data: async_chunks(data[:10], data[10:]), id="async-iter"),
+        pytest.param(lambda data: asgi_receive(data[:10], data[10:]), id="asgi"),
+    ],
+)
+def test_async_handler_from_json(body_factory):
+    handler = AsyncHTTPHandler(SomeEvent)
+
+    event = asyncio.run(handler.from_json(body_factory(valid_json.encode())))
+    assert event == SomeEvent(**test_attributes)
+    assert isinstance(event, SomeEvent)
+
+    events = asyncio.run(
+        handler.from_json_batch(body_factory(valid_json_batch.encode()))
+    )
+    assert events == [SomeEvent(**test_attributes)]
+
+
+@pytest.mark.parametrize(
+    "body_factory",
+    [
+        pytest.param(lambda data: data, id="bytes"),
+        pytest.param(lambda data: asgi_receive(data[:10], data[10:]), id="asgi"),
+    ],
+)
+def test_async_handler_from_json_batch_stream(body_factory):
+    handler = AsyncHTTPHandler(SomeEvent)
+
+    async def collect():
+        body = body_factory(valid_json_batch.encode())
+        return [event async for event in handler.from_json_batch_stream(body)]
+
+    assert asyncio.run(collect()) == [SomeEvent(**test_attributes)]
+
+
+def test_read_body_does_not_copy_single_chunk_bodies():
+    body = b"single chunk"
+    assert asyncio.run(read_body(asgi_receive(body))) is body
+
+
+def test_async_handler_from_binary():
+    handler = AsyncHTTPHandler()
+    headers = [
+        (b"ce-source", b"https://example.com/event-producer"),
+        (b"ce-id", b"b96267e2-87be-4f7a-b87c-82f64360d954"),
+        (b"ce-specversion", b"1.0"),
+        (b"ce-time", b"2022-07-16T12:03:20.519216+04:00"),
+        (b"ce-type", b"com.example.string"),
+        (b"content-type", b"text/plain"),
+    ]
+
+    event = asyncio.run(handler.from_binary(headers, asgi_receive(b"bo", b"dy")))
+    assert event == CloudEvent(
+        **test_attributes, datacontenttype="text/plain", data=b"body"
+    )
+
+
+@pytest.mark.parametrize(
+    ["threshold", "offloaded"],
+    [
+        pytest.param(len(valid_json_batch) + 1, False, id="inline"),
+        pytest.param(len(valid_json_batch), True, id="offloaded"),
+    ],
+)
+def test_async_handler_offloads_big_bodies(threshold, offloaded):
+    threads = set()
+    executor = ThreadPoolExecutor(max_workers=1)
+    handler = AsyncHTTPHandler(
+        SomeEvent, offload_threshold=threshold, executor=executor
+    )
+    wrapped = handler.handler.from_json_batch
+
+    def from_json_batch(body):
+        threads.add(threading.get_ident())
+        return wrapped(body)
+
+    handler.handler.from_json_batch = from_json_batch  # type: ignore[method-assign]
+
+    async def run():
+        return (
+            await handler.from_json_batch(valid_json_batch.encode()),
+            threading.get_ident(),
+        )
+
+    events, loop_thread = asyncio.run(run())
+    executor.shutdown()
+
+    assert events == [SomeEvent(**test_attributes)]
+    assert (threads != {loop_thread}) is offloaded
+
+
+def test_read_body_fails_on_asgi_disconnect():
+    with pytest.raises(ConnectionError):
+        asyncio.run(read_body(asgi_receive(b"partial", disconnect=True)))
+
+
+@pytest.mark.parametrize(
+    ["content_type", "expected_mode"],
+    [
+        ("application/cloudevents+json", ContentMode.STRUCTURED),
+        ("application/cloudevents+json; charset=UTF-8", ContentMode.STRUCTURED),
+        ("Application/CloudEvents+JSON;charset=utf-8", ContentMode.STRUCTURED),
+        ("application/cloudevents-batch+json; charset=UTF-8", ContentMode.BATCH),
+        ("application/json", ContentMode.BINARY),
+        ("text/plain", ContentMode.BINARY),
+        (None, ContentMode.BINARY),
+    ],
+)
+def test_content_mode(content_type, expected_mode):
+    assert content_mode(content_type) is expected_mode
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    ["application/cloudevents+avro", "application/cloudevents-batch+avro"],
+)
+def test_content_mode_fails_with_unsupported_formats(content_type):
+    with pytest.raises(ValueError):
+        content_mode(content_type)
+
+
+@pytest.mark.parametrize(
+    ["headers", "body", "expected"],
+    [
+        pytest.param(
+            {"Content-Type": "application/cloudevents+json; charset=UTF-8"},
+            valid_json,
+            SomeEvent(**test_attributes),
+            id="structured",
+        ),
+        pytest.param(
+            [(b"content-type", b"application/cloudevents-batch+json")],
+            valid_json_batch.encode(),
+            [SomeEvent(**test_attributes)],
+            id="batch",
+        ),
+        pytest.param(
+            binary_headers,
+            b"body",
+            SomeEvent(**test_attributes, datacontenttype="text/plain", data=b"body"),
+            id="binary",
+        ),
+    ],
+)
+def test_from_http(headers, body, expected):
+    handler = HTTPHandler(SomeEvent)
+
+    assert handler.from_http(headers, body) == expected
+    assert asyncio.run(AsyncHTTPHandler(SomeEvent).from_http(headers, body)) == (
+        expected
+    )
+
+
+@pytest.mark.parametrize(
+    ["event", "mode", "expected"],
+    [
+        pytest.param(
+            SomeEvent(**test_attributes),
+            ContentMode.STRUCTURED,
+            HTTPHandler().to_json(SomeEvent(**test_attributes)),
+            id="structured",
+        ),
+        pytest.param(
+            SomeEvent(**test_attributes),
+            ContentMode.BATCH,
+            HTTPHandler().to_json_batch([SomeEvent(**test_attributes)]),
+            id="batch-single",
+        ),
+        pytest.param(
+            [SomeEvent(**test_attributes)],
+            ContentMode.BATCH,
+            HTTPHandler().to_json_batch([SomeEvent(**test_attributes)]),
+            id="batch-list",
+        ),
+        pytest.param(
+            SomeEvent(**test_attributes, datacontenttype="text/plain"),
+            ContentMode.BINARY,
+            HTTPHandler().to_binary(
+                SomeEvent(**test_attributes, datacontenttype="text/plain")
+            ),
+            id="binary",
+        ),
+    ],
+)
+def test_to_http(event, mode, expected):
+    assert HTTPHandler().to_http(event, mode=mode) == expected
+
+
+def test_to_http_defaults_to_structured_mode():
+    event = SomeEvent(**test_attributes)
+    assert HTTPHandler().to_http(event) == HTTPHandler().to_json(event)
+
+
+@pytest.mark.parametrize("mode", [ContentMode.STRUCTURED, ContentMode.BINARY])
+def test_to_http_fails_with_lists_in_single_event_modes(mode):
+    with pytest.raises(ValueError):
+        HTTPHandler().to_http([SomeEvent(**test_attributes)], mode=mode)
@@ -0,0 +1,354 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import threading
+from http.client import HTTPSConnection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from queue import Empty, Queue
+from typing import Any, Iterator, List, NamedTuple, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from cloudevents_pydantic.bindings.http import ContentMode, HTTPHandler
+from cloudevents_pydantic.bindings.http_emitter import HTTPEmitter, log_error
+from cloudevents_pydantic.events import CloudEvent
+
+
+class Request(NamedTuple):
+    path: str
+    headers: dict
+    body: bytes
+    client_port: int
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    status = 202
+    # Closes the connection without telling the client, after the response
+    drop_connection = False
+    # Closes the connection without sending a response
+    drop_request = False
+    barrier: Optional[threading.Barrier] = None
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), RequestHandler)
+        self.requests: "Queue[Request]" = Queue()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/events?source=test"
+
+    def received(self, timeout: float = 5) -> Request:
+        return self.requests.get(timeout=timeout)
+
+    def received_all(self) -> List[Request]:
+        requests = []
+        while True:
+            try:
+                requests.append(self.requests.get_nowait())
+            except Empty:
+                return requests
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: Server
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["content-length"]))
+        if self.server.drop_request:
+            self.close_connection = True
+            return
+        if self.server.barrier is not None:
+            self.server.barrier.wait(timeout=5)
+        self.server.requests.put(
+            Request(self.path, dict(self.headers), body, self.client_address[1])
+        )
+        self.send_response(self.server.status)
+        self.send_header("content-length", "0")
+        self.end_headers()
+        if self.server.drop_connection:
+            self.close_connection = True
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class HTTP10RequestHandler(RequestHandler):
+    protocol_version = "HTTP/1.0"
+
+
+@pytest.fixture
+def server() -> Iterator[Server]:
+    server = Server()
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+handler = HTTPHandler()
+
+
+def event(
+    index: int = 0, data: Any = None, datacontenttype: str = "text/plain"
+) -> CloudEvent:
+    return CloudEvent.event_factory(
+        id=str(index),
+        source="https://example.com/event-producer",
+        type="com.example.string",
+        datacontenttype=datacontenttype,
+        data=data,
+    )
+
+
+def test_batches_by_count(server: Server):
+    with HTTPEmitter(server.url, max_batch_size=3, linger=None) as emitter:
+        for index in range(7):
+            emitter.emit(event(index))
+        requests = server.received_all()
+        assert len(requests) == 2
+
+    requests += server.received_all()
+    batches = [handler.from_json_batch(request.body) for request in requests]
+    assert [[e.id for e in batch] for batch in batches] == [
+        ["0", "1", "2"],
+        ["3", "4", "5"],
+        ["6"],
+    ]
+    assert requests[0].path == "/events?source=test"
+    assert requests[0].headers["content-type"] == (
+        "application/cloudevents-batch+json; charset=UTF-8"
+    )
+
+
+def test_batches_by_size(server: Server):
+    event_size = len(handler.to_json_bytes(event()).body)
+    with HTTPEmitter(
+        server.url, max_batch_bytes=event_size * 2 + 3, linger=None
+    ) as emitter:
+        for index in range(5):
+            emitter.emit(event(index))
+        assert len(server.received_all()) == 2
+        # A single event bigger than the limit is sent in its own batch
+        emitter.emit(event(5, data="x" * event_size * 3))
+        requests = server.received_all()
+
+    assert [[e.id for e in handler.from_json_batch(r.body)] for r in requests] == [
+        ["4"],
+        ["5"],
+    ]
+    assert server.received_all() == []
+
+
+def test_batches_by_linger_time(server: Server):
+    emitter = HTTPEmitter(server.url, linger=0.2)
+    emitter.emit(event(0))
+    emitter.emit(event(1))
+
+    request = server.received()
+    assert [e.id for e in handler.from_json_batch(request.body)] == ["0", "1"]
+
+    emitter.emit(event(2))
+    request = server.received()
+    assert [e.id for e in handler.from_json_batch(request.body)] == ["2"]
+    emitter.close()
+    assert server.received_all() == []
+
+
+def test_batches_per_target_url(server: Server):
+    other_url = server.url.replace("/events", "/other")
+    with HTTPEmitter(server.url, linger=None) as emitter:
+        emitter.emit(event(0))
+        emitter.emit(event(1), url=other_url)
+        emitter.emit(event(2))
+
+    requests = {r.path: r for r in server.received_all()}
+    assert [
+        e.id for e in handler.from_json_batch(requests["/events?source=test"].body)
+    ] == ["0", "2"]
+    assert [
+        e.id for e in handler.from_json_batch(requests["/other?source=test"].body)
+    ] == ["1"]
+
+
+@pytest.mark.parametrize("mode", [ContentMode.BINARY, ContentMode.STRUCTURED])
+@pytest.mark.parametrize(
+    ["data", "datacontenttype", "body"],
+    [
+        pytest.param("some data", "text/plain", b"some data", id="str"),
+        pytest.param({"a": [1, 2]}, "application/json", b'{"a":[1,2]}', id="dict"),
+        pytest.param(b"\x00\xff", "application/octet-stream", b"\x00\xff", id="bytes"),
+    ],
+)
+def test_single_event_modes(
+    server: Server, mode: ContentMode, data: Any, datacontenttype: str, body: bytes
+):
+    sent = event(0, data=data, datacontenttype=datacontenttype)
+    with HTTPEmitter(server.url, mode=mode, headers={"x-api-key": "key"}) as emitter:
+        emitter.emit(sent)
+        request = server.received()
+
+    assert request.headers["x-api-key"] == "key"
+    received = handler.from_http(request.headers, request.body)
+    assert received.model_dump(exclude={"data"}) == sent.model_dump(exclude={"data"})
+    if mode == ContentMode.BINARY:
+        # Untyped data is kept as the raw body
+        assert received.data == request.body == body
+        assert request.headers["ce-id"] == "0"
+    else:
+        assert received.data == data
+
+
+def test_binary_mode_fails_without_body_representation(server: Server):
+    with HTTPEmitter(server.url, mode=ContentMode.BINARY) as emitter:
+        with pytest.raises(ValueError, match="Can't encode dict data"):
+            emitter.emit(event(0, data={"a": 1}))
+
+
+def test_reuses_connections(server: Server):
+    with HTTPEmitter(server.url, mode=ContentMode.STRUCTURED) as emitter:
+        for index in range(5):
+            emitter.emit(event(index))
+
+    assert len({r.client_port for r in server.received_all()}) == 1
+
+
+def test_retries_once_on_stale_connections(server: Server):
+    server.drop_connection = True
+    with HTTPEmitter(server.url, mode=ContentMode.STRUCTURED) as emitter:
+        for index in range(3):
+            emitter.emit(event(index))
+
+    requests = server.received_all()
+    assert [handler.from_json(r.body).id for r in requests] == ["0", "1", "2"]
+    assert len({r.client_port for r in requests}) == 3
+
+
+def test_does_not_retry_new_connections(server: Server):
+    server.drop_request = True
+    emitter = HTTPEmitter(server.url, mode=ContentMode.STRUCTURED)
+
+    with pytest.raises(ConnectionError):
+        emitter.emit(event())
+    emitter.close()
+
+
+def test_closes_connections_the_server_does_not_keep_alive():
+    server = Server()
+    server.RequestHandlerClass = HTTP10RequestHandler
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    try:
+        with HTTPEmitter(server.url, mode=ContentMode.STRUCTURED) as emitter:
+            emitter.emit(event(0))
+            emitter.emit(event(1))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len({r.client_port for r in server.received_all()}) == 2
+
+
+def test_keeps_at_most_pool_size_idle_connections(server: Server):
+    server.barrier = threading.Barrier(2)
+    emitter = HTTPEmitter(server.url, mode=ContentMode.STRUCTURED, pool_size=1)
+    threads = [
+        threading.Thread(target=emitter.emit, args=(event(index),))
+        for index in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    server.barrier = None
+    emitter.emit(event(2))
+    emitter.emit(event(3))
+    emitter.close()
+
+    ports = [r.client_port for r in server.received_all()]
+    assert len(set(ports)) == 2
+    assert ports[2] == ports[3]
+
+
+def test_raises_on_error_status(server: Server):
+    server.status = 500
+    with HTTPEmitter(server.url, mode=ContentMode.STRUCTURED) as emitter:
+        with pytest.raises(ConnectionError, match="500"):
+            emitter.emit(event())
+
+    emitter = HTTPEmitter(server.url, linger=None)
+    emitter.emit(event())
+    with pytest.raises(ConnectionError, match="500"):
+        emitter.flush()
+    emitter.close()
+
+
+def test_background_errors_are_passed_to_on_error(server: Server):
+    server.status = 400
+    errors: "Queue[Exception]" = Queue()
+    with HTTPEmitter(server.url, linger=0.01, on_error=errors.put) as emitter:
+        emitter.emit(event())
+        error = errors.get(timeout=5)
+
+    assert isinstance(error, ConnectionError)
+
+
+def test_log_error(caplog):
+    log_error(ConnectionError("refused"))
+
+    assert caplog.records[0].message == "Failed to emit a batch of events"
+    assert caplog.records[0].exc_info[1].args == ("refused",)
+
+
+def test_close_sends_pending_events_and_rejects_new_ones(server: Server):
+    emitter = HTTPEmitter(server.url, linger=60)
+    emitter.emit(event())
+    emitter.close()
+    emitter.close()
+
+    assert len(server.received_all()) == 1
+    for mode in ContentMode:
+        emitter.mode = mode
+        with pytest.raises(ValueError, match="closed"):
+            emitter.emit(event())
+
+
+@pytest.mark.parametrize(
+    "url", ["ftp://example.com/events", "/events", "http:///events"]
+)
+def test_rejects_unsupported_urls(url: str):
+    with pytest.raises(ValueError, match="Unsupported target URL"):
+        HTTPEmitter(url)
+
+
+def test_https_targets():
+    ssl_context = MagicMock()
+    emitter = HTTPEmitter("https://example.com", ssl_context=ssl_context)
+    pool, path = emitter._target("https://example.com")
+    connection = pool._connect()
+
+    assert isinstance(connection, HTTPSConnection)
+    assert connection._context is ssl_context
+    assert (connection.host, connection.port, path) == ("example.com", 443, "/")
@@ -0,0 +1,179 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import datetime
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+from ulid import ULID
+
+from cloudevents_pydantic.bindings.http import HTTPHandler
+from cloudevents_pydantic.bindings.http_template import EventTemplate
+from cloudevents_pydantic.events import CloudEvent
+from cloudevents_pydantic.events.fields.types import Binary
+
+constants = {
+    "type": "com.example.string",
+    "source": "https://example.com/event-producer?query=1",
+    "datacontenttype": "application/json",
+}
+
+
+class Order(BaseModel):
+    number: int
+
+
+class OrderEvent(CloudEvent):
+    data: Order
+    tenant: str = "default"
+
+
+class BinaryEvent(CloudEvent):
+    data: Binary
+
+
+class CheckedEvent(CloudEvent):
+    data: Any = None
+
+    @field_validator("data")
+    @classmethod
+    def _not_empty(cls, value: Any) -> Any:
+        if value == {}:
+            raise ValueError("empty")
+        return value
+
+
+class ExtensionsEvent(CloudEvent):
+    model_config = ConfigDict(extra="allow")
+
+
+class UpperCaseHandler(HTTPHandler):
+    def _header_encode(self, value: str) -> str:
+        return value.upper()
+
+
+@pytest.mark.parametrize(
+    ["event_class", "event_constants", "data"],
+    [
+        (CloudEvent, constants, {"key": ["value", 1, None]}),
+        (CloudEvent, constants, None),
+        (CloudEvent, constants, b"\x00binary"),
+        (CloudEvent, {**constants, "subject": "sub ject", "dataschema": "s:x"}, 1),
+        (OrderEvent, {**constants, "tenant": "ténant"}, {"number": 1}),
+        (BinaryEvent, constants, b"\x00binary"),
+        (ExtensionsEvent, {**constants, "ext": "value"}, "data"),
+        (ExtensionsEvent, {**constants, "ext": 3, "flag": False}, "data"),
+    ],
+)
+def test_template_serializes_as_the_handler(event_class, event_constants, data):
+    handler = HTTPHandler(event_class)
+    template = EventTemplate(event_class, **event_constants)
+
+    event = template.event(data)
+
+    assert event == event_class.event_factory(
+        id=event.id, time=event.time, data=data, **event_constants
+    )
+    assert (
+        event.model_fields_set
+        == event_class.event_factory(data=data, **event_constants).model_fields_set
+    )
+    assert template.to_json(event) == handler.to_json_bytes(event)
+    assert template.to_binary(event) == handler.to_binary(event)
+    assert all(
+        type(header) is str for header in template.to_binary(event).headers.values()
+    )
+
+
+def test_template_event_defaults():
+    template = EventTemplate(**constants)
+    before = datetime.datetime.now(datetime.timezone.utc)
+
+    first, second = template.event(), template.event()
+
+    assert ULID.from_str(first.id) and first.id != second.id
+    assert before <= first.time <= second.time
+    assert first.data is None
+    assert type(first) is CloudEvent
+
+
+def test_template_event_validates_attributes():
+    template = EventTemplate(**constants)
+
+    event = template.event(id="some-id", time="2022-07-16T12:03:20+04:00")
+
+    assert event.id == "some-id"
+    assert event.time.utcoffset() == datetime.timedelta(hours=4)
+    with pytest.raises(ValidationError):
+        template.event(id="")
+    with pytest.raises(ValidationError):
+        template.event(time="yesterday")
+
+
+@pytest.mark.parametrize(
+    ["event_class", "data"],
+    [(OrderEvent, {"number": "one"}), (CheckedEvent, {}), (BinaryEvent, None)],
+)
+def test_template_event_validates_data(event_class, data):
+    template = EventTemplate(event_class, **constants)
+
+    with pytest.raises(ValidationError):
+        template.event(data)
+
+
+def test_template_validates_constants():
+    with pytest.raises(ValidationError):
+        EventTemplate(**{**constants, "source": None})
+    with pytest.raises(ValidationError):
+        EventTemplate(type="com.example.string")
+
+
+def test_template_rejects_event_attributes():
+    with pytest.raises(ValueError, match="can't be constant: data, id"):
+        EventTemplate(**constants, id="id", data=1)
+
+
+def test_template_uses_handler_header_encoding():
+    template = EventTemplate(handler=UpperCaseHandler(), **constants)
+    event = template.event(id="some-id")
+
+    headers, _ = template.to_binary(event)
+
+    assert headers["ce-id"] == "SOME-ID"
+    assert headers["ce-type"] == "COM.EXAMPLE.STRING"
+
+
+def test_template_without_time():
+    template = EventTemplate(**constants)
+    event = template.event()
+    event.time = None
+
+    assert template.to_json(event) == HTTPHandler().to_json_bytes(event)
+    assert "ce-time" not in template.to_binary(event).headers
+
+
+def test_template_binary_mode_requires_datacontenttype():
+    template = EventTemplate(type="com.example.string", source="/source")
+
+    with pytest.raises(ValueError, match="without datacontenttype"):
+        template.to_binary(template.event())
@@ -24,6 +24,9 @@ import pytest
 from pydantic import BaseModel, ValidationError
 
 from cloudevents_pydantic.events.fields.types import String
+from cloudevents_pydantic.events.fields.types._canonic_types import (
+    str_constraint_asyncapi_compat,
+)
 
 
 def test_string_validation_allows_valid_unicode_chars():
@@ -127,3 +130,14 @@ def test_string_validation_fails_on_unicode_noncharacters(unicode_noncharacter):
 
     with pytest.raises(ValidationError):
         StrModel(value="test_" + unicode_noncharacter + "_string")
+
+
+def test_string_json_schema_is_asyncapi_compatible():
+    class StrModel(BaseModel):
+        value: String
+
+    assert StrModel.model_json_schema()["properties"]["value"] == {
+        "pattern": str_constraint_asyncapi_compat,
+        "title": "Value",
+        "type": "string",
+    }
@@ -21,14 +21,18 @@
 #  DEALINGS IN THE SOFTWARE.                                                   =
 # ==============================================================================
 
-from urllib.parse import ParseResult
+import copy
+import pickle
+from urllib.parse import ParseResult, ParseResultBytes
 
 import pytest
 from pydantic import BaseModel
 
 from cloudevents_pydantic.events.fields.types import (
+    ParsedURI,
     URIReference,
 )
+from cloudevents_pydantic.events.fields.types._canonic_types import parse_uri
 
 
 @pytest.mark.parametrize(
@@ -141,3 +145,78 @@ def test_serialization(valid_uri):
     assert m.model_dump() == {"value": valid_uri}
     assert m.model_dump_json() == '{"value":"' + valid_uri + '"}'
     assert isinstance(m.model_dump()["value"], str)
+
+
+@pytest.mark.parametrize(
+    ["valid_uri"],
+    (
+        ("https://github.com/cloudevents?",),
+        ("https://github.com/cloudevents#",),
+        ("HTTPS://github.com/cloudevents",),
+    ),
+)
+def test_serialization_keeps_the_original_uri(valid_uri):
+    class UriModel(BaseModel):
+        value: URIReference
+
+    m = UriModel(value=valid_uri)
+    assert m.value.geturl() == valid_uri
+    assert m.model_dump_json() == '{"value":"' + valid_uri + '"}'
+
+
+def test_serialization_of_parse_result():
+    class UriModel(BaseModel):
+        value: URIReference
+
+    value = ParseResult("https", "github.com", "/cloudevents", "", "", "")
+    m = UriModel.model_construct(value=value)
+    assert m.model_dump() == {"value": "https://github.com/cloudevents"}
+
+
+def test_parsed_uris_are_shared():
+    class UriModel(BaseModel):
+        value: URIReference
+
+    first = UriModel(value="https://github.com/cloudevents")
+    second = UriModel(value="https://github.com/cloudevents")
+
+    assert isinstance(first.value, ParsedURI)
+    assert first.value is second.value
+
+
+def _pickled(value):
+    return pickle.loads(pickle.dumps(value))  # noqa: S301
+
+
+@pytest.mark.parametrize("copy_uri", [copy.copy, copy.deepcopy, _pickled])
+def test_parsed_uri_copies(copy_uri):
+    parsed = parse_uri("https://github.com/cloudevents?")
+    copied = copy_uri(parsed)
+
+    assert copied == parsed
+    assert copied.geturl() == "https://github.com/cloudevents?"
+
+
+@pytest.mark.parametrize(
+    "derive",
+    [
+        lambda parsed: parsed._replace(path="/other"),
+        lambda parsed: ParsedURI._make([*parsed[:2], "/other", *parsed[3:]]),
+    ],
+)
+def test_parsed_uri_derived_tuples(derive):
+    class UriModel(BaseModel):
+        value: URIReference
+
+    parsed = parse_uri("https://github.com/cloudevents?")
+    derived = derive(parsed)
+
+    assert type(derived) is ParseResult
+    assert derived.geturl() == "https://github.com/other"
+    m = UriModel.model_construct(value=derived)
+    assert m.model_dump() == {"value": "https://github.com/other"}
+    assert parsed.geturl() == "https://github.com/cloudevents?"
+
+
+def test_parse_uri_bytes():
+    assert isinstance(parse_uri(b"https://github.com/cloudevents"), ParseResultBytes)
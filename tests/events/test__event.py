@@ -21,15 +21,18 @@
 #  DEALINGS IN THE SOFTWARE.                                                   =
 # ==============================================================================
 import datetime
+import gc
 import json
+from typing import List
 from urllib.parse import ParseResult
 
 import pytest
-from pydantic import ValidationError
+from pydantic import Field, TypeAdapter, ValidationError, model_serializer
+from typing_extensions import TypedDict
 from ulid import ULID
 
-from cloudevents_pydantic.events import CloudEvent
-from cloudevents_pydantic.events.fields.types import SpecVersion
+from cloudevents_pydantic.events import CloudEvent, FrozenCloudEvent
+from cloudevents_pydantic.events.fields.types import Binary, SpecVersion
 
 test_attributes = {
     "type": "com.example.string",
@@ -124,3 +127,250 @@ def test_fails_if_mandatory_fields_are_null(attribute):
 
     with pytest.raises(ValidationError):
         CloudEvent.model_validate_json(json.dumps(temp_attrs))
+
+
+def test_json_serialization_with_binary_data():
+    class BinaryEvent(CloudEvent):
+        data: Binary
+
+    event = CloudEvent.event_factory(**test_attributes, data=b"\xff\x00")
+    binary_event = BinaryEvent.event_factory(**test_attributes, data=b"\xff\x00")
+
+    for serialized in (
+        event.model_dump(mode="json"),
+        binary_event.model_dump(mode="json"),
+        # Serialized as the parent class, with untyped data
+        TypeAdapter(List[CloudEvent]).dump_python([binary_event], mode="json")[0],
+    ):
+        assert "data" not in serialized
+        assert serialized["data_base64"] == "/wA="
+
+
+def test_json_serialization_honours_exclusions():
+    event = CloudEvent.event_factory(**test_attributes, data=b"data")
+
+    assert json.loads(event.model_dump_json(exclude_none=True)).keys() == {
+        *test_attributes,
+        "id",
+        "specversion",
+        "time",
+        "data_base64",
+    }
+    assert "data_base64" not in event.model_dump(mode="json", exclude={"data"})
+
+
+def test_json_serialization_of_subclass_with_excluded_field():
+    class ExcludingEvent(CloudEvent):
+        secret: str = Field("value", exclude=True)
+
+    event = ExcludingEvent.event_factory(**test_attributes, data=b"data")
+
+    for serialized in (
+        json.loads(event.model_dump_json()),
+        json.loads(TypeAdapter(List[CloudEvent]).dump_json([event]))[0],
+    ):
+        assert "secret" not in serialized
+        assert serialized["data_base64"] == "ZGF0YQ=="
+
+
+def test_json_serialization_of_aliased_binary_data():
+    class AliasedBinaryEvent(CloudEvent):
+        data: Binary = Field(alias="data_base64")
+
+    event = AliasedBinaryEvent.event_factory(**test_attributes, data_base64=b"\xff")
+
+    for by_alias in (True, False):
+        serialized = json.loads(event.model_dump_json(by_alias=by_alias))
+        assert "data" not in serialized
+        assert serialized["data_base64"] == "/w=="
+    assert (
+        AliasedBinaryEvent.model_validate_json(event.model_dump_json(by_alias=True))
+        == event
+    )
+
+
+def test_json_serialization_defined_by_subclass():
+    class CustomSerializedEvent(CloudEvent):
+        @model_serializer
+        def custom_serializer(self):
+            return {"id": self.id}
+
+    event = CustomSerializedEvent.event_factory(**test_attributes, data=b"data")
+
+    assert json.loads(event.model_dump_json()) == {"id": event.id}
+
+
+def test_json_serialization_of_typed_data_is_compiled():
+    class TypedEvent(CloudEvent):
+        data: dict
+
+    schema = TypedEvent.__pydantic_core_schema__
+
+    # No Python callback handles `data_base64`
+    assert "serialization" not in schema
+    assert schema["schema"]["type"] == "model-fields"
+    with pytest.raises(ValidationError):
+        TypedEvent.model_validate_json(
+            json.dumps({**test_full_attributes, "data": None, "data_base64": "e30="})
+        )
+
+
+def test_event_factory_batch():
+    items = [{"data": {"n": n}, "subject": str(n)} for n in range(5)]
+
+    events = CloudEvent.event_factory_batch(iter(items), **test_attributes)
+
+    assert [event.data for event in events] == [item["data"] for item in items]
+    assert [event.subject for event in events] == ["0", "1", "2", "3", "4"]
+    assert len({event.time for event in events}) == 1
+    assert [event.id for event in events] == sorted(event.id for event in events)
+    assert len({event.id for event in events}) == 5
+    assert ULID.from_str(events[0].id).datetime == events[0].time.replace(
+        microsecond=events[0].time.microsecond // 1000 * 1000
+    )
+    for event in events:
+        expected = CloudEvent.event_factory(
+            id=event.id, time=event.time, **test_attributes, **items[int(event.subject)]
+        )
+        assert event == expected
+        assert event.model_fields_set == expected.model_fields_set
+        assert event.model_dump_json() == expected.model_dump_json()
+
+
+def test_event_factory_batch_empty():
+    assert CloudEvent.event_factory_batch([], **test_attributes) == []
+
+
+def test_event_factory_batch_without_shared_time():
+    events = CloudEvent.event_factory_batch(
+        [
+            {"subject": "a"},
+            {"subject": "b"},
+            {"subject": "c", "time": "2020-01-01T00:00:00Z"},
+        ],
+        shared_time=False,
+        **test_attributes,
+    )
+
+    assert events[0].time <= events[1].time
+    assert events[2].time == datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def test_event_factory_batch_with_different_attributes():
+    events = CloudEvent.event_factory_batch(
+        [{"subject": "a", "data": 1}, {"data": 2}, {}], **test_attributes
+    )
+
+    assert [(event.subject, event.data) for event in events] == [
+        ("a", 1),
+        (None, 2),
+        (None, None),
+    ]
+    assert events[2].model_fields_set == {"id", "time", "specversion", *test_attributes}
+
+
+@pytest.mark.parametrize(
+    ["items", "common"],
+    [
+        ([{}, {"subject": ""}], test_attributes),
+        ([{}, {"unknown": "value"}], test_attributes),
+        ([{}, {}], {**test_attributes, "source": None}),
+    ],
+)
+def test_event_factory_batch_validates_attributes(items, common):
+    with pytest.raises(ValidationError):
+        CloudEvent.event_factory_batch(items, **common)
+
+
+def test_event_factory_batch_rejects_common_id():
+    with pytest.raises(ValueError, match="can't share an id"):
+        CloudEvent.event_factory_batch([{}, {}], id="shared", **test_attributes)
+
+
+def test_event_factory_batch_with_item_ids():
+    events = CloudEvent.event_factory_batch(
+        [{"id": "a"}, {"id": "b"}, {}], **test_attributes
+    )
+
+    assert [event.id for event in events][:2] == ["a", "b"]
+    assert events[2].id not in ("a", "b")
+
+
+def test_evolve():
+    event = CloudEvent(**test_full_attributes)
+
+    evolved = event.evolve(subject="other-subject", dataschema="http://other.url")
+
+    assert evolved == CloudEvent(
+        **{
+            **test_full_attributes,
+            "subject": "other-subject",
+            "dataschema": "http://other.url",
+        }
+    )
+    assert evolved.data is event.data
+    assert event.subject == "some-subject"
+    assert event.dataschema == CloudEvent(**test_full_attributes).dataschema
+
+
+def test_evolve_frozen_event():
+    event = FrozenCloudEvent(**test_full_attributes)
+    assert event.memoized("key", lambda: "value") == "value"
+
+    evolved = event.evolve(subject="other-subject")
+
+    assert isinstance(evolved, FrozenCloudEvent)
+    assert evolved.subject == "other-subject"
+    assert evolved.memoized("key", lambda: "other") == "other"
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"subject": ""},
+        {"source": None},
+        {"unknown": "value"},
+    ],
+)
+def test_evolve_validates_changes(changes):
+    event = CloudEvent(**test_full_attributes)
+
+    with pytest.raises(ValidationError):
+        event.evolve(**changes)
+
+
+class OrderData(TypedDict):
+    quantity: int
+
+
+def test_parametrized_class_validates_data():
+    event = CloudEvent[OrderData].event_factory(
+        **test_attributes, data={"quantity": "2"}
+    )
+
+    assert event.data == {"quantity": 2}
+    with pytest.raises(ValidationError):
+        CloudEvent[OrderData].event_factory(**test_attributes, data={"quantity": "x"})
+
+
+def test_parametrized_class_is_kept():
+    parametrized_id = id(CloudEvent[OrderData])
+    gc.collect()
+
+    assert id(CloudEvent[OrderData]) == parametrized_id
+    assert CloudEvent[OrderData] is CloudEvent[OrderData]
+
+
+def test_parametrized_class_plan():
+    assert CloudEvent.__event_plan__.binary_data is None
+    assert CloudEvent[OrderData].__event_plan__.binary_data is False
+    assert CloudEvent[Binary].__event_plan__.binary_data is None
+
+
+def test_parametrized_subclass():
+    frozen = FrozenCloudEvent[OrderData].event_factory(
+        **test_attributes, data={"quantity": 1}
+    )
+
+    assert isinstance(frozen, FrozenCloudEvent)
+    assert hash(frozen) == hash(frozen.model_copy())
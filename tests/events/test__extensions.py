@@ -0,0 +1,216 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import datetime
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Annotated, Union
+
+import pytest
+from pydantic import ValidationError
+
+from cloudevents_pydantic.bindings.http import HTTPHandler
+from cloudevents_pydantic.events import (
+    CloudEvent,
+    FrozenCloudEvent,
+    _extensions,
+    register_extension,
+    registered_extension,
+)
+from cloudevents_pydantic.events._extensions import class_reference, resolve_class
+from cloudevents_pydantic.events.fields.types import Boolean, Integer, String
+
+test_attributes = {
+    "type": "com.example.string",
+    "source": "https://example.com/event-producer",
+    "id": "id",
+    "specversion": "1.0",
+}
+
+
+class TracedEvent(CloudEvent.with_extensions("traceparent")):
+    pass
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(_extensions, "_registry", dict(_extensions._registry))
+    _extensions.extended_class.cache_clear()
+    yield
+    _extensions.extended_class.cache_clear()
+
+
+def test_documented_extensions_are_registered():
+    assert registered_extension("traceparent") is String
+    assert registered_extension("unknown") is None
+
+
+def test_with_extensions():
+    event_class = CloudEvent.with_extensions("traceparent", "recordedtime")
+
+    assert issubclass(event_class, CloudEvent)
+    assert event_class is CloudEvent.with_extensions("recordedtime", "traceparent")
+    assert event_class.model_fields.keys() - CloudEvent.model_fields.keys() == {
+        "recordedtime",
+        "traceparent",
+    }
+    event = event_class(
+        **test_attributes, traceparent="00-abc", recordedtime="2020-01-01T00:00:00Z"
+    )
+    assert event.traceparent == "00-abc"
+    assert event.recordedtime == datetime.datetime(
+        2020, 1, 1, tzinfo=datetime.timezone.utc
+    )
+    assert event.__pydantic_extra__ is None
+    assert event_class(**test_attributes).traceparent is None
+
+
+def test_extensions_are_validated():
+    event_class = CloudEvent.with_extensions("recordedtime")
+
+    with pytest.raises(ValidationError):
+        event_class(**test_attributes, recordedtime="not a timestamp")
+    with pytest.raises(ValidationError):
+        event_class(**test_attributes, partitionkey="unknown")
+
+
+def test_with_extensions_keeps_declared_fields():
+    class SomeEvent(CloudEvent):
+        sequence: String
+
+    assert SomeEvent.with_extensions("sequence") is SomeEvent
+    assert SomeEvent.with_extensions().model_fields["sequence"].is_required()
+
+
+def test_with_unregistered_extensions():
+    with pytest.raises(ValueError, match="Unregistered extensions: a, b"):
+        CloudEvent.with_extensions("b", "a", "traceparent")
+
+
+def test_register_extension(registry):
+    register_extension("priority", Integer)
+    register_extension("priority", Integer)
+
+    event = CloudEvent.with_extensions("priority")(**test_attributes, priority="3")
+    assert event.priority == 3
+
+
+@pytest.mark.parametrize("name", ["", "Upper", "with-dash", "source", "data"])
+def test_register_extension_with_invalid_names(registry, name):
+    with pytest.raises(ValueError, match="Invalid extension attribute name"):
+        register_extension(name, String)
+
+
+def test_register_extension_twice(registry):
+    with pytest.raises(ValueError, match="already registered"):
+        register_extension("traceparent", Integer)
+
+
+def test_extensions_in_http_binary_mode():
+    event_class = CloudEvent.with_extensions("traceparent", "sequence")
+    handler = HTTPHandler(event_class)
+    event = event_class(
+        **test_attributes,
+        datacontenttype="text/plain",
+        data="text",
+        traceparent="00-abc",
+    )
+
+    headers, body = handler.to_binary(event)
+    assert headers["ce-traceparent"] == "00-abc"
+    assert "ce-sequence" not in headers
+    assert handler.from_binary(headers, body) == event
+
+
+@pytest.mark.parametrize(
+    ["annotation", "value", "header"],
+    [(Integer, 3, "3"), (Integer, -1, "-1"), (Boolean, False, "false")],
+)
+def test_typed_extensions_in_http_binary_mode(registry, annotation, value, header):
+    register_extension("ext", annotation)
+    event_class = CloudEvent.with_extensions("ext")
+    handler = HTTPHandler(event_class)
+    event = event_class(
+        **test_attributes, datacontenttype="text/plain", data="text", ext=value
+    )
+
+    headers, body = handler.to_binary(event)
+    assert headers["ce-ext"] == header
+    received = handler.from_binary(headers, body)
+    assert received == event
+    assert type(received.ext) is type(value)
+
+
+def test_extended_classes_are_named_after_the_extensions():
+    event_class = CloudEvent.with_extensions("traceparent", "sequence")
+
+    assert event_class.__name__ == "CloudEventWithSequenceTraceparent"
+    assert event_class.__module__ == CloudEvent.__module__
+
+
+@pytest.mark.parametrize(
+    ["base_class", "names"],
+    [
+        (CloudEvent, ("traceparent", "sequence")),
+        (FrozenCloudEvent, ("traceparent",)),
+        (TracedEvent, ()),
+    ],
+)
+def test_extended_events_can_be_pickled(base_class, names):
+    event_class = base_class.with_extensions(*names)
+    event = event_class.event_factory(
+        source="/source", type="dummy.type", traceparent="00-abc"
+    )
+
+    unpickled = pickle.loads(pickle.dumps(event))  # noqa: S301
+
+    assert type(unpickled) is event_class
+    assert unpickled == event
+    assert unpickled.model_fields_set == event.model_fields_set
+
+
+def test_class_reference():
+    event_class = CloudEvent.with_extensions("traceparent")
+    union = Annotated[Union[event_class, TracedEvent], "union"]
+
+    assert class_reference(event_class) == (CloudEvent, ("traceparent",))
+    assert class_reference(union) is union
+    for cls in (event_class, CloudEvent, TracedEvent):
+        reference = pickle.loads(pickle.dumps(class_reference(cls)))  # noqa: S301
+        assert resolve_class(reference) is cls
+
+
+def test_extended_events_in_process_pools():
+    event_class = CloudEvent.with_extensions("traceparent")
+    events = [
+        event_class.event_factory(source="/source", type="t", traceparent=str(n))
+        for n in range(3)
+    ]
+    handler = HTTPHandler(event_class)
+
+    with ProcessPoolExecutor(1) as executor:
+        received = handler.from_json_batch_parallel(
+            handler.to_json_batch(events).body, executor, chunk_size=1
+        )
+
+    assert received == events
+    assert all(type(event) is event_class for event in received)
@@ -0,0 +1,158 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import copy
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from cloudevents_pydantic.bindings.http import HTTPHandler
+from cloudevents_pydantic.events import CloudEvent, FrozenCloudEvent
+from cloudevents_pydantic.formats import canonical, json
+
+test_attributes = {
+    "type": "com.example.string",
+    "source": "https://example.com/event-producer",
+    "id": "id",
+    "specversion": "1.0",
+    "datacontenttype": "application/json",
+    "data": {"key": "value"},
+}
+
+
+def test_frozen_events_are_immutable():
+    event = FrozenCloudEvent(**test_attributes)
+
+    with pytest.raises(ValidationError):
+        event.id = "other"
+
+
+def test_memoized():
+    event = FrozenCloudEvent(**test_attributes)
+    built = []
+
+    def build():
+        built.append(1)
+        return len(built)
+
+    assert event.memoized("key", build) == 1
+    assert event.memoized("key", build) == 1
+    assert event.memoized("other", build) == 2
+
+
+def test_serialized_forms_are_memoized():
+    event = FrozenCloudEvent(**test_attributes)
+    expected = CloudEvent(**test_attributes)
+
+    assert json.serialize_bytes(event) == json.serialize_bytes(expected)
+    assert json.serialize_bytes(event) is json.serialize_bytes(event)
+    assert json.serialize(event) == json.serialize(expected)
+    assert json.serialize(event) is json.serialize(event)
+    serialized = canonical.serialize(event)
+    assert serialized == canonical.serialize(expected)
+    serialized.pop("data")
+    assert canonical.serialize(event) == canonical.serialize(expected)
+
+
+def test_binary_mode_headers_are_memoized():
+    event = FrozenCloudEvent(**test_attributes)
+    expected = HTTPHandler().to_binary(CloudEvent(**test_attributes))
+
+    headers, body = HTTPHandler().to_binary(event)
+    assert (headers, body) == expected
+    headers["other"] = "value"
+    assert HTTPHandler().to_binary(event) == expected
+    assert HTTPHandler().to_binary(event).body is body
+
+    class OtherHandler(HTTPHandler):
+        def _header_encode(self, value: str) -> str:
+            return "encoded"
+
+    assert OtherHandler().to_binary(event).headers["ce-id"] == "encoded"
+    assert HTTPHandler().to_binary(event).headers["ce-id"] == "id"
+
+
+def test_hash():
+    event = FrozenCloudEvent(**test_attributes)
+    same = FrozenCloudEvent(**test_attributes)
+    other = FrozenCloudEvent(**{**test_attributes, "id": "other"})
+
+    assert event == same
+    json.serialize_bytes(event)
+    assert event == same
+    assert hash(event) == hash(same)
+    assert len({event, same, other}) == 2
+    assert {event: 1}[same] == 1
+
+
+def test_hash_is_computed_once():
+    event = FrozenCloudEvent(**test_attributes)
+    assert not hasattr(event, "_hash")
+    assert hash(event) == hash((event.source, event.id))
+    assert event._hash == hash(event)
+
+    # Derived events don't keep the cached hash
+    for derived in (
+        event.evolve(id="other"),
+        event.model_copy(update={"id": "other"}),
+        pickle.loads(pickle.dumps(event)),  # noqa: S301
+    ):
+        assert not hasattr(derived, "_hash")
+    assert hash(event.evolve(id="other")) == hash((event.source, "other"))
+
+
+@pytest.mark.parametrize(
+    ["attributes", "equal_attributes"],
+    [
+        pytest.param(
+            {"data": {"a": 1, "b": 2}},
+            {"data": {"b": 2, "a": 1}},
+            id="data-keys-order",
+        ),
+        pytest.param(
+            {"time": "2024-01-01T10:00:00Z"},
+            {"time": "2024-01-01T12:00:00+02:00"},
+            id="time-timezone",
+        ),
+    ],
+)
+def test_hash_is_consistent_with_equality(attributes, equal_attributes):
+    event = FrozenCloudEvent(**{**test_attributes, **attributes})
+    same = FrozenCloudEvent(**{**test_attributes, **equal_attributes})
+
+    assert json.serialize_bytes(event) != json.serialize_bytes(same)
+    assert event == same
+    assert hash(event) == hash(same)
+    assert len({event, same}) == 1
+
+
+def test_copies_do_not_share_the_memoized_forms():
+    event = FrozenCloudEvent(**test_attributes)
+    json.serialize_bytes(event)
+
+    updated = event.model_copy(update={"id": "other"})
+    assert b'"id":"other"' in json.serialize_bytes(updated)
+    unpickled = pickle.loads(pickle.dumps(event))  # noqa: S301
+    for copied in (copy.copy(event), copy.deepcopy(event), unpickled):
+        assert copied == event
+        assert json.serialize_bytes(copied) == json.serialize_bytes(event)
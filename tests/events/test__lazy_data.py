@@ -0,0 +1,281 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import copy
+import pickle
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import AfterValidator, TypeAdapter, ValidationError
+from pydantic_core import PydanticCustomError
+from typing_extensions import Annotated, TypedDict
+
+from cloudevents_pydantic.events import CloudEvent
+from cloudevents_pydantic.events._lazy_data import (
+    LazyData,
+    LazyDataDescriptor,
+    install_descriptor,
+)
+from cloudevents_pydantic.formats import json
+
+test_attributes = {
+    "type": "com.example.string",
+    "source": "https://example.com/event-producer",
+    "id": "id",
+    "specversion": "1.0",
+}
+
+
+class LazyEvent(CloudEvent):
+    pass
+
+
+install_descriptor(LazyEvent)
+
+
+def lazy_event(load) -> CloudEvent:
+    event = LazyEvent(**test_attributes)
+    event.__dict__["data"] = LazyData(load)
+    return event
+
+
+def test_value_is_loaded_once():
+    load = MagicMock(return_value={"key": "value"})
+    lazy = LazyData(load)
+    assert not lazy.loaded
+    assert repr(lazy) == "LazyData(<not loaded>)"
+
+    assert lazy.value == {"key": "value"}
+    assert lazy.value == {"key": "value"}
+    assert lazy.loaded
+    assert repr(lazy) == "LazyData({'key': 'value'})"
+    load.assert_called_once_with()
+
+
+def test_equality():
+    assert LazyData(lambda: 1) == 1
+    assert LazyData(lambda: 1) == LazyData(lambda: 1)
+    assert LazyData(lambda: 1) != 2
+    with pytest.raises(TypeError):
+        hash(LazyData(lambda: 1))
+
+
+def test_data_is_loaded_on_first_access():
+    load = MagicMock(return_value="value")
+    event = lazy_event(load)
+    load.assert_not_called()
+
+    assert event.data == "value"
+    assert event.data == "value"
+    assert event.__dict__["data"] == "value"
+    load.assert_called_once_with()
+
+
+def test_data_is_loaded_when_serializing():
+    event = lazy_event(lambda: b"value")
+
+    assert event.model_dump()["data"] == b"value"
+    assert (
+        event.model_dump_json()
+        == CloudEvent(**test_attributes, data=b"value").model_dump_json()
+    )
+
+
+def test_events_compare_to_loaded_data():
+    assert lazy_event(lambda: "value") == LazyEvent(**test_attributes, data="value")
+
+
+def test_data_can_be_assigned():
+    event = lazy_event(lambda: "value")
+    event.data = "other"
+
+    assert event.data == "other"
+
+
+def test_descriptor_set():
+    event = lazy_event(lambda: "value")
+    vars(LazyEvent)["data"].__set__(event, "other")
+
+    assert event.data == "other"
+
+
+def test_data_is_not_a_class_attribute():
+    with pytest.raises(AttributeError):
+        LazyEvent.data
+
+    class SomeEvent(LazyEvent):
+        data: str
+
+    assert SomeEvent.model_fields["data"].is_required()
+
+
+def test_missing_data():
+    event = LazyEvent.model_construct()
+    del event.__dict__["data"]
+
+    with pytest.raises(AttributeError):
+        event.data
+
+
+def test_descriptor_is_installed_on_lazy_classes_only():
+    class PlainEvent(CloudEvent):
+        pass
+
+    class SubEvent(LazyEvent):
+        pass
+
+    descriptor = vars(LazyEvent)["data"]
+    assert isinstance(descriptor, LazyDataDescriptor)
+    assert "data" not in vars(PlainEvent)
+    assert isinstance(vars(DeferredEvent)["data"], LazyDataDescriptor)
+    assert "data" not in vars(SubEvent)
+
+    install_descriptor(LazyEvent)
+    assert vars(LazyEvent)["data"] is descriptor
+    assert LazyEvent(**test_attributes, data=1).data == 1
+
+
+def test_lazy_data_is_loaded_when_copied():
+    load = MagicMock(return_value={"key": "value"})
+    event = lazy_event(load)
+
+    unpickled = pickle.loads(pickle.dumps(event))  # noqa: S301
+    assert unpickled.__dict__["data"] == {"key": "value"}
+    assert copy.deepcopy(event).__dict__["data"] == {"key": "value"}
+    load.assert_called_once_with()
+
+
+class OrderData(TypedDict):
+    quantity: int
+
+
+def odd(value: int) -> int:
+    if not value % 2:
+        raise PydanticCustomError("odd", "{value} is not odd", {"value": value})
+    return value
+
+
+class DeferredEvent(CloudEvent, defer_data_validation=True):
+    data: OrderData
+
+
+class OddEvent(CloudEvent, defer_data_validation=True):
+    data: Annotated[int, AfterValidator(odd)]
+
+
+def test_deferred_data_is_validated_on_first_access():
+    event = DeferredEvent(**test_attributes, data={"quantity": "1"})
+    assert isinstance(event.__dict__["data"], LazyData)
+    assert not event.__dict__["data"].loaded
+
+    assert event.data == {"quantity": 1}
+    assert event.__dict__["data"] == {"quantity": 1}
+
+
+def test_deferred_data_validation_errors():
+    event = json.deserialize(
+        json.serialize(CloudEvent(**test_attributes, data={"quantity": "x"})),
+        TypeAdapter(DeferredEvent),
+    )
+    assert event.type == "com.example.string"
+
+    with pytest.raises(ValidationError) as exc_info:
+        event.data
+    assert exc_info.value.title == "DeferredEvent"
+    assert exc_info.value.errors(include_url=False) == [
+        {
+            "type": "int_parsing",
+            "loc": ("data", "quantity"),
+            "msg": "Input should be a valid integer, unable to parse string as an "
+            "integer",
+            "input": "x",
+        }
+    ]
+
+    with pytest.raises(ValidationError) as exc_info:
+        OddEvent(**test_attributes, data=2).data
+    assert exc_info.value.errors(include_url=False) == [
+        {
+            "type": "odd",
+            "loc": ("data",),
+            "msg": "2 is not odd",
+            "input": 2,
+            "ctx": {"value": 2},
+        }
+    ]
+
+
+def test_attributes_are_validated_eagerly():
+    with pytest.raises(ValidationError):
+        DeferredEvent(**{**test_attributes, "id": ""}, data={"quantity": "x"})
+
+
+def test_deferred_data_serialization():
+    event = DeferredEvent(**test_attributes, data={"quantity": "1"})
+    expected = DeferredEvent.model_validate(
+        {**test_attributes, "data": {"quantity": 1}}
+    )
+
+    assert event.model_dump() == expected.model_dump()
+    # Loaded on the first access
+    assert event.data == {"quantity": 1}
+    assert event.model_dump() == expected.model_dump()
+    event = DeferredEvent(**test_attributes, data={"quantity": "1"})
+    assert event.model_dump_json() == expected.model_dump_json()
+    event = DeferredEvent(**test_attributes, data={"quantity": "1"})
+    assert json.serialize_batch(
+        TypeAdapter(List[CloudEvent]).validate_python([event])
+    ) == json.serialize_batch([expected])
+
+
+def test_deferred_data_schema():
+    class Typed(CloudEvent):
+        data: OrderData
+
+    assert (
+        DeferredEvent.model_json_schema()["properties"]["data"]
+        == (Typed.model_json_schema()["properties"]["data"])
+    )
+
+
+def test_deferred_validation_is_inherited():
+    class SubEvent(DeferredEvent):
+        subject: str
+
+    event = SubEvent(**test_attributes, subject="x", data={"quantity": "1"})
+    assert isinstance(event.__dict__["data"], LazyData)
+    assert event.data == {"quantity": 1}
+
+
+def test_deferred_validation_needs_the_data_type():
+    with pytest.raises(TypeError, match="must declare the `data` type"):
+
+        class UntypedEvent(CloudEvent, defer_data_validation=True):
+            subject: str
+
+    class UndeferredEvent(CloudEvent, defer_data_validation=False):
+        data: Dict[str, int]
+
+    assert UndeferredEvent(**test_attributes, data={"a": "1"}).__dict__["data"] == {
+        "a": 1
+    }
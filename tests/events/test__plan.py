@@ -0,0 +1,126 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+from typing import Any, Dict, List, Optional, TypeVar, Union
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+from cloudevents_pydantic.events import CloudEvent
+from cloudevents_pydantic.events._plan import (
+    SPEC_ATTRIBUTES,
+    compile_plan,
+    is_untyped,
+)
+from cloudevents_pydantic.events.fields.types import Binary
+
+T = TypeVar("T")
+
+
+class Payload(BaseModel):
+    value: int
+
+
+def test_cloudevent_plan():
+    plan = CloudEvent.__event_plan__
+
+    assert plan == compile_plan(CloudEvent)
+    assert plan.binary_data is None
+    assert plan.attributes == SPEC_ATTRIBUTES
+    assert plan.header_names == {
+        "source": "ce-source",
+        "id": "ce-id",
+        "type": "ce-type",
+        "specversion": "ce-specversion",
+        "time": "ce-time",
+        "subject": "ce-subject",
+        "dataschema": "ce-dataschema",
+    }
+
+
+def test_subclass_plan():
+    class ExtensionEvent(CloudEvent):
+        model_config = ConfigDict(extra="allow")
+
+        data: Binary
+        comexampleextension: Optional[str] = None
+
+    plan = ExtensionEvent.__event_plan__
+
+    assert plan is not CloudEvent.__event_plan__
+    assert plan.binary_data is True
+    assert plan.attributes == SPEC_ATTRIBUTES | {"comexampleextension"}
+    assert plan.header_names["comexampleextension"] == "ce-comexampleextension"
+
+
+@pytest.mark.parametrize(
+    ["annotation", "expected"],
+    [
+        pytest.param(Any, None, id="any"),
+        pytest.param(object, None, id="object"),
+        pytest.param(Binary, True, id="binary"),
+        pytest.param(bytes, True, id="bytes"),
+        pytest.param(Optional[Binary], None, id="optional-binary"),
+        pytest.param(Union[str, bytes], None, id="union-bytes"),
+        pytest.param("Payload", False, id="forward-ref"),
+        pytest.param("Undefined", None, id="undefined-forward-ref"),
+        pytest.param(str, False, id="str"),
+        pytest.param(Payload, False, id="model"),
+        pytest.param(Optional[Union[str, int]], False, id="union"),
+        pytest.param(Dict[str, bytes], False, id="dict"),
+        pytest.param(List[Any], False, id="list"),
+    ],
+)
+def test_binary_data(annotation, expected):
+    class DataEvent(CloudEvent):
+        data: annotation
+
+    assert DataEvent.__event_plan__.binary_data is expected
+
+
+def test_binary_data_with_default():
+    class DataEvent(CloudEvent):
+        data: bytes = Field(default=b"")
+
+    assert DataEvent.__event_plan__.binary_data is None
+
+
+def test_binary_data_with_type_var():
+    class DataEvent(CloudEvent):
+        data: T  # type: ignore[valid-type]
+
+    assert DataEvent.__event_plan__.binary_data is None
+
+
+@pytest.mark.parametrize(
+    ["annotation", "expected"],
+    [
+        (Any, True),
+        (T, True),
+        (TypeVar("Bound", bound=int), False),
+        (TypeVar("Constrained", int, str), False),
+        (object, False),
+        (Optional[Any], False),
+    ],
+)
+def test_is_untyped(annotation, expected):
+    assert is_untyped(annotation) is expected
@@ -0,0 +1,278 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import datetime
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
+from urllib.parse import ParseResult
+
+import pytest
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    StringConstraints,
+)
+from typing_extensions import TypedDict
+
+from cloudevents_pydantic.events import CloudEvent
+from cloudevents_pydantic.events._trusted import (
+    _coercion,
+    _stored_as_is,
+    _url,
+    trusted_constructor,
+)
+from cloudevents_pydantic.events.fields.types import (
+    Binary,
+    Boolean,
+    Integer,
+    SpecVersion,
+    String,
+)
+
+full_attributes = {
+    "data": {"data-key": "val"},
+    "datacontenttype": "application/json",
+    "dataschema": "http://some-dataschema.url",
+    "id": "id-can-be-anything",
+    "source": "dummy:source",
+    "specversion": "1.0",
+    "subject": "some-subject",
+    "time": "2022-07-16T12:03:20.519216+04:00",
+    "type": "dummy.type",
+}
+mandatory_attributes = {
+    "id": "123",
+    "source": "/source",
+    "specversion": "1.0",
+    "type": "dummy.type",
+}
+
+
+class BinaryEvent(CloudEvent):
+    data: Binary
+
+
+class ExtensionsEvent(CloudEvent):
+    model_config = ConfigDict(extra="allow")
+
+    tags: List[str] = ["a"]  # noqa: RUF012
+    counters: List[int] = Field(default_factory=list)
+    priority: Union[int, str] = 0
+
+
+class Order(BaseModel):
+    number: int
+
+
+class OrderData(TypedDict):
+    name: String
+    quantity: Integer
+
+
+class UnresolvedData(TypedDict):
+    order: "Undefined"  # type: ignore[name-defined] # noqa: F821
+
+
+class TypedEvent(CloudEvent):
+    data: Order
+    urgent: Boolean = False
+    code: Annotated[str, AfterValidator(str.upper)] = "A"
+
+
+class PrivateEvent(CloudEvent):
+    _origin: str = PrivateAttr(default="internal")
+
+
+def test_trusted_event_is_identical_to_validated_event():
+    validated = CloudEvent(**full_attributes)
+    trusted = CloudEvent.from_trusted(**full_attributes)
+
+    assert trusted == validated
+    assert isinstance(trusted.source, ParseResult)
+    assert isinstance(trusted.specversion, SpecVersion)
+    assert trusted.time.utcoffset() == datetime.timedelta(hours=4)
+    assert list(trusted.__dict__) == list(validated.__dict__)
+    assert trusted.model_fields_set == validated.model_fields_set
+    assert trusted.model_dump_json() == validated.model_dump_json()
+
+
+def test_trusted_event_fills_defaults():
+    trusted = CloudEvent.from_trusted(**mandatory_attributes)
+
+    assert trusted == CloudEvent(**mandatory_attributes)
+    assert trusted.model_fields_set == set(mandatory_attributes)
+
+
+def test_trusted_event_keeps_typed_values():
+    source = ParseResult("https", "example.com", "/", "", "", "")
+    time = datetime.datetime.now(datetime.timezone.utc)
+
+    trusted = CloudEvent.from_trusted(
+        **{
+            **mandatory_attributes,
+            "source": source,
+            "specversion": SpecVersion.v1_0,
+            "time": time,
+        }
+    )
+
+    assert trusted.source is source
+    assert trusted.time is time
+    assert trusted.specversion is SpecVersion.v1_0
+
+
+def test_trusted_event_accepts_utc_designator():
+    trusted = CloudEvent.from_trusted(
+        **mandatory_attributes, time="2022-07-16T12:03:20Z"
+    )
+
+    assert trusted.time == datetime.datetime(
+        2022, 7, 16, 12, 3, 20, tzinfo=datetime.timezone.utc
+    )
+
+
+@pytest.mark.parametrize(
+    "time",
+    [
+        "2018-04-05T17:31:00.123456789Z",
+        "2018-04-05T17:31:00.1z",
+        "2018-04-05T17:31:00.12345+01:30",
+        "2018-04-05T17:31:00-08:00",
+    ],
+)
+def test_trusted_event_parses_rfc3339_timestamps(time):
+    trusted = CloudEvent.from_trusted(**mandatory_attributes, time=time)
+    validated = CloudEvent(**mandatory_attributes, time=time)
+
+    assert trusted.time == validated.time
+    assert trusted.time.utcoffset() == validated.time.utcoffset()
+
+
+def test_trusted_event_decodes_base64_binary_data():
+    attributes = {**mandatory_attributes, "data": "dGVzdA=="}
+
+    assert BinaryEvent.from_trusted(**attributes).data == b"test"
+    assert BinaryEvent.from_trusted(**{**attributes, "data": b"raw"}).data == b"raw"
+    assert (
+        BinaryEvent.from_trusted(**attributes).model_dump_json()
+        == BinaryEvent.model_validate_json(
+            BinaryEvent.from_trusted(**attributes).model_dump_json()
+        ).model_dump_json()
+    )
+
+
+def test_trusted_event_fails_on_missing_attributes():
+    with pytest.raises(ValueError, match="Missing mandatory attributes: id, type"):
+        CloudEvent.from_trusted(source="/source", specversion="1.0")
+
+
+def test_trusted_event_fails_on_unknown_attributes():
+    with pytest.raises(ValueError, match="Unknown attributes: other"):
+        CloudEvent.from_trusted(**mandatory_attributes, other="value")
+
+
+def test_trusted_event_stores_extensions():
+    first = ExtensionsEvent.from_trusted(**mandatory_attributes, other="value")
+    second = ExtensionsEvent.from_trusted(**mandatory_attributes)
+
+    assert first.model_extra == {"other": "value"}
+    assert first.other == "value"
+    assert second.model_extra is None
+    assert first == ExtensionsEvent(**mandatory_attributes, other="value")
+    # Mutable defaults are not shared between events
+    assert first.tags == ["a"] and first.tags is not second.tags
+    assert first.counters == [] and first.counters is not second.counters
+
+
+def test_trusted_event_falls_back_to_model_construct():
+    trusted = PrivateEvent.from_trusted(**mandatory_attributes)
+
+    assert trusted._origin == "internal"
+    assert trusted == PrivateEvent(**mandatory_attributes)
+
+
+def test_event_factory_skips_validation():
+    event = CloudEvent.event_factory(type="dummy.type", source="/s", validate=False)
+
+    assert event.source == _url("/s")
+    assert event.specversion is SpecVersion.v1_0
+    assert event.time.tzinfo is datetime.timezone.utc
+    assert event == CloudEvent.model_validate(event.model_dump())
+
+
+def test_trusted_constructor_is_cached():
+    assert trusted_constructor(CloudEvent) is trusted_constructor(CloudEvent)
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [Any, int, Union[int, str], Optional[Union[int, str]], List[int]],
+)
+def test_no_coercion_for_other_types(annotation):
+    assert _coercion(annotation) is None
+
+
+def test_trusted_event_fails_on_unknown_specversion():
+    with pytest.raises(ValueError, match="is not a valid SpecVersion"):
+        CloudEvent.from_trusted(**{**mandatory_attributes, "specversion": "0.3"})
+
+
+def test_trusted_event_validates_converted_fields():
+    attributes = {
+        **mandatory_attributes,
+        "data": {"number": "1"},
+        "urgent": "false",
+        "code": "b",
+    }
+
+    trusted = TypedEvent.from_trusted(**attributes)
+
+    assert trusted == TypedEvent(**attributes)
+    assert trusted.urgent is False
+    assert trusted.code == "B"
+    assert trusted.data == Order(number=1)
+
+
+@pytest.mark.parametrize(
+    ["annotation", "stored_as_is"],
+    [
+        (Any, True),
+        (String, True),
+        (Optional[Integer], True),
+        (Dict[str, List[int]], True),
+        (Literal["a", 1, None], True),
+        (Annotated[str, Field(max_length=3)], True),
+        (OrderData, True),
+        (Boolean, False),
+        (float, False),
+        (Order, False),
+        (List[Order], False),
+        (Literal[True], False),
+        (Annotated[str, StringConstraints(to_lower=True)], False),
+        (Annotated[str, AfterValidator(str.strip)], False),
+        (UnresolvedData, False),
+    ],
+)
+def test_stored_as_is(annotation, stored_as_is):
+    assert _stored_as_is(annotation) is stored_as_is
@@ -0,0 +1,55 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+import pytest
+from ulid import ULID
+
+from cloudevents_pydantic.events._ulid import monotonic_ulids
+
+
+def test_monotonic_ulids():
+    ulids = monotonic_ulids(3000, 1_700_000_000_123)
+
+    assert ulids == sorted(ulids)
+    assert len(set(ulids)) == 3000
+    for value in ulids:
+        assert str(ULID.from_str(value)) == value
+        assert ULID.from_str(value).milliseconds == 1_700_000_000_123
+
+
+def test_monotonic_ulids_default_to_now():
+    before = ULID().milliseconds
+    (value,) = monotonic_ulids(1)
+
+    assert before <= ULID.from_str(value).milliseconds <= ULID().milliseconds
+
+
+@pytest.mark.parametrize("count", [0, 1, 2000])
+def test_monotonic_ulids_do_not_overflow(count, monkeypatch):
+    monkeypatch.setattr("os.urandom", lambda size: b"\xff" * size)
+
+    ulids = monotonic_ulids(count, 0)
+
+    assert len(ulids) == count
+    if count:
+        assert ulids[-1] == "0000000000ZZZZZZZZZZZZZZZZ"
+        assert ulids == sorted(ulids)
@@ -0,0 +1,69 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+from typing import List
+
+import pytest
+from pydantic import SerializeAsAny, TypeAdapter
+
+from cloudevents_pydantic.events import CloudEvent
+from cloudevents_pydantic.formats._adapters import batch_adapter, event_adapter
+
+
+class SomeEvent(CloudEvent):
+    pass
+
+
+def test_event_adapter():
+    adapter = event_adapter(SomeEvent)
+
+    assert adapter.core_schema == TypeAdapter(SomeEvent).core_schema
+    assert event_adapter(SomeEvent) is adapter
+
+
+def test_batch_adapter():
+    adapter = batch_adapter(SomeEvent)
+
+    assert (
+        adapter.core_schema == TypeAdapter(List[SerializeAsAny[SomeEvent]]).core_schema
+    )
+    assert batch_adapter(SomeEvent) is adapter
+
+
+def test_batch_adapter_serializes_subclasses_attributes():
+    class TypedEvent(CloudEvent):
+        data: dict = None
+
+    class ExtendedEvent(TypedEvent):
+        someextension: str = "value"
+
+    event = ExtendedEvent.event_factory(type="t", source="/s", data={"a": 1})
+
+    serialized = batch_adapter(TypedEvent).dump_json([event])
+
+    assert TypeAdapter(List[ExtendedEvent]).validate_json(serialized) == [event]
+
+
+@pytest.mark.parametrize("get_adapter", [event_adapter, batch_adapter])
+def test_adapters_are_built_once_per_class(get_adapter):
+    assert get_adapter(CloudEvent[int]) is get_adapter(CloudEvent[int])
+    assert get_adapter(CloudEvent[int]) is not get_adapter(CloudEvent[str])
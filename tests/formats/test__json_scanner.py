@@ -0,0 +1,190 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from cloudevents_pydantic.formats import _json_scanner
+from cloudevents_pydantic.formats._json_scanner import BatchSplitter, peek_attributes
+
+elements = [
+    b'{"a":"b","c":[1,2,{"d":"]}"}]}',
+    b'"string with \\" and \\\\"',
+    b"[1,[2,[3]]]",
+    b"123.5e3",
+    b"true",
+    b"null",
+    b'{"escaped":"\\\\","nested":{"x":"}"}}',
+]
+batch = b"[ " + b" ,\n".join(elements) + b" ]"
+
+
+def split(chunks):
+    splitter = BatchSplitter()
+    result = []
+    for chunk in chunks:
+        result.extend(splitter.feed(chunk))
+    splitter.close()
+    return result
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, len(batch)])
+def test_splits_elements_regardless_of_chunk_boundaries(chunk_size):
+    chunks = [batch[i : i + chunk_size] for i in range(0, len(batch), chunk_size)]
+    assert split(chunks) == elements
+
+
+def test_accepts_str_chunks():
+    assert split(['[{"a":', '"b"}]']) == [b'{"a":"b"}']
+
+
+@pytest.mark.parametrize("body", [b"[]", b"  [ \n ]  "])
+def test_empty_batch(body):
+    assert split([body]) == []
+
+
+def test_buffer_only_retains_current_element():
+    splitter = BatchSplitter()
+    assert splitter.feed(b'[{"a":"b"},{"c":') == [b'{"a":"b"}']
+    assert splitter._buffer == b'{"c":'
+    assert splitter.feed(b'"d"}]') == [b'{"c":"d"}']
+    assert splitter._buffer == b""
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"a":"b"}',
+        b"[,]",
+        b'[{"a":"b"},]',
+        b'[{"a":"b"} {"c":"d"}]',
+        b'[{"a":"b"}] trailing',
+    ],
+)
+def test_invalid_batch_raises_json_invalid(body):
+    with pytest.raises(ValidationError) as exc_info:
+        split([body])
+    assert exc_info.value.errors()[0]["type"] == "json_invalid"
+
+
+@pytest.mark.parametrize("body", [b"", b"[", b'[{"a":"b"}', b'[{"a":"b\\'])
+def test_incomplete_batch_raises_json_invalid_on_close(body):
+    splitter = BatchSplitter()
+    splitter.feed(body)
+    with pytest.raises(ValidationError) as exc_info:
+        splitter.close()
+    assert exc_info.value.errors()[0]["type"] == "json_invalid"
+
+
+@pytest.fixture(params=[True, False], ids=["scanned", "parsed"])
+def scanned(request, monkeypatch):
+    if request.param:
+        monkeypatch.setattr(_json_scanner, "PEEK_PARSE_SIZE", 0)
+    return request.param
+
+
+long_string = "x" * 300
+names = frozenset(["id", "source", "ext", 'key with "quotes"'])
+
+
+@pytest.mark.parametrize(
+    ["body", "expected"],
+    [
+        (b"{}", {}),
+        (b' { "id" : "1" , "other" : 2 } ', {"id": "1"}),
+        (
+            b'{"other":"a","ext":true,"id":"1","source":"s"}',
+            {"ext": "true", "id": "1", "source": "s"},
+        ),
+        (b'{"ext":12,"id":null}', {"ext": "12"}),
+        (b'{"ext":1.5e3}', {"ext": "1500.0"}),
+        (b'{"id":"\\u00e8\\"","source":"\\\\"}', {"id": '\u00e8"', "source": "\\"}),
+        (b'{"data":"\\"}{\\\\","id":"1"}', {"id": "1"}),
+        (b'{"data":"' + long_string.encode() + b'","id":"1"}', {"id": "1"}),
+        (b'{"id":"' + long_string.encode() + b'"}', {"id": long_string}),
+        (
+            b'{"key with \\"quotes\\"":"q","ext":false}',
+            {"ext": "false", 'key with "quotes"': "q"},
+        ),
+        (b'{"data":{"id":"2"},"id":"1"}', {"id": "1"}),
+        (b'{"id":["1"]}', {}),
+        (b"[]", []),
+        (
+            b' [ {"id":"1"} , {} ,{"id":"2","data":"' + long_string.encode() + b'"}] ',
+            [{"id": "1"}, {}, {"id": "2"}],
+        ),
+    ],
+)
+def test_peek_attributes(scanned, body, expected):
+    assert peek_attributes(body, names) == expected
+    assert peek_attributes(bytearray(body), names) == expected
+
+
+def test_peek_attributes_stops_when_all_are_found(monkeypatch):
+    monkeypatch.setattr(_json_scanner, "PEEK_PARSE_SIZE", 0)
+    # The rest of the JSON is not scanned
+    body = b'{"id":"1","source":"s","ext":1,"key with \\"quotes\\"":"q",'
+    assert peek_attributes(body, names) == {
+        "id": "1",
+        "source": "s",
+        "ext": "1",
+        'key with "quotes"': "q",
+    }
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"1",
+        b"[1]",
+        b'[{"id":"1"} {}]',
+        b"{id:1}",
+        b'{"id" 1}',
+        b'{"id":}',
+        b'{"id":"1"',
+        b'{"id":"1" "x":1}',
+        b'{"id":"1',
+        b'{"id":"' + long_string.encode(),
+        b'{"' + long_string.encode(),
+    ],
+)
+def test_peek_attributes_raises_on_malformed_json(scanned, body):
+    with pytest.raises(ValueError):
+        peek_attributes(body, names)
+
+
+def test_scalar_at_the_end_of_the_json(monkeypatch):
+    monkeypatch.setattr(_json_scanner, "PEEK_PARSE_SIZE", 0)
+    with pytest.raises(ValidationError):
+        peek_attributes(b'{"id":' + b"1" * 300, names)
+
+
+def test_peek_attributes_parses_batches_of_small_events(monkeypatch):
+    monkeypatch.setattr(_json_scanner, "PEEK_PARSE_SIZE", 20)
+    scan = MagicMock(wraps=_json_scanner._scan_object)
+    monkeypatch.setattr(_json_scanner, "_scan_object", scan)
+
+    body = b'[{"id":"1"},{"id":"' + long_string.encode() + b'"}]'
+    assert peek_attributes(body, names) == [{"id": "1"}, {"id": long_string}]
+    scan.assert_called_once()
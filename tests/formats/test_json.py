@@ -20,23 +20,46 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
 #  DEALINGS IN THE SOFTWARE.                                                   =
 # ==============================================================================
+import asyncio
 import datetime
+import io
 import json
+import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Annotated, Any, Dict, List
 from urllib.parse import ParseResult
 
 import pytest
 from jsonschema import validate
-from pydantic import TypeAdapter
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
+from pydantic_core import PydanticCustomError
 
 from cloudevents_pydantic.events import CloudEvent
-from cloudevents_pydantic.events.fields.types import Binary, SpecVersion
+from cloudevents_pydantic.events.fields.types import Binary, Boolean, SpecVersion
+from cloudevents_pydantic.formats import json as json_format
 from cloudevents_pydantic.formats.json import (
+    EventView,
     deserialize,
     deserialize_batch,
+    deserialize_batch_async_stream,
+    deserialize_batch_parallel,
+    deserialize_batch_stream,
+    deserialize_batch_with_policy,
+    deserialize_with_policy,
+    peek_attributes,
     serialize,
     serialize_batch,
+    serialize_batch_bytes,
+    serialize_batch_stream,
+    serialize_bytes,
+    view,
+)
+from cloudevents_pydantic.formats.policy import (
+    ValidationCounters,
+    ValidationMode,
+    ValidationPolicy,
 )
 
 minimal_attributes = {
@@ -272,3 +295,503 @@ def test_from_json_base64_with_binary_type(
         event = deserialize(json_string, TypeAdapter(BinaryDataEvent))
     assert event.data == expected_value
     assert isinstance(event, BinaryDataEvent)
+
+
+def _chunked(data: bytes, size: int) -> List[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+big_json_batch = "[" + ",".join([valid_json] * 10) + "]"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(big_json_batch, id="str"),
+        pytest.param(big_json_batch.encode(), id="bytes"),
+        pytest.param(_chunked(big_json_batch.encode(), 7), id="chunks"),
+        pytest.param(iter(_chunked(big_json_batch.encode(), 7)), id="generator"),
+        pytest.param(io.BytesIO(big_json_batch.encode()), id="file"),
+    ],
+)
+def test_deserialize_batch_stream(data):
+    events = deserialize_batch_stream(data)
+    assert not isinstance(events, list)
+    assert list(events) == deserialize_batch(big_json_batch)
+
+
+def test_deserialize_batch_stream_yields_events_before_the_end_of_input():
+    chunks = iter([b"[" + valid_json.encode() + b",", b"not json"])
+    events = deserialize_batch_stream(chunks)
+
+    assert next(events) == deserialize(valid_json)
+    with pytest.raises(ValidationError):
+        next(events)
+
+
+def test_deserialize_batch_stream_uses_event_adapter():
+    class BinaryDataEvent(CloudEvent):
+        data: Binary
+
+    json_string = '[{"data_base64":"dGVzdA==","source":"https://example.com/event-producer","id":"b96267e2-87be-4f7a-b87c-82f64360d954","type":"com.example.string","specversion":"1.0"}]'
+    events = list(deserialize_batch_stream(json_string, TypeAdapter(BinaryDataEvent)))
+
+    assert isinstance(events[0], BinaryDataEvent)
+    assert events[0].data == b"test"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param("[" + valid_json, id="incomplete"),
+        pytest.param('[{"source":"invalid"}]', id="invalid-event"),
+    ],
+)
+def test_deserialize_batch_stream_fails_on_invalid_input(data):
+    with pytest.raises(ValidationError):
+        list(deserialize_batch_stream(data))
+
+
+def test_deserialize_batch_async_stream():
+    async def stream():
+        for chunk in _chunked(big_json_batch.encode(), 7):
+            yield chunk
+
+    async def collect():
+        return [event async for event in deserialize_batch_async_stream(stream())]
+
+    assert asyncio.run(collect()) == deserialize_batch(big_json_batch)
+
+
+def test_deserialize_batch_async_stream_fails_on_incomplete_input():
+    async def stream():
+        yield "[" + valid_json
+
+    async def collect():
+        return [event async for event in deserialize_batch_async_stream(stream())]
+
+    with pytest.raises(ValidationError):
+        asyncio.run(collect())
+
+
+@pytest.mark.parametrize("size", [0, 1, 3])
+def test_serialize_batch_stream(size):
+    events = [CloudEvent.event_factory(**test_attributes) for _ in range(size)]
+
+    chunks = list(serialize_batch_stream(iter(events)))
+    assert len(chunks) == max(size, 1) + (size > 0)
+    assert b"".join(chunks).decode() == serialize_batch(events)
+
+
+def test_serialize_batch_stream_consumes_events_lazily():
+    consumed = []
+
+    def events():
+        for _ in range(3):
+            event = CloudEvent.event_factory(**test_attributes)
+            consumed.append(event)
+            yield event
+
+    chunks = serialize_batch_stream(events())
+    assert next(chunks) == b"[" + serialize(consumed[0]).encode()
+    assert len(consumed) == 1
+    assert next(chunks) == b"," + serialize(consumed[1]).encode()
+    assert len(consumed) == 2
+
+
+def test_serialize_bytes():
+    event = CloudEvent.event_factory(**test_attributes)
+    json_repr = serialize_bytes(event)
+    assert isinstance(json_repr, bytes)
+    assert json_repr == valid_json.encode()
+
+
+def test_serialize_batch_bytes():
+    event = CloudEvent.event_factory(**test_attributes)
+    json_repr = serialize_batch_bytes([event])
+    assert isinstance(json_repr, bytes)
+    assert json_repr == valid_json_batch.encode()
+
+
+@pytest.mark.parametrize(
+    "input_type",
+    [
+        pytest.param(bytes, id="bytes"),
+        pytest.param(bytearray, id="bytearray"),
+        pytest.param(lambda x: memoryview(x.encode()), id="memoryview"),
+    ],
+)
+def test_deserialize_bytes_like(input_type):
+    def convert(value: str):
+        return value.encode() if input_type in (bytes, bytearray) else value
+
+    data = input_type(convert(valid_json))
+    batch_data = input_type(convert(valid_json_batch))
+
+    assert deserialize(data) == deserialize(valid_json)
+    assert deserialize_batch(batch_data) == deserialize_batch(valid_json_batch)
+
+
+class ParallelEvent(CloudEvent):
+    data: Annotated[int, Field(lt=100)]
+
+    @field_validator("data")
+    @classmethod
+    def _positive(cls, value: int) -> int:
+        if value < 0:
+            raise PydanticCustomError(
+                "negative", "{value} is negative", {"value": value}
+            )
+        return value
+
+
+def _parallel_batch(data: List[Any]) -> bytes:
+    return json.dumps([dict(minimal_attributes, data=item) for item in data]).encode()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 300, 1000, 100000])
+@pytest.mark.parametrize("data_type", [str, bytes, bytearray, memoryview])
+def test_deserialize_batch_parallel(chunk_size, data_type):
+    data = big_json_batch if data_type is str else data_type(big_json_batch.encode())
+    with ThreadPoolExecutor(2) as executor:
+        events = deserialize_batch_parallel(
+            data, executor=executor, chunk_size=chunk_size
+        )
+
+    assert events == deserialize_batch(big_json_batch)
+
+
+@pytest.mark.parametrize(
+    ["data", "chunk_size", "expected"],
+    [
+        (b' [{"a":1}, {"b":2} ,{"c":3}]\n', 1, [b'{"a":1}', b'{"b":2}', b'{"c":3}']),
+        (b'[{"a":1},{"b":2},{"c":3}]', 9, [b'{"a":1},{"b":2}', b'{"c":3}']),
+        (b'[{"a":1},{"b":2},{"c":3}]', 100, [b'{"a":1},{"b":2},{"c":3}']),
+        (b"[]", 1, [b""]),
+        (b'x[{"a":1},{"b":2}]', 1, []),
+        (b'[{"a":1},{"b":2}]x', 1, []),
+        (b'{"a":1}', 1, []),
+    ],
+)
+def test_split_ranges(data, chunk_size, expected):
+    assert json_format._split_ranges(data, chunk_size) == expected
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pytest.param(["},{", "} , {"], id="strings"),
+        pytest.param([[{"a": 1}, {"b": 2}], {"c": {"d": 3}}], id="nested"),
+    ],
+)
+def test_deserialize_batch_parallel_with_separators_in_values(values):
+    data = json.dumps([dict(minimal_attributes, data=value) for value in values])
+    with ThreadPoolExecutor(2) as executor:
+        events = deserialize_batch_parallel(data, executor=executor, chunk_size=1)
+
+    assert [event.data for event in events] == values
+
+
+def test_deserialize_batch_parallel_empty_batch():
+    assert deserialize_batch_parallel(b"[]") == []
+
+
+def test_deserialize_batch_parallel_uses_event_class():
+    data = _parallel_batch(list(range(10)))
+    with ThreadPoolExecutor(2) as executor:
+        events = deserialize_batch_parallel(
+            data, ParallelEvent, executor=executor, chunk_size=3
+        )
+
+    assert [event.data for event in events] == list(range(10))
+    assert all(isinstance(event, ParallelEvent) for event in events)
+
+
+@pytest.mark.parametrize("gil_enabled", [True, False])
+def test_deserialize_batch_parallel_default_executor(monkeypatch, gil_enabled):
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: gil_enabled, raising=False)
+    json_format._default_executor.cache_clear()
+    try:
+        events = deserialize_batch_parallel(big_json_batch, chunk_size=5)
+        executor = json_format._default_executor()
+    finally:
+        json_format._default_executor.cache_clear()
+
+    assert events == deserialize_batch(big_json_batch)
+    if gil_enabled:
+        # Validated serially
+        assert executor is None
+    else:
+        # Created once, and shared by the following calls
+        assert isinstance(executor, ThreadPoolExecutor)
+        executor.shutdown()
+
+
+def test_deserialize_batch_parallel_reports_errors_for_the_whole_batch():
+    data = _parallel_batch([0, 1, -2, 3, 4, "invalid", 6, -7, 1000])
+    with pytest.raises(ValidationError) as expected:
+        deserialize_batch(data, TypeAdapter(List[ParallelEvent]))
+
+    with ThreadPoolExecutor(2) as executor, pytest.raises(ValidationError) as e:
+        deserialize_batch_parallel(data, ParallelEvent, executor=executor, chunk_size=3)
+
+    assert e.value.title == expected.value.title
+    assert e.value.errors() == expected.value.errors()
+    assert [error["loc"][0] for error in e.value.errors()] == [2, 5, 7, 8]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "[" + valid_json,
+        valid_json + "]",
+        "x" + big_json_batch,
+        big_json_batch + "x",
+        big_json_batch[:-1] + ",]",
+    ],
+)
+def test_deserialize_batch_parallel_fails_on_invalid_json(data):
+    with ThreadPoolExecutor(2) as executor, pytest.raises(ValidationError):
+        deserialize_batch_parallel(data, executor=executor, chunk_size=1)
+
+
+@pytest.mark.parametrize(
+    ["policy", "counters"],
+    [
+        (ValidationPolicy(), ValidationCounters(1, 0, 0)),
+        (ValidationPolicy(ValidationMode.TRUSTED), ValidationCounters(0, 0, 1)),
+    ],
+)
+def test_deserialize_with_policy(policy, counters):
+    event = deserialize_with_policy(valid_json, policy)
+
+    assert event == deserialize(valid_json)
+    assert policy.counters == counters
+
+
+def test_deserialize_with_policy_decodes_base64_data():
+    data = serialize(CloudEvent.event_factory(data=b"test", **minimal_attributes))
+
+    event = deserialize_with_policy(data, ValidationPolicy(ValidationMode.TRUSTED))
+
+    assert event == deserialize(data)
+    assert event.data == b"test"
+
+
+@pytest.mark.parametrize(
+    ["mode", "data"],
+    [
+        (ValidationMode.FULL, b'{"source": "/source"}'),
+        (ValidationMode.FULL, valid_json[:-1]),
+        # Invalid JSON is always validated
+        (ValidationMode.TRUSTED, valid_json[:-1]),
+    ],
+)
+def test_deserialize_with_policy_counts_failures(mode, data):
+    policy = ValidationPolicy(mode)
+    with pytest.raises(ValidationError):
+        deserialize_with_policy(data, policy)
+
+    assert policy.counters == ValidationCounters(1, 1, 0)
+
+
+def test_deserialize_with_policy_fails_on_invalid_trusted_events():
+    policy = ValidationPolicy(ValidationMode.TRUSTED)
+    with pytest.raises(ValueError, match="JSON objects"):
+        deserialize_with_policy(b"[]", policy)
+    with pytest.raises(ValueError, match="Missing mandatory attributes"):
+        deserialize_with_policy(b'{"source": "/source"}', policy)
+
+
+def test_deserialize_with_policy_always_validates_unions():
+    policy = ValidationPolicy(ValidationMode.TRUSTED)
+    event_class = Annotated[ParallelEvent, Field(discriminator=None)]
+
+    event = deserialize_with_policy(
+        json.dumps(dict(minimal_attributes, data=1)), policy, event_class
+    )
+
+    assert isinstance(event, ParallelEvent)
+    assert policy.counters == ValidationCounters(1, 0, 0)
+
+
+@pytest.mark.parametrize(
+    ["policy", "counters"],
+    [
+        (ValidationPolicy(), ValidationCounters(10, 0, 0)),
+        (ValidationPolicy(ValidationMode.TRUSTED), ValidationCounters(0, 0, 10)),
+        (
+            ValidationPolicy(ValidationMode.SAMPLED, sample_every=3),
+            ValidationCounters(4, 0, 6),
+        ),
+    ],
+)
+def test_deserialize_batch_with_policy(policy, counters):
+    events = deserialize_batch_with_policy(memoryview(big_json_batch.encode()), policy)
+
+    assert events == deserialize_batch(big_json_batch)
+    assert policy.counters == counters
+
+
+def test_deserialize_batch_with_policy_builds_event_class():
+    policy = ValidationPolicy(ValidationMode.SAMPLED, sample_every=2)
+
+    events = deserialize_batch_with_policy(
+        _parallel_batch(list(range(4))), policy, ParallelEvent
+    )
+
+    assert [event.data for event in events] == list(range(4))
+    assert all(isinstance(event, ParallelEvent) for event in events)
+
+
+def test_deserialize_batch_with_policy_reports_errors_for_the_whole_batch():
+    data = _parallel_batch([-1, 0, "invalid", 1, 2, -7])
+    policy = ValidationPolicy(ValidationMode.SAMPLED, sample_every=2)
+
+    with pytest.raises(ValidationError) as e:
+        deserialize_batch_with_policy(data, policy, ParallelEvent)
+
+    # Only the even positions are validated
+    assert [error["loc"][0] for error in e.value.errors()] == [0, 2]
+    assert e.value.errors()[0]["type"] == "negative"
+    assert policy.counters == ValidationCounters(3, 2, 0)
+
+
+def test_deserialize_batch_with_policy_counts_all_validated_events():
+    policy = ValidationPolicy()
+
+    with pytest.raises(ValidationError):
+        deserialize_batch_with_policy(
+            _parallel_batch([1, -1, 2]), policy, ParallelEvent
+        )
+
+    assert policy.counters == ValidationCounters(3, 1, 0)
+
+
+class Order(BaseModel):
+    number: int
+
+
+class TypedEvent(CloudEvent):
+    data: Order
+    urgent: Boolean = False
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [
+        ValidationPolicy(ValidationMode.TRUSTED),
+        ValidationPolicy(ValidationMode.SAMPLED, sample_percent=0),
+    ],
+)
+def test_deserialize_with_policy_builds_the_validated_types(policy):
+    data = json.dumps(dict(minimal_attributes, data={"number": 1}, urgent="false"))
+
+    event = deserialize_with_policy(data, policy, TypedEvent)
+    events = deserialize_batch_with_policy(f"[{data}]", policy, TypedEvent)
+
+    assert policy.counters == ValidationCounters(0, 0, 2)
+    for trusted in [event, *events]:
+        assert trusted == TypedEvent.model_validate_json(data)
+        assert trusted.urgent is False
+        assert isinstance(trusted.data, Order)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert trusted.model_dump_json() == serialize(
+                TypedEvent.model_validate_json(data)
+            )
+
+
+@pytest.mark.parametrize("data", [valid_json, valid_json_batch[:-1]])
+def test_deserialize_batch_with_policy_validates_invalid_batches(data):
+    policy = ValidationPolicy(ValidationMode.TRUSTED)
+
+    with pytest.raises(ValidationError):
+        deserialize_batch_with_policy(data, policy)
+
+    assert policy.counters == ValidationCounters(1, 1, 0)
+
+
+@pytest.mark.parametrize("input_type", [str, bytes, bytearray, memoryview])
+def test_view(input_type):
+    raw = input_type(valid_json if input_type is str else valid_json.encode())
+
+    event_view = view(raw)
+
+    assert event_view.type == "com.example.string"
+    assert event_view.source == "https://example.com/event-producer"
+    assert event_view.time == "2022-07-16T12:03:20.519216+04:00"
+    assert event_view.subject is None
+    assert event_view.extension is None
+    assert event_view.get("subject", "default") == "default"
+    assert event_view.to_json() is raw
+    assert repr(event_view) == f"EventView(raw={raw!r})"
+
+
+def test_view_reads_extensions_and_data():
+    raw = json.dumps({**minimal_attributes, "raw": "ext", "data": {"key": [1]}})
+
+    event_view = view(raw)
+
+    assert event_view.get("raw") == "ext"
+    assert event_view.raw == raw
+    assert event_view.data == {"key": [1]}
+
+
+def test_view_materializes_the_event_once():
+    raw = json.dumps(dict(minimal_attributes, data=1))
+    event_view = view(raw, ParallelEvent)
+
+    event = event_view.materialize()
+
+    assert event == deserialize(raw, TypeAdapter(ParallelEvent))
+    assert isinstance(event, ParallelEvent)
+    assert event_view.materialize() is event
+
+
+def test_view_does_not_validate():
+    event_view = view(json.dumps(dict(minimal_attributes, data=-1)), ParallelEvent)
+
+    assert event_view.data == -1
+    with pytest.raises(ValidationError):
+        event_view.materialize()
+
+
+def test_view_is_read_only():
+    event_view = EventView(valid_json)
+
+    with pytest.raises(AttributeError, match="read-only"):
+        event_view.type = "other"
+    with pytest.raises(AttributeError):
+        event_view._private
+
+
+@pytest.mark.parametrize("raw", ["[]", "1", valid_json[:-1]])
+def test_view_fails_on_invalid_json(raw):
+    with pytest.raises(ValueError):
+        view(raw).type
+
+
+@pytest.mark.parametrize("input_type", [str, bytes, bytearray, memoryview])
+def test_peek_attributes(input_type):
+    raw = json.dumps({**minimal_attributes, "data_base64": "AAAA" * 5000, "seq": 1})
+    raw = input_type(raw if input_type is str else raw.encode())
+
+    assert peek_attributes(raw) == {
+        "id": "b96267e2-87be-4f7a-b87c-82f64360d954",
+        "source": "https://example.com/event-producer",
+        "type": "com.example.string",
+    }
+
+
+def test_peek_attributes_of_a_batch():
+    events = [
+        CloudEvent(**minimal_attributes, data={"key": "value"}, subject=str(i))
+        for i in range(3)
+    ]
+
+    assert peek_attributes(serialize_batch(events), ["subject", "time"]) == [
+        {"subject": "0"},
+        {"subject": "1"},
+        {"subject": "2"},
+    ]
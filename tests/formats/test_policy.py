@@ -0,0 +1,108 @@
+# ==============================================================================
+#  Copyright (c) 2026 Federico Busetti                                         =
+#  <729029+febus982@users.noreply.github.com>                                  =
+#                                                                              =
+#  Permission is hereby granted, free of charge, to any person obtaining a     =
+#  copy of this software and associated documentation files (the "Software"),  =
+#  to deal in the Software without restriction, including without limitation   =
+#  the rights to use, copy, modify, merge, publish, distribute, sublicense,    =
+#  and/or sell copies of the Software, and to permit persons to whom the       =
+#  Software is furnished to do so, subject to the following conditions:        =
+#                                                                              =
+#  The above copyright notice and this permission notice shall be included in  =
+#  all copies or substantial portions of the Software.                         =
+#                                                                              =
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  =
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    =
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL     =
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER  =
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     =
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         =
+#  DEALINGS IN THE SOFTWARE.                                                   =
+# ==============================================================================
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cloudevents_pydantic.formats.policy import (
+    ValidationCounters,
+    ValidationMode,
+    ValidationPolicy,
+)
+
+
+def test_full_validation():
+    policy = ValidationPolicy()
+
+    assert policy.mode is ValidationMode.FULL
+    assert all(policy.should_validate({"id": str(i)}) for i in range(10))
+
+
+def test_trusted_validation():
+    policy = ValidationPolicy("trusted")
+
+    assert policy.mode is ValidationMode.TRUSTED
+    assert not any(policy.should_validate({"id": str(i)}) for i in range(10))
+
+
+@pytest.mark.parametrize("every", [1, 2, 5])
+def test_sampled_validation_every(every):
+    policy = ValidationPolicy(ValidationMode.SAMPLED, sample_every=every)
+
+    decisions = [policy.should_validate({}) for _ in range(10)]
+
+    assert decisions == [i % every == 0 for i in range(10)]
+
+
+def test_sampled_validation_every_is_thread_safe():
+    policy = ValidationPolicy(ValidationMode.SAMPLED, sample_every=10)
+
+    with ThreadPoolExecutor(4) as executor:
+        decisions = list(executor.map(policy.should_validate, [{}] * 10_000))
+
+    assert sum(decisions) == 1_000
+
+
+@pytest.mark.parametrize("percent", [0, 10, 50, 100])
+def test_sampled_validation_by_id(percent):
+    policy = ValidationPolicy(ValidationMode.SAMPLED, sample_percent=percent)
+    ids = [f"event-{i}" for i in range(10_000)]
+
+    decisions = [policy.should_validate({"id": id}) for id in ids]
+
+    assert sum(decisions) == pytest.approx(percent * 100, abs=200)
+    # The same events are always selected
+    assert decisions == [policy.should_validate({"id": id}) for id in ids]
+
+
+@pytest.mark.parametrize("values", [None, [], {}, {"id": 1}])
+def test_sampled_validation_by_id_validates_invalid_events(values):
+    policy = ValidationPolicy(ValidationMode.SAMPLED, sample_percent=0)
+
+    assert policy.should_validate(values)
+
+
+@pytest.mark.parametrize(
+    ["mode", "kwargs"],
+    [
+        (ValidationMode.SAMPLED, {}),
+        (ValidationMode.SAMPLED, {"sample_every": 2, "sample_percent": 10}),
+        (ValidationMode.SAMPLED, {"sample_every": 0}),
+        (ValidationMode.SAMPLED, {"sample_percent": 101}),
+        (ValidationMode.FULL, {"sample_every": 2}),
+        (ValidationMode.TRUSTED, {"sample_percent": 10}),
+    ],
+)
+def test_invalid_sampling(mode, kwargs):
+    with pytest.raises(ValueError):
+        ValidationPolicy(mode, **kwargs)
+
+
+def test_counters():
+    policy = ValidationPolicy()
+    policy.record(validated=3, failed=1)
+    policy.record(trusted=2)
+
+    assert policy.counters == ValidationCounters(validated=3, failed=1, trusted=2)
+    assert policy.reset_counters() == ValidationCounters(3, 1, 2)
+    assert policy.counters == ValidationCounters(0, 0, 0)